@@ -0,0 +1,41 @@
+"""
+Benchmark : score vectorisé de N plateaux 5x5 (NumPy requis).
+
+Usage :
+    python benchmarks/bench_batch.py [nb_plateaux]
+"""
+import os
+import sys
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+import numpy as np  # noqa: E402
+
+from src.logic.batch import LotPlateaux, classement, scorer  # noqa: E402
+
+
+def main():
+    nb = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = np.random.default_rng(2026)
+    poids = rng.integers(1, 4, size=(nb, 25), dtype=np.uint8)
+    valides = rng.random((nb, 25)) < 0.6
+
+    debut = time.perf_counter()
+    progression, rang, lignes = scorer(poids, valides, 5)
+    t_score = time.perf_counter() - debut
+
+    lot = LotPlateaux([f"plateau-{i}" for i in range(nb)], poids, valides, 5)
+    debut = time.perf_counter()
+    top = classement({5: lot}, limite=10)
+    t_classement = time.perf_counter() - debut
+
+    print(f"{nb} plateaux 5x5")
+    print(f"  score vectorisé : {t_score * 1000:8.1f} ms")
+    print(f"  classement      : {t_classement * 1000:8.1f} ms")
+    print(f"  n°1 : {top[0]}")
+
+
+if __name__ == "__main__":
+    main()
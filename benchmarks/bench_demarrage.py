@@ -0,0 +1,103 @@
+"""
+Benchmark : temps jusqu'au premier affichage (source ou exécutable PyInstaller).
+
+Lance l'application N fois dans un dossier temporaire contenant un
+bingo_config.json (cas de l'utilisateur qui revient : GridScreen directement),
+avec BINGOAL_QUITTER_APRES_RENDU=1 pour qu'elle se ferme seule. Le temps est
+mesuré depuis le lancement du processus (chargeur PyInstaller compris) grâce
+à l'heure murale enregistrée par src/logic/chrono.py.
+
+Nécessite un affichage (DISPLAY, ou `xvfb-run`).
+
+Usage :
+    python benchmarks/bench_demarrage.py [--repetitions 10]
+    python benchmarks/bench_demarrage.py --exe dist/Bingoal_2026     # après `pyinstaller Bingoal_2026.spec`
+    python benchmarks/bench_demarrage.py --importtime                # + imports les plus coûteux (source)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from src.logic.journal import ecrire_json_atomique  # noqa: E402
+from src.logic.moteur import creer_configuration  # noqa: E402
+
+
+def preparer_dossier(dossier, nb_objectifs):
+    objectifs = [{"titre": f"Objectif {i + 1}", "poids": i % 3 + 1} for i in range(nb_objectifs)]
+    recompenses = {"bronze": "Bronze", "argent": "Argent", "or": "Or", "platine": "Platine"}
+    ecrire_json_atomique(os.path.join(dossier, "data", "bingo_config.json"), creer_configuration(objectifs, recompenses))
+
+
+def lancer(commande, dossier, importtime=False):
+    """Un démarrage complet ; renvoie (ms jusqu'au 1er rendu, ms jusqu'à la grille, rapport, stderr)."""
+    fichier = os.path.join(dossier, "chrono.json")
+    if os.path.exists(fichier):
+        os.remove(fichier)
+    env = dict(os.environ, BINGOAL_CHRONO_FICHIER=fichier, BINGOAL_QUITTER_APRES_RENDU="1")
+    if importtime:
+        env["PYTHONPROFILEIMPORTTIME"] = "1"
+
+    lancement = time.time()
+    processus = subprocess.run(commande, cwd=dossier, env=env, capture_output=True, text=True, timeout=120)
+    if not os.path.exists(fichier):
+        raise RuntimeError(f"Pas de rapport de démarrage (code {processus.returncode}) :\n{processus.stderr}")
+    with open(fichier, encoding="utf-8") as f:
+        rapport = json.load(f)
+
+    # Décalage entre le lancement du processus et le début du script (interpréteur, chargeur)
+    amorce = (rapport["debut_epoch"] - lancement) * 1000
+    jalons = rapport["jalons"]
+    return amorce + jalons["premier_rendu"], amorce + jalons["ecran_affiche"], rapport, processus.stderr
+
+
+def imports_couteux(stderr, limite=15):
+    """Lignes de -X importtime triées par temps cumulé."""
+    lignes = []
+    for ligne in stderr.splitlines():
+        if ligne.startswith("import time:") and "|" in ligne:
+            _, cumule, module = (x.strip() for x in ligne[len("import time:"):].split("|"))
+            if cumule.isdigit():
+                lignes.append((int(cumule), module))
+    return sorted(lignes, reverse=True)[:limite]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exe", help="Exécutable gelé (sinon : python main.py)")
+    parser.add_argument("--repetitions", type=int, default=10)
+    parser.add_argument("--objectifs", type=int, default=25, help="Taille du plateau (25 = 5x5)")
+    parser.add_argument("--importtime", action="store_true", help="Affiche les imports les plus coûteux")
+    args = parser.parse_args()
+
+    commande = [os.path.abspath(args.exe)] if args.exe else [sys.executable, os.path.join(RACINE, "main.py")]
+    premiers, grilles = [], []
+    with tempfile.TemporaryDirectory() as dossier:
+        preparer_dossier(dossier, args.objectifs)
+        lancer(commande, dossier)  # Échauffement (cache disque, .pyc)
+        for _ in range(args.repetitions):
+            premier, grille, rapport, stderr = lancer(commande, dossier, importtime=args.importtime and not args.exe)
+            premiers.append(premier)
+            grilles.append(grille)
+
+    print(f"{'Exécutable ' + args.exe if args.exe else 'Source'} — {args.repetitions} démarrages, {args.objectifs} objectifs")
+    print(f"  premier rendu   : médiane {statistics.median(premiers):7.1f} ms  (min {min(premiers):.1f})")
+    print(f"  grille affichée : médiane {statistics.median(grilles):7.1f} ms  (min {min(grilles):.1f})")
+    print("  Étapes (dernier démarrage) :")
+    for etape in rapport["etapes"]:
+        print(f"    {etape['duree_ms']:8.1f} ms  {etape['nom']}")
+    if args.importtime and not args.exe:
+        print("  Imports les plus coûteux (cumulé) :")
+        for cumule, module in imports_couteux(stderr):
+            print(f"    {cumule / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
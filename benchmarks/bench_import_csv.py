@@ -0,0 +1,133 @@
+"""
+Benchmark : import CSV pandas (ancienne version) vs lecteur en flux stdlib.
+
+Usage :
+    python benchmarks/bench_import_csv.py [nb_lignes_parasites]
+
+Génère un export type Google Sheets (grille + paliers + N lignes vides),
+puis mesure le temps d'import de pandas et le temps de parsing des deux
+chemins. pandas est optionnel : s'il est absent, seul le chemin stdlib
+est mesuré.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from src.logic.data_manager import extraire_donnees_csv  # noqa: E402
+
+
+def generer_csv(chemin, nb_lignes_parasites):
+    """Grille 5x5, paliers, puis des milliers de lignes vides de fin d'export."""
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write("IGNORE,B,I,N,G,O,IGNORE,IGNORE,IGNORE,IGNORE,IGNORE,RECOMPENSES\n")
+        for r in range(5):
+            cases = ",".join(f"Objectif {r * 5 + c + 1}" for c in range(5))
+            f.write(f"IGNORE,{cases},,,,,,\n")
+        f.write("IGNORE,,,,,,,,,,,\n")
+        f.write("IGNORE,🥉 Niveau BRONZE : Une sucette,,,,,,,,,,\n")
+        f.write("IGNORE,🥈 Niveau ARGENT : Un Kebab,,,,,,,,,,\n")
+        f.write("IGNORE,🥇 Niveau OR : Une Carte Graphique,,,,,,,,,,\n")
+        f.write("IGNORE,💎 Niveau PLATINE : Un voyage,,,,,,,,,,\n")
+        ligne_vide = ",,,,,,,,,,,\n"
+        for _ in range(nb_lignes_parasites):
+            f.write(ligne_vide)
+
+
+def nettoyer_texte_recompense_ancien(texte):
+    """Ancien nettoyage : ~30 passes de str.replace par cellule."""
+    parasites = [
+        "Niveau", "BRONZE", "ARGENT", "OR", "PLATINE",
+        "🥉", "🥈", "🥇", "💎", ":", "(", ")",
+        "%", "Etoiles", "de", "la", "grille"
+    ]
+    for p in parasites:
+        texte = texte.replace(p, "")
+        texte = texte.replace(p.lower(), "")
+    return texte.strip()
+
+
+def extraire_donnees_csv_pandas(chemin_fichier):
+    """Copie de l'ancienne implémentation pandas (référence du benchmark)."""
+    import pandas as pd
+
+    df = pd.read_csv(chemin_fichier, header=None)
+    objectifs_raw = df.iloc[1:6, 1:6].values.flatten()
+    liste_objectifs = []
+    for obj in objectifs_raw:
+        titre = str(obj) if pd.notna(obj) else ""
+        titre = titre.replace("\n", " ").strip()
+        if not titre or titre.lower() == "nan":
+            titre = "Objectif Libre"
+        liste_objectifs.append({"titre": titre, "poids": 1})
+
+    recompenses = {"bronze": "", "argent": "", "or": "", "platine": ""}
+    for _, row in df.iterrows():
+        ligne_str = " ".join(str(val) for val in row.values if pd.notna(val)).upper()
+        for mot_cle in ("BRONZE", "ARGENT", "OR", "PLATINE"):
+            if mot_cle in ligne_str:
+                if len(row) > 11 and pd.notna(row[11]) and str(row[11]).strip() != "":
+                    recompenses[mot_cle.lower()] = str(row[11]).strip()
+                else:
+                    for cell in row.values:
+                        cell_str = str(cell)
+                        if mot_cle in cell_str.upper():
+                            cadeau = nettoyer_texte_recompense_ancien(cell_str)
+                            if len(cadeau) > 2:
+                                recompenses[mot_cle.lower()] = cadeau
+    return {"objectifs": liste_objectifs, "recompenses": recompenses}
+
+
+def temps_import(module):
+    """Temps d'import à froid d'un module, dans un interpréteur neuf."""
+    code = f"import time; t=time.perf_counter(); import {module}; print(time.perf_counter()-t)"
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=RACINE)
+    if res.returncode != 0:
+        return None
+    return float(res.stdout.strip())
+
+
+def chronometrer(fonction, *args, repetitions=5):
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction(*args)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+def main():
+    nb_lignes = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "export.csv")
+        generer_csv(chemin, nb_lignes)
+
+        print(f"Fichier : {os.path.getsize(chemin) / 1024:.0f} Ko, {nb_lignes} lignes parasites\n")
+        print(f"{'':28}{'import (ms)':>14}{'parse (ms)':>14}")
+
+        t_stdlib = chronometrer(extraire_donnees_csv, chemin)
+        t_import_stdlib = temps_import("src.logic.data_manager")
+        print(f"{'stdlib (flux)':28}{t_import_stdlib * 1000:>14.1f}{t_stdlib * 1000:>14.2f}")
+
+        t_import_pandas = temps_import("pandas")
+        if t_import_pandas is None:
+            print(f"{'pandas':28}{'non installé':>14}")
+            return
+        t_pandas = chronometrer(extraire_donnees_csv_pandas, chemin)
+        print(f"{'pandas (ancien)':28}{t_import_pandas * 1000:>14.1f}{t_pandas * 1000:>14.2f}")
+
+        nouveau = extraire_donnees_csv(chemin)
+        ancien = extraire_donnees_csv_pandas(chemin)
+        print(f"\nObjectifs identiques : {'oui' if nouveau['objectifs'] == ancien['objectifs'] else 'NON'}")
+        for palier, cadeau in nouveau["recompenses"].items():
+            if cadeau != ancien["recompenses"][palier]:
+                print(f"Palier {palier} : {ancien['recompenses'][palier]!r} (pandas) -> {cadeau!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark mémoire : objectifs en dicts (schéma JSON) vs PlateauCompact.
+
+Usage :
+    python benchmarks/bench_memoire.py [nb_plateaux] [taille]
+"""
+import os
+import sys
+import tracemalloc
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from src.logic.plateau_compact import PlateauCompact  # noqa: E402
+
+
+def document(b, nb_cases):
+    objectifs = []
+    for i in range(nb_cases):
+        valide = (b + i) % 3 == 0
+        objectifs.append({
+            "titre": f"Objectif {i % 40}",
+            "poids": i % 3 + 1,
+            "valide": valide,
+            "date_validation": f"2026-03-{i % 28 + 1:02d} 10:00:00" if valide else None
+        })
+    return {"version": "1.0", "objectifs": objectifs, "recompenses": {"bronze": "x"}}
+
+
+def mesurer(fabrique, nb):
+    tracemalloc.start()
+    objets = [fabrique(b) for b in range(nb)]
+    taille, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return taille, objets
+
+
+def main():
+    nb = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    taille = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    nb_cases = taille * taille
+
+    docs = [document(b, nb_cases) for b in range(nb)]
+    m_dicts, _ = mesurer(lambda b: document(b, nb_cases), nb)
+    m_compact, plateaux = mesurer(lambda b: PlateauCompact.depuis_json(docs[b]), nb)
+
+    sans_perte = all(p.vers_json() == d for p, d in zip(plateaux, docs))
+    print(f"{nb} plateaux {taille}x{taille}")
+    print(f"  dicts JSON      : {m_dicts / 1024:10.0f} Ko ({m_dicts / (nb * nb_cases):.0f} o/objectif)")
+    print(f"  PlateauCompact  : {m_compact / 1024:10.0f} Ko ({m_compact / (nb * nb_cases):.0f} o/objectif)")
+    print(f"  Gain            : x{m_dicts / m_compact:.1f}")
+    print(f"  Conversion sans perte : {'oui' if sans_perte else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Suite de benchmarks du parcours CSV -> setup -> jeu -> historique.
+
+Données synthétiques générées à la volée (graine fixe) :
+- plateaux 5x5 à 50x50
+- historiques de 10 à 100 000 événements
+- CSV de 10 à 1 000 000 lignes (paliers en fin de fichier : lecture complète)
+
+Chemins mesurés : extraire_donnees_csv, sauvegarde / chargement de la
+configuration (snapshot + journal), score, détection des lignes, index de
+l'historique et requêtes du récap. Avec un affichage (DISPLAY, ou --xvfb),
+le temps de construction des écrans est mesuré aussi.
+
+Chaque cas garde le meilleur temps de `--repetitions` essais. Les résultats
+sont écrits en JSON et comparés à une référence :
+
+    python benchmarks/suite.py                          # écrit benchmarks/resultats.json, compare à baseline.json
+    python benchmarks/suite.py --rapide                 # tailles réduites (CI)
+    python benchmarks/suite.py --xvfb                   # relance sous xvfb-run (écrans inclus)
+    python benchmarks/suite.py --enregistrer-baseline   # fait des résultats la nouvelle référence
+
+Code de sortie 1 si un cas est plus lent que la référence au-delà de la
+tolérance (--tolerance, 50 % par défaut : machines partagées).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from src.logic.data_manager import extraire_donnees_csv  # noqa: E402
+from src.logic.historique import HistoriqueValidations  # noqa: E402
+from src.logic.journal import JournalBingo, ecrire_json_atomique  # noqa: E402
+from src.logic.moteur import creer_configuration  # noqa: E402
+from src.logic.score import ModeleScore  # noqa: E402
+from src.logic.victoire import DetecteurVictoire  # noqa: E402
+
+DOSSIER = os.path.dirname(os.path.abspath(__file__))
+RESULTATS = os.path.join(DOSSIER, "resultats.json")
+BASELINE = os.path.join(DOSSIER, "baseline.json")
+
+TAILLES_PLATEAU = (5, 10, 25, 50)
+TAILLES_HISTORIQUE = (10, 1_000, 100_000)
+TAILLES_CSV = (10, 1_000, 100_000, 1_000_000)
+PLAFOND_RAPIDE = 100_000    # --rapide : aucune taille au-delà
+DEBUT_2026 = 1_767_225_600  # 2026-01-01 00:00 UTC
+BRUIT_MS = 1.0              # Écart absolu ignoré lors de la comparaison (bruit de mesure)
+
+
+# --- Génération des données ---
+def generer_objectifs(nb_cases, rng, taux_valide=0.5):
+    return [{"titre": f"Objectif {i + 1}", "poids": rng.randint(1, 3),
+             "valide": rng.random() < taux_valide, "date_validation": None} for i in range(nb_cases)]
+
+
+def generer_historique(nb_evenements, nb_cases, rng):
+    """Événements sur l'année, dans le désordre (comme après une fusion)."""
+    return [[DEBUT_2026 + rng.randrange(365 * 86400), rng.randrange(nb_cases), rng.random() < 0.8]
+            for _ in range(nb_evenements)]
+
+
+def generer_csv(chemin, nb_lignes):
+    """Grille 5x5, `nb_lignes` lignes de texte parasite, puis les paliers."""
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write("IGNORE,B,I,N,G,O,IGNORE,IGNORE,IGNORE,IGNORE,IGNORE,RECOMPENSES\n")
+        for r in range(5):
+            cases = ",".join(f"Objectif {r * 5 + c + 1}" for c in range(5))
+            f.write(f"IGNORE,{cases},,,,,,\n")
+        ligne = "IGNORE,note,,,,,,,,,,commentaire\n"
+        for _ in range(nb_lignes):
+            f.write(ligne)
+        f.write("IGNORE,🥉 Niveau BRONZE : Une sucette,,,,,,,,,,\n")
+        f.write("IGNORE,🥈 Niveau ARGENT : Un Kebab,,,,,,,,,,\n")
+        f.write("IGNORE,🥇 Niveau OR : Une Carte Graphique,,,,,,,,,,\n")
+        f.write("IGNORE,💎 Niveau PLATINE : Un voyage,,,,,,,,,,\n")
+
+
+def document(taille, nb_evenements, rng):
+    nb_cases = taille * taille
+    recompenses = {"bronze": "B", "argent": "A", "or": "O", "platine": "P"}
+    objectifs = generer_objectifs(nb_cases, rng)
+    donnees = creer_configuration(objectifs, recompenses, taille_grille=taille)
+    donnees["objectifs"] = objectifs  # Avec leurs validations
+    donnees["historique"] = sorted(generer_historique(nb_evenements, nb_cases, rng))
+    return donnees
+
+
+# --- Mesure ---
+def chronometrer(fonction, repetitions):
+    """Meilleur temps (ms) sur `repetitions` essais."""
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return round(meilleur * 1000, 3)
+
+
+def cas_csv(resultats, tailles, dossier, repetitions):
+    for nb in tailles:
+        chemin = os.path.join(dossier, f"feuille_{nb}.csv")
+        generer_csv(chemin, nb)
+        resultats[f"csv.extraire[{nb} lignes]"] = chronometrer(lambda: extraire_donnees_csv(chemin), repetitions)
+
+
+def cas_configuration(resultats, tailles, dossier, repetitions, rng):
+    for taille in tailles:
+        donnees = document(taille, taille * taille * 10, rng)
+        chemin = os.path.join(dossier, f"config_{taille}.json")
+        resultats[f"config.sauver[{taille}x{taille}]"] = chronometrer(
+            lambda: ecrire_json_atomique(chemin, donnees), repetitions)
+        resultats[f"config.charger[{taille}x{taille}]"] = chronometrer(
+            lambda: JournalBingo(chemin).charger(), repetitions)
+
+        # Une rafale de 100 clics regroupée en une écriture du journal
+        evenements = [{"seq": i + 1, "index": i % (taille * taille), "valide": True, "date_validation": None}
+                      for i in range(100)]
+        resultats[f"journal.lot_100[{taille}x{taille}]"] = chronometrer(
+            lambda: JournalBingo(chemin).enregistrer_lot(evenements), repetitions)
+        os.remove(chemin + ".journal")
+
+
+def cas_score_victoire(resultats, tailles, repetitions, rng):
+    for taille in tailles:
+        objectifs = generer_objectifs(taille * taille, rng, taux_valide=0)
+
+        def score():
+            modele = ModeleScore(objectifs)
+            for obj in objectifs:
+                ancien, nouveau = modele.basculer(obj["poids"], True)
+                modele.paliers_modifies(ancien, nouveau)
+
+        def victoire():
+            detecteur = DetecteurVictoire(taille, objectifs)
+            for i in range(len(objectifs)):
+                detecteur.basculer(i, True)
+
+        resultats[f"score.remplir[{taille}x{taille}]"] = chronometrer(score, repetitions)
+        resultats[f"victoire.remplir[{taille}x{taille}]"] = chronometrer(victoire, repetitions)
+
+
+def cas_historique(resultats, tailles, repetitions, rng):
+    for nb in tailles:
+        evenements = generer_historique(nb, 25, rng)
+        resultats[f"historique.indexer[{nb} evts]"] = chronometrer(
+            lambda: HistoriqueValidations(evenements), repetitions)
+
+        historique = HistoriqueValidations(evenements)
+        maintenant = DEBUT_2026 + 300 * 86400
+
+        def recap():
+            # Changement de filtre puis affichage d'une page de la timeline (plus récents d'abord)
+            for mois in range(1, 13):
+                historique.mois(2026, mois)
+            lo, hi = historique.derniers_jours(30, maintenant)
+            for position in range(hi - 1, max(lo, hi - 20) - 1, -1):
+                historique[position]
+
+        resultats[f"recap.filtres[{nb} evts]"] = chronometrer(recap, repetitions)
+
+
+def cas_ecrans(resultats, tailles_plateau, nb_historique, dossier, repetitions, rng):
+    """Construction des écrans CustomTkinter (nécessite un affichage)."""
+    try:
+        import customtkinter as ctk
+        from src.logic.board_store import BoardStore
+        from src.ui.grid_screen import GridScreen
+        from src.ui.recap_screen import RecapScreen
+        racine = ctk.CTk()
+    except Exception as e:
+        print(f"⚠️ Écrans non mesurés (pas d'affichage ou customtkinter absent) : {e}")
+        return
+    racine.geometry("1100x800")
+
+    def mesurer_ecran(nom, store, fabrique):
+        ecrans = []
+
+        def construire():
+            # Jusqu'à l'écran dessiné : construction + passage de la boucle Tk
+            ecran = fabrique(store)
+            ecran.pack(fill="both", expand=True)
+            racine.update()
+            ecrans.append(ecran)
+
+        resultats[nom] = chronometrer(construire, repetitions)
+        for ecran in ecrans:
+            ecran.destroy()
+
+    try:
+        for taille in tailles_plateau:
+            chemin = os.path.join(dossier, f"ecran_{taille}", "bingo_config.json")
+            ecrire_json_atomique(chemin, document(taille, nb_historique, rng))
+            store = BoardStore(chemin, asynchrone=False)
+            mesurer_ecran(f"gui.grille[{taille}x{taille}]", store,
+                          lambda s: GridScreen(racine, s))
+            mesurer_ecran(f"gui.recap[{taille}x{taille}, {nb_historique} evts]", store,
+                          lambda s: RecapScreen(racine, s, on_back_callback=lambda: None))
+            store.fermer()
+    finally:
+        racine.destroy()
+
+
+# --- Comparaison ---
+def machine():
+    return {"python": platform.python_version(), "systeme": platform.platform(),
+            "processeur": platform.processor() or platform.machine(), "coeurs": os.cpu_count()}
+
+
+def comparer(resultats, baseline, tolerance):
+    """Liste des (cas, référence, mesure, ratio) plus lents que la tolérance."""
+    regressions = []
+    for cas, reference in baseline.items():
+        mesure = resultats.get(cas)
+        if mesure is None or reference <= 0:
+            continue
+        ratio = mesure / reference
+        # Petits cas : un écart de quelques dixièmes de ms n'est que du bruit
+        if ratio > 1 + tolerance and mesure - reference > BRUIT_MS:
+            regressions.append((cas, reference, mesure, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rapide", action="store_true", help=f"Tailles plafonnées à {PLAFOND_RAPIDE}")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--sortie", default=RESULTATS)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.50)
+    parser.add_argument("--enregistrer-baseline", action="store_true")
+    parser.add_argument("--sans-ecrans", action="store_true", help="Ne mesure pas les écrans (headless)")
+    parser.add_argument("--xvfb", action="store_true", help="Relance la suite sous xvfb-run")
+    args = parser.parse_args()
+
+    if args.xvfb and not os.environ.get("BINGOAL_SOUS_XVFB"):
+        if shutil.which("xvfb-run") is None:
+            print("⚠️ xvfb-run introuvable", file=sys.stderr)
+            return 2
+        argv = [a for a in sys.argv[1:] if a != "--xvfb"]
+        env = dict(os.environ, BINGOAL_SOUS_XVFB="1")
+        return subprocess.call(["xvfb-run", "-a", sys.executable, os.path.abspath(__file__)] + argv, env=env)
+
+    def plafonner(tailles):
+        return tuple(t for t in tailles if not args.rapide or t <= PLAFOND_RAPIDE)
+
+    rng = random.Random(2026)
+    resultats = {}
+    with tempfile.TemporaryDirectory() as dossier:
+        cas_csv(resultats, plafonner(TAILLES_CSV), dossier, args.repetitions)
+        cas_configuration(resultats, TAILLES_PLATEAU, dossier, args.repetitions, rng)
+        cas_score_victoire(resultats, TAILLES_PLATEAU, args.repetitions, rng)
+        cas_historique(resultats, plafonner(TAILLES_HISTORIQUE), args.repetitions, rng)
+        if not args.sans_ecrans and (os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin")):
+            cas_ecrans(resultats, (5, 10, 50), max(plafonner(TAILLES_HISTORIQUE)), dossier, args.repetitions, rng)
+
+    for cas, ms in resultats.items():
+        print(f"  {ms:10.3f} ms  {cas}")
+
+    rapport = {"date": time.strftime("%Y-%m-%dT%H:%M:%S"), "machine": machine(),
+               "rapide": args.rapide, "resultats": resultats}
+    with open(args.sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, indent=4, ensure_ascii=False)
+    print(f"📄 Résultats : {args.sortie}")
+
+    if args.enregistrer_baseline:
+        shutil.copyfile(args.sortie, args.baseline)
+        print(f"📌 Nouvelle référence : {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Pas de référence : lancez avec --enregistrer-baseline")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = comparer(resultats, baseline["resultats"], args.tolerance)
+    for cas, reference, mesure, ratio in regressions:
+        print(f"⚠️ Régression {cas} : {reference:.3f} -> {mesure:.3f} ms (x{ratio:.2f})")
+    if not regressions:
+        print(f"✅ Aucune régression au-delà de {args.tolerance:.0%} (référence du {baseline['date']})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""Point d'entrée `python -m bingoal` (moteur sans interface graphique)."""
+import sys
+
+from src.logic.cli import main
+
+# Garde nécessaire : le pool de processus de l'import CSV réimporte ce module
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,23 @@
-import customtkinter as ctk
+import time
+DEBUT = time.perf_counter()  # Avant tout import : base du chronométrage du démarrage
+
 import os
 import sys
-from src.logic.data_manager import extraire_donnees_csv
-from src.ui.setup_screen import SetupScreen
-from src.ui.grid_screen import GridScreen
-from src.ui.recap_screen import RecapScreen
+import threading
+from src.logic.chrono import ChronoDemarrage
+from src.logic.mesures import mesures
+
+chrono = ChronoDemarrage(DEBUT)
+with chrono.etape("import customtkinter"):
+    import customtkinter as ctk
+with chrono.etape("import board_store"):
+    from src.logic.board_store import BoardStore
+
+INTERVALLE_SYNCHRO_MS = 500  # Relecture du drapeau "plateau modifié ailleurs"
+INTERVALLE_SYNC_DISTANTE_MS = 60_000  # Synchronisation avec les autres appareils (BINGOAL_SYNC)
+
+# Les écrans (et le cache CSV du setup) sont importés au premier affichage :
+# un utilisateur qui revient n'a besoin que de GridScreen.
 
 # --- DONNÉES PAR DÉFAUT (INTEGRÉES DANS L'APP) ---
 CSV_DEFAULT_CONTENT = """IGNORE,B,I,N,G,O,IGNORE,IGNORE,IGNORE,IGNORE,IGNORE,RECOMPENSES
@@ -30,17 +43,176 @@ class BingoalApp(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         self.current_frame = None
+        # Cache des vues : chaque écran est construit une fois puis masqué / ré-affiché
+        self.views = {}
         
         # Définition des chemins
         self.data_dir = "data"
-        self.config_path = os.path.join(self.data_dir, "bingo_config.json")
+        # Stockage : bingo_config.json par défaut, ou base SQLite (BINGOAL_STOCKAGE=data/bingoal.db)
+        self.config_path = os.environ.get("BINGOAL_STOCKAGE", os.path.join(self.data_dir, "bingo_config.json"))
         self.csv_path = os.path.join(self.data_dir, "bingo_default.csv")
+        # Résultats d'analyse des CSV, réutilisés tant que la feuille ne change pas (créé au 1er setup)
+        self.cache_csv = None
 
         # --- AUTO-RÉPARATION ---
         # L'application vérifie et crée son environnement si nécessaire
         self.initialiser_environnement()
 
+        self.protocol("WM_DELETE_WINDOW", self.fermer)
+        # Overlay de latences (debug), construit au premier appui sur F12
+        self.perf_overlay = None
+        self.bind_all("<F12>", self.basculer_overlay)
+
+        # La fenêtre s'affiche tout de suite ; le plateau est chargé en fond
+        self.store = None
+        self.lbl_chargement = ctk.CTkLabel(self, text="Chargement du Bingo…", font=("Arial", 18))
+        self.lbl_chargement.pack(expand=True)
+        self.after_idle(lambda: chrono.jalon("premier_rendu"))
+
+        self.resultat_chargement = None
+        self.surveillant = None
+        self.changement_externe = False
+        self.erreur_synchro = None
+        # Bandeau d'erreur (construit à la première alerte)
+        self.lbl_alerte = None
+        self.masquage_alerte = None
+        # Serveur de synchronisation entre appareils (ex : BINGOAL_SYNC=http://192.168.1.10:8765)
+        self.serveur_sync = os.environ.get("BINGOAL_SYNC")
+        self.client_sync = None
+        self.echange_sync = None
+        threading.Thread(target=self.charger_en_fond, daemon=True).start()
+        self.after(10, self.attendre_chargement)
+
+    def charger_en_fond(self):
+        """
+        Hors du thread Tk : lecture du plateau (snapshot + journal) et import
+        du module de l'écran qui va s'afficher. Aucun appel à Tk ici.
+        """
+        try:
+            with chrono.etape("chargement plateau"):
+                # Modèle unique du Bingo, chargé une seule fois et partagé par les vues
+                store = BoardStore(self.config_path, plateau=os.environ.get("BINGOAL_PLATEAU"))
+            with chrono.etape("import écran initial"):
+                if store.existe:
+                    import src.ui.grid_screen  # noqa: F401
+                else:
+                    import src.ui.setup_screen  # noqa: F401
+            self.resultat_chargement = store
+        except Exception as e:
+            self.resultat_chargement = e
+
+    def attendre_chargement(self):
+        """Sonde (thread Tk) la fin du chargement en fond."""
+        if self.resultat_chargement is None:
+            self.after(10, self.attendre_chargement)
+            return
+        if isinstance(self.resultat_chargement, Exception):
+            print(f"⚠️ Erreur de chargement du plateau : {self.resultat_chargement}")
+            self.lbl_chargement.configure(text=f"Erreur de chargement : {self.resultat_chargement}")
+            return
+
+        self.store = self.resultat_chargement
+        self.lbl_chargement.destroy()
+        self.store.abonner(self.on_store_change)
         self.verifier_etat_initial()
+        self.demarrer_surveillance()
+        if self.serveur_sync:
+            self.after(INTERVALLE_SYNCHRO_MS, self.lancer_sync_distante)
+        self.after_idle(self.demarrage_termine)
+
+    # --- Modifications du plateau par un autre processus ---
+    def demarrer_surveillance(self):
+        """Surveille les fichiers du plateau ; la synchronisation se fait sur le thread Tk."""
+        if self.surveillant is not None or not self.store.existe:
+            return
+        from src.logic.surveillance import Surveillant
+        self.surveillant = Surveillant(self.store.stockage.fichiers(), self.signaler_changement).demarrer()
+        self.after(INTERVALLE_SYNCHRO_MS, self.verifier_synchro)
+
+    def signaler_changement(self, chemin):
+        """Thread de surveillance : on lève seulement un drapeau (pas d'appel Tk ici)."""
+        self.changement_externe = True
+
+    def verifier_synchro(self):
+        try:
+            if self.changement_externe or self.store.persistance.en_conflit():
+                self.changement_externe = False
+                nb = self.store.synchroniser()
+                if nb:
+                    print(f"🔄 Plateau modifié ailleurs : {nb} changement(s) intégré(s)")
+            self.erreur_synchro = None
+        except Exception as e:  # Écriture externe pas terminée (JSON partiel, renommage), base verrouillée...
+            self.changement_externe = True  # Nouvel essai au prochain tour
+            if str(e) != self.erreur_synchro:
+                self.erreur_synchro = str(e)
+                print(f"⚠️ Lecture du plateau modifié impossible : {e}")
+                self.afficher_alerte(f"⚠️ Plateau modifié ailleurs, relecture impossible : {e}")
+        finally:
+            self.after(INTERVALLE_SYNCHRO_MS, self.verifier_synchro)
+
+    def afficher_alerte(self, texte, duree_ms=8000):
+        """Bandeau d'erreur en bas de la fenêtre, masqué au bout de `duree_ms`."""
+        if self.lbl_alerte is None:
+            self.lbl_alerte = ctk.CTkLabel(self, text="", font=("Arial", 13), text_color="#ffffff",
+                                           fg_color="#e74c3c", corner_radius=8, wraplength=900)
+        self.lbl_alerte.configure(text=texte)
+        self.lbl_alerte.place(relx=0.5, rely=1.0, y=-10, anchor="s")
+        self.lbl_alerte.lift()
+        if self.masquage_alerte is not None:
+            self.after_cancel(self.masquage_alerte)
+        self.masquage_alerte = self.after(duree_ms, self.lbl_alerte.place_forget)
+
+    # --- Synchronisation avec les autres appareils ---
+    def lancer_sync_distante(self):
+        """Le réseau passe sur un thread ; la fusion revient sur le thread Tk."""
+        if not self.store.existe:
+            self.after(INTERVALLE_SYNC_DISTANTE_MS, self.lancer_sync_distante)
+            return
+        from src.logic.synchro import ClientSynchro, empreinte_grille
+        if self.client_sync is None:
+            self.client_sync = ClientSynchro(self.store, self.serveur_sync)
+        envoyes = self.client_sync.preparer()
+        empreinte = empreinte_grille(self.store.donnees)
+        self.echange_sync = None
+
+        def echanger():
+            try:
+                self.echange_sync = (envoyes, *self.client_sync.echanger(envoyes, empreinte))
+            except Exception as e:  # Remonté tel quel au thread Tk
+                self.echange_sync = e
+        threading.Thread(target=echanger, daemon=True).start()
+        self.after(INTERVALLE_SYNCHRO_MS, self.terminer_sync_distante)
+
+    def terminer_sync_distante(self):
+        from src.logic.synchro import ErreurSynchro
+        resultat = self.echange_sync
+        if resultat is None:
+            self.after(INTERVALLE_SYNCHRO_MS, self.terminer_sync_distante)
+            return
+        if isinstance(resultat, ErreurSynchro) and resultat.code in ("grille_absente", "grille_differente"):
+            # Choix explicite requis (publier / adopter une grille) : voir la ligne de commande
+            print(f"⚠️ Synchronisation arrêtée : {resultat} (python -m bingoal sync {self.serveur_sync} --publier | --adopter)")
+            return
+        if isinstance(resultat, Exception):
+            print(f"⚠️ Synchronisation impossible : {resultat}")
+        else:
+            nb = self.client_sync.terminer(*resultat)
+            if nb:
+                print(f"🔄 {nb} case(s) mise(s) à jour depuis un autre appareil")
+        self.after(INTERVALLE_SYNC_DISTANTE_MS, self.lancer_sync_distante)
+
+    def on_store_change(self, event, index):
+        if event == "recharge" and index == "externe":
+            # Grille remplacée par un autre processus : les vues sont reconstruites
+            self.oublier_vues("jeu", "recap")
+            if self.current_frame is None:  # L'une des deux était affichée
+                self.lancer_phase_jeu()
+
+    def demarrage_termine(self):
+        chrono.jalon("ecran_affiche")
+        chrono.publier()
+        if os.environ.get("BINGOAL_QUITTER_APRES_RENDU"):
+            self.fermer()
 
     def initialiser_environnement(self):
         """Crée le dossier data et le CSV par défaut si absents."""
@@ -63,48 +235,93 @@ class BingoalApp(ctk.CTk):
 
     def verifier_etat_initial(self):
         """Si une config existe, on lance le jeu, sinon le setup."""
-        if os.path.exists(self.config_path):
+        if self.store.existe:
             self.lancer_phase_jeu()
         else:
             self.lancer_phase_setup()
 
+    def afficher_vue(self, nom, fabrique, **pack_options):
+        """Masque la vue courante et affiche `nom` (construite au premier appel)."""
+        with mesures.span(f"navigation.{nom}"):
+            if self.current_frame is not None:
+                self.current_frame.pack_forget()
+
+            if nom not in self.views:
+                self.views[nom] = fabrique()
+            self.current_frame = self.views[nom]
+            self.current_frame.pack(fill="both", expand=True, **pack_options)
+        if self.perf_overlay is not None and self.perf_overlay.visible:
+            self.perf_overlay.lift()
+
+    def oublier_vues(self, *noms):
+        """Détruit des vues du cache (ex : nouvelle grille après le setup)."""
+        for nom in noms:
+            vue = self.views.pop(nom, None)
+            if vue is not None:
+                if vue is self.current_frame:
+                    self.current_frame = None
+                vue.destroy()
+
     def lancer_phase_setup(self):
         """Phase 1 : Configuration"""
-        # On lit le CSV qu'on vient potentiellement de générer
-        donnees_csv = extraire_donnees_csv(self.csv_path)
-        
-        if self.current_frame: 
-            self.current_frame.destroy()
-            
-        self.current_frame = SetupScreen(
-            master=self, 
-            initial_data=donnees_csv, 
-            on_save_callback=self.lancer_phase_jeu
-        )
-        self.current_frame.pack(fill="both", expand=True)
+        def fabrique():
+            from src.logic.cache_csv import CacheCSV
+            from src.ui.setup_screen import SetupScreen
+            if self.cache_csv is None:
+                self.cache_csv = CacheCSV(os.path.join(self.data_dir, "cache_csv.json"))
+            # On lit le CSV qu'on vient potentiellement de générer (ou son analyse en cache)
+            donnees_csv = self.cache_csv.extraire(self.csv_path)
+            return SetupScreen(
+                master=self, 
+                initial_data=donnees_csv, 
+                on_save_callback=self.enregistrer_configuration
+            )
+        self.afficher_vue("setup", fabrique)
+
+    def enregistrer_configuration(self, donnees):
+        """Fin de la Phase 1 : la nouvelle grille remplace l'ancienne."""
+        self.store.remplacer(donnees)
+        print(f"✅ Phase 1 terminée : Configuration enregistrée dans {self.config_path}")
+        self.demarrer_surveillance()
+        self.oublier_vues("jeu", "recap")
+        self.lancer_phase_jeu()
+        # L'écran de setup est détruit un peu plus tard : on est encore dans le clic de son bouton
+        self.after(200, lambda: self.oublier_vues("setup"))
 
     def lancer_phase_jeu(self):
         """Phase 2 : La Grille"""
-        if self.current_frame: 
-            self.current_frame.destroy()
-            
-        self.current_frame = GridScreen(
+        from src.ui.grid_screen import GridScreen
+        self.afficher_vue("jeu", lambda: GridScreen(
             master=self, 
+            store=self.store,
             on_recap_callback=self.lancer_phase_recap
-        )
-        self.current_frame.pack(fill="both", expand=True)
+        ), padx=20, pady=20)
 
     def lancer_phase_recap(self):
         """Phase 3 : L'Historique"""
-        if self.current_frame: 
-            self.current_frame.destroy()
-            
-        self.current_frame = RecapScreen(
+        from src.ui.recap_screen import RecapScreen
+        self.afficher_vue("recap", lambda: RecapScreen(
             master=self, 
+            store=self.store,
             on_back_callback=self.lancer_phase_jeu
-        )
-        self.current_frame.pack(fill="both", expand=True)
+        ))
+
+    def basculer_overlay(self, event=None):
+        """F12 : affiche / masque les latences p50 / p95 des dernières actions."""
+        if self.perf_overlay is None:
+            from src.ui.perf_overlay import PerfOverlay
+            self.perf_overlay = PerfOverlay(self)
+        self.perf_overlay.toggle()
+
+    def fermer(self):
+        """Fermeture de la fenêtre : on écrit les derniers clics avant de quitter."""
+        if self.surveillant is not None:
+            self.surveillant.arreter()
+        if self.store is not None:
+            self.store.fermer()
+        self.destroy()
 
 if __name__ == "__main__":
-    app = BingoalApp()
+    with chrono.etape("construction fenêtre"):
+        app = BingoalApp()
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Statistiques de progression tenues à jour à chaque bascule : rythme (poids
+validé par semaine), série de jours actifs, taux par difficulté et date
+prévue pour chaque palier.
+
+Tout est agrégé au fil des événements, en O(1) par bascule : poids net par
+semaine (dictionnaire semaine -> poids), jours actifs regroupés en
+intervalles (fusionnés à chaque nouveau jour), compteurs par poids, date du
+premier déblocage de chaque palier. Le chargement rejoue l'historique une
+seule fois ; les requêtes ne relisent jamais l'historique.
+"""
+from datetime import date, datetime, timedelta
+
+from src.logic.score import ModeleScore
+
+FENETRE_SEMAINES = 4     # Rythme = moyenne des N dernières semaines
+HORIZON_SEMAINES = 520   # Au-delà (10 ans), pas de date estimée
+
+
+def jour(ts):
+    """Numéro du jour (heure locale) d'un horodatage."""
+    return date.fromtimestamp(ts).toordinal()
+
+
+def semaine(numero_jour):
+    """Numéro de la semaine (du lundi au dimanche) d'un jour."""
+    return (numero_jour - 1) // 7
+
+
+class AnalyseProgression:
+    def __init__(self, objectifs, historique, paliers=None):
+        self.par_semaine = {}      # semaine -> poids net validé (validations - annulations)
+        self.jours = set()         # Jours avec au moins une validation
+        self.debut_de = {}         # fin d'un intervalle de jours actifs -> son début
+        self.fin_de = {}           # début -> fin
+        self.record = 0            # Plus longue série
+        self.premier_jour = None
+        self.deblocages = {}       # palier -> ts du premier déblocage
+        self.par_poids = {}        # poids -> [objectifs, validés]
+        for obj in objectifs:
+            compteurs = self.par_poids.setdefault(obj['poids'], [0, 0])
+            compteurs[0] += 1
+            compteurs[1] += bool(obj['valide'])
+
+        # Rejeu de l'historique depuis une grille vierge (seules les vraies transitions comptent)
+        rejeu = ModeleScore([{"poids": obj['poids'], "valide": False} for obj in objectifs], paliers)
+        self.noms = rejeu.noms
+        etats = bytearray(len(objectifs))
+        for position in range(len(historique)):
+            ts, index, valide = historique[position]
+            if not 0 <= index < len(objectifs):
+                continue
+            poids = objectifs[index]['poids']
+            transition = etats[index] != valide
+            rangs = None
+            if transition:
+                etats[index] = valide
+                rangs = rejeu.basculer(poids, valide)
+            self._enregistrer(ts, poids, valide, transition, rangs)
+
+    # --- Mises à jour (appelées par BoardStore) ---
+    def enregistrer(self, ts, poids, valide, transition=True, rangs=None):
+        """
+        Une bascule de poids `poids` à l'instant `ts`. `transition` : l'état
+        de la case a réellement changé ; `rangs` : (ancien, nouveau) rang du
+        score, pour dater les paliers débloqués.
+        """
+        self._enregistrer(ts, poids, valide, transition, rangs)
+        if transition:
+            self.compter(poids, valide)
+
+    def compter(self, poids, valide):
+        """Une case change d'état (taux par difficulté seulement, sans date)."""
+        self.par_poids.setdefault(poids, [0, 0])[1] += 1 if valide else -1
+
+    def _enregistrer(self, ts, poids, valide, transition, rangs):
+        numero = jour(ts)
+        if valide:
+            self._activer_jour(numero)
+        if transition:
+            cle = semaine(numero)
+            self.par_semaine[cle] = self.par_semaine.get(cle, 0) + (poids if valide else -poids)
+        if rangs and rangs[1] > rangs[0]:
+            for palier in self.noms[rangs[0]:rangs[1]]:
+                self.deblocages.setdefault(palier, ts)
+
+    def changer_poids(self, ancien, nouveau, valide):
+        """Un objectif change de difficulté (modification externe de la grille)."""
+        self.par_poids[ancien][0] -= 1
+        self.par_poids[ancien][1] -= bool(valide)
+        compteurs = self.par_poids.setdefault(nouveau, [0, 0])
+        compteurs[0] += 1
+        compteurs[1] += bool(valide)
+
+    def _activer_jour(self, numero):
+        """Ajoute un jour actif en fusionnant les intervalles voisins (O(1))."""
+        if numero in self.jours:
+            return
+        self.jours.add(numero)
+        if self.premier_jour is None or numero < self.premier_jour:
+            self.premier_jour = numero
+        debut = fin = numero
+        if numero - 1 in self.debut_de:
+            debut = self.debut_de.pop(numero - 1)
+            del self.fin_de[debut]
+        if numero + 1 in self.fin_de:
+            fin = self.fin_de.pop(numero + 1)
+            del self.debut_de[fin]
+        self.debut_de[fin] = debut
+        self.fin_de[debut] = fin
+        self.record = max(self.record, fin - debut + 1)
+
+    # --- Requêtes ---
+    def serie(self, maintenant=None):
+        """Jours actifs consécutifs jusqu'à aujourd'hui (ou hier : la journée n'est pas finie)."""
+        aujourd_hui = (maintenant or date.today()).toordinal()
+        for fin in (aujourd_hui, aujourd_hui - 1):
+            if fin in self.jours:
+                debut = self.debut_de.get(fin)
+                if debut is None:
+                    # Jours actifs dans le futur (horloge d'un autre appareil) : rare, on remonte
+                    debut = fin
+                    while debut - 1 in self.jours:
+                        debut -= 1
+                return fin - debut + 1
+        return 0
+
+    def rythme(self, maintenant=None):
+        """Poids net validé par semaine, en moyenne sur les FENETRE_SEMAINES dernières semaines."""
+        if self.premier_jour is None:
+            return 0.0
+        courante = semaine((maintenant or date.today()).toordinal())
+        nb = max(1, min(FENETRE_SEMAINES, courante - semaine(self.premier_jour) + 1))
+        return sum(self.par_semaine.get(s, 0) for s in range(courante - nb + 1, courante + 1)) / nb
+
+    def taux_par_difficulte(self):
+        """{poids: (validés, objectifs)} pour les difficultés présentes dans la grille."""
+        return {poids: tuple(reversed(c)) for poids, c in sorted(self.par_poids.items()) if c[0]}
+
+    def projections(self, score, limite, maintenant=None):
+        """
+        Pour chaque palier (dans l'ordre) : (palier, statut, date).
+        "atteint" (date du déblocage), "prevu" (date estimée au rythme
+        actuel, avant `limite`), "hors_delai" (estimée après `limite`) ou
+        "a_l_arret" (rythme nul : pas d'estimation, date None).
+        """
+        maintenant = maintenant or datetime.now()
+        rythme = self.rythme(maintenant.date())
+        resultats = []
+        for nom, seuil in zip(score.noms, score.seuils):
+            if score.est_atteint(nom):
+                ts = self.deblocages.get(nom)
+                resultats.append((nom, "atteint", datetime.fromtimestamp(ts) if ts is not None else None))
+                continue
+            manque = seuil * score.poids_total - score.poids_valide
+            if rythme <= 0:
+                resultats.append((nom, "a_l_arret", None))
+                continue
+            semaines = manque / rythme
+            if semaines > HORIZON_SEMAINES:
+                resultats.append((nom, "hors_delai", None))
+                continue
+            prevue = maintenant + timedelta(weeks=semaines)
+            resultats.append((nom, "prevu" if prevue <= limite else "hors_delai", prevue))
+        return resultats
@@ -0,0 +1,201 @@
+"""
+Score de milliers de plateaux en un seul passage vectorisé (NumPy).
+
+Chaque plateau devient une ligne de deux matrices : les poids (uint8) et
+les validations (booléens). Progression, palier et nombre de lignes
+complètes sont calculés pour tous les plateaux à la fois, sans boucle
+Python par plateau. Les plateaux sont seulement lus (jamais compactés).
+
+NumPy est une dépendance optionnelle : `pip install numpy`.
+"""
+import os
+
+from src.logic.journal import JournalBingo
+from src.logic.moteur import taille_grille
+from src.logic.plateau_compact import PlateauCompact
+from src.logic.score import PALIERS_DEFAUT
+from src.logic.victoire import est_ligne, motifs_standards
+
+try:
+    import numpy as np
+except ImportError:  # Dépendance optionnelle
+    np = None
+
+
+def _verifier_numpy():
+    if np is None:
+        raise ImportError("Le score par lot nécessite NumPy : pip install numpy")
+
+
+class LotPlateaux:
+    """
+    Matrices poids / validations d'un ensemble de plateaux de même taille NxN.
+    Paliers : `paliers` liste les jeux distincts ("paliers" des configs, None =
+    ceux du classement) et `groupe_paliers` donne celui de chaque plateau.
+    """
+    def __init__(self, noms, poids, valides, taille, paliers=None, groupe_paliers=None):
+        self.noms = list(noms)
+        self.poids = poids        # (nb_plateaux, nb_cases) uint8 (float64 si poids hors format), 0 = case absente
+        self.valides = valides    # (nb_plateaux, nb_cases) bool
+        self.taille = taille
+        self.paliers = paliers or [None]
+        self.groupe_paliers = (groupe_paliers if groupe_paliers is not None
+                               else np.zeros(len(self.noms), dtype=np.intp))
+
+    def __len__(self):
+        return len(self.noms)
+
+
+def charger_lots(chemins, racine=None):
+    """
+    Charge des bingo_config.json (snapshot + journal, en lecture seule) et
+    les regroupe par taille de grille. Renvoie {taille: LotPlateaux}.
+    Chaque plateau est nommé par son chemin relatif à `racine` (par défaut
+    le dossier commun à tous), comme dans export.lister_sources.
+    Chaque document est aussitôt réduit en PlateauCompact (sans son
+    historique) : les dicts JSON ne restent pas en mémoire pendant le
+    chargement de milliers de fichiers.
+
+    Les objectifs hors format gardent leur vrai poids : progression et
+    palier sont ceux de ModeleScore pour le même plateau. Un groupe dont un
+    poids ne tient pas dans un octet (décimal, > 255) passe en float64.
+    """
+    _verifier_numpy()
+    chemins = [os.path.abspath(chemin) for chemin in chemins]
+    if racine is None and chemins:
+        racine = os.path.commonpath([os.path.dirname(chemin) for chemin in chemins])
+    groupes = {}
+    for chemin in chemins:
+        donnees = JournalBingo(chemin).lire()
+        plateau = PlateauCompact.depuis_json(donnees, garder_historique=False)
+        groupes.setdefault(taille_grille(donnees), []).append((chemin, plateau))
+
+    lots = {}
+    for taille, plateaux in groupes.items():
+        nb_cases = taille * taille
+        hors_octet = any(not _tient_dans_un_octet(_poids_exception(obj))
+                         for _, plateau in plateaux for obj in plateau.exceptions.values())
+        poids = np.zeros((len(plateaux), nb_cases), dtype=np.float64 if hors_octet else np.uint8)
+        valides = np.zeros((len(plateaux), nb_cases), dtype=bool)
+        for b, (_, plateau) in enumerate(plateaux):
+            n = min(len(plateau), nb_cases)
+            # Lecture directe des tableaux compacts : poids (octets) et bitset
+            poids[b, :n] = np.frombuffer(plateau.poids, dtype=np.uint8, count=n)
+            octets = plateau.bits.to_bytes((len(plateau) + 7) // 8, "little")
+            valides[b, :n] = np.unpackbits(np.frombuffer(octets, dtype=np.uint8), bitorder="little")[:n].astype(bool)
+            # Objectifs hors format (poids décimal, > 255, date atypique...) : poids d'origine
+            for i, obj in plateau.exceptions.items():
+                if i < n:
+                    poids[b, i] = _poids_exception(obj)
+        # Jeux de paliers distincts (presque toujours un seul) : un indice par plateau
+        jeux, groupe_paliers = {}, np.zeros(len(plateaux), dtype=np.intp)
+        for b, (_, plateau) in enumerate(plateaux):
+            paliers = plateau.meta.get("paliers") or None
+            cle = tuple(paliers.items()) if paliers else None
+            groupe_paliers[b] = jeux.setdefault(cle, len(jeux))
+        paliers = [dict(cle) if cle else None for cle in jeux]
+        noms = [nom_plateau(chemin, racine) for chemin, _ in plateaux]
+        lots[taille] = LotPlateaux(noms, poids, valides, taille, paliers, groupe_paliers)
+    return lots
+
+
+def nom_plateau(chemin, racine):
+    """
+    "equipe/alice" pour <racine>/equipe/alice/bingo_config.json, "equipe/bob"
+    pour <racine>/equipe/bob.json ; la config à la racine prend le nom du dossier.
+    """
+    dossier, fichier = os.path.split(os.path.relpath(chemin, racine))
+    if fichier != "bingo_config.json":
+        dossier = os.path.join(dossier, os.path.splitext(fichier)[0])
+    elif not dossier:
+        return os.path.basename(os.path.abspath(racine))
+    return dossier.replace(os.sep, "/")
+
+
+def _poids_exception(obj):
+    """Poids d'un objectif hors format, tel que ModeleScore le compte (0 s'il n'est pas numérique)."""
+    poids = obj.get("poids")
+    return poids if isinstance(poids, (int, float)) else 0
+
+
+def _tient_dans_un_octet(poids):
+    return float(poids).is_integer() and 0 <= poids <= 255
+
+
+def matrice_lignes(taille):
+    """Matrice (nb_cases, nb_lignes) : 1 si la case appartient à la ligne/colonne/diagonale."""
+    _verifier_numpy()
+    nb_cases = taille * taille
+    lignes = [indices for nom, indices in motifs_standards(taille, nb_cases).items() if est_ligne(nom)]
+    m = np.zeros((nb_cases, len(lignes)), dtype=np.int32)
+    for j, indices in enumerate(lignes):
+        m[indices, j] = 1
+    return m
+
+
+def scorer(poids, valides, taille, paliers=None):
+    """
+    Calcule pour tous les plateaux en une passe :
+    - progression : poids validé / poids total (0 si grille vide)
+    - rang : nombre de paliers atteints (bisection vectorisée)
+    - lignes : nombre de lignes, colonnes et diagonales complètes
+    """
+    _verifier_numpy()
+    paliers = paliers or PALIERS_DEFAUT
+    seuils = np.array(sorted(paliers.values()))
+
+    cumul = np.float64 if poids.dtype.kind == "f" else np.int64
+    total = poids.sum(axis=1, dtype=cumul)
+    valide = np.where(valides, poids, 0).sum(axis=1, dtype=cumul)
+    progression = np.divide(valide, total, out=np.zeros(len(total)), where=total > 0)
+    rang = np.searchsorted(seuils, progression, side="right")
+
+    # Une case absente (poids 0) compte comme validée pour ne pas bloquer sa ligne
+    pleines = (valides | (poids == 0)).astype(np.int32)
+    lignes_m = matrice_lignes(taille)
+    lignes = ((pleines @ lignes_m) == lignes_m.sum(axis=0)).sum(axis=1)
+    return progression, rang, lignes
+
+
+def classement(lots, paliers=None, limite=None):
+    """
+    Classement de tous les plateaux : progression décroissante puis nombre
+    de lignes. Renvoie une liste de dicts {nom, progression, palier, lignes}.
+    Chaque plateau est classé avec ses propres "paliers" ; `paliers` ne sert
+    qu'aux plateaux qui n'en définissent pas.
+    """
+    _verifier_numpy()
+    paliers = paliers or PALIERS_DEFAUT
+
+    noms, progressions, rangs, lignes, noms_paliers = [], [], [], [], []
+    for taille, lot in lots.items():
+        p, r, l = scorer(lot.poids, lot.valides, taille, paliers)
+        ordres = []
+        for g, propres in enumerate(lot.paliers):
+            ordre = sorted((propres or paliers).items(), key=lambda palier: palier[1])
+            ordres.append([nom for nom, _ in ordre])
+            if propres:
+                dans = lot.groupe_paliers == g
+                r[dans] = np.searchsorted([seuil for _, seuil in ordre], p[dans], side="right")
+        noms.extend(lot.noms)
+        noms_paliers.extend(ordres[g] for g in lot.groupe_paliers)
+        progressions.append(p)
+        rangs.append(r)
+        lignes.append(l)
+    if not noms:
+        return []
+
+    progressions = np.concatenate(progressions)
+    rangs = np.concatenate(rangs)
+    lignes = np.concatenate(lignes)
+    ordre = np.lexsort((-lignes, -progressions))[:limite]
+
+    return [
+        {
+            "nom": noms[i],
+            "progression": round(float(progressions[i]) * 100, 1),
+            "palier": noms_paliers[i][rangs[i] - 1] if rangs[i] else None,
+            "lignes": int(lignes[i]),
+        }
+        for i in ordre
+    ]
@@ -0,0 +1,325 @@
+import time
+
+from src.logic.analyse import AnalyseProgression
+from src.logic.historique import HistoriqueValidations, epoch_vers_date
+from src.logic.mesures import mesures
+from src.logic.moteur import taille_grille
+from src.logic.persistance import PersistanceSynchrone, ServicePersistance
+from src.logic.score import ModeleScore
+from src.logic.stockage import ouvrir_stockage
+from src.logic.victoire import DetecteurVictoire
+
+
+class BoardStore:
+    """
+    Modèle unique du Bingo en mémoire, partagé par toutes les vues.
+
+    Chargé une seule fois (snapshot + journal), il applique les bascules,
+    tient à jour le score et la détection des lignes, délègue l'écriture
+    disque au service de persistance et prévient les vues abonnées pour
+    qu'elles se mettent à jour case par case. Aucune dépendance graphique.
+
+    Événements envoyés aux abonnés : ("bascule", index), ("objectif", index)
+    (titre / poids modifiés), ("recompense", cle), ("historique", None)
+    (entrées ajoutées sans bascule d'une case : fusion, relecture externe)
+    et ("recharge", None | "externe").
+    Pendant les notifications d'une bascule faite ailleurs (fusion d'un autre
+    appareil, relecture d'une écriture externe), `externe` vaut True : les
+    vues se mettent à jour sans célébrer une victoire déjà vue là-bas.
+    `asynchrone=False` écrit chaque bascule immédiatement (scripts, CLI).
+    `config_path` en .db/.sqlite ouvre le plateau `plateau` d'une base SQLite,
+    sinon c'est le bingo_config.json habituel.
+    """
+    def __init__(self, config_path, asynchrone=True, plateau=None):
+        self.config_path = config_path
+        self.asynchrone = asynchrone
+        self.stockage = ouvrir_stockage(config_path, plateau)
+        self.donnees = None
+        self.historique = None
+        self.score = None
+        self.victoire = None
+        self.analyse = None
+        self.taille = 0
+        self.persistance = None
+        self.abonnes = []
+        self.externe = False
+        if self.stockage.existe():
+            self.charger()
+
+    def charger(self):
+        with mesures.span("load"):
+            self._charger()
+
+    def _charger(self, donnees=None):
+        self.donnees = donnees if donnees is not None else self.stockage.charger()
+        # Index trié de toutes les validations / annulations (requêtes par dates)
+        self.historique = HistoriqueValidations(self.donnees["historique"])
+        # Score pondéré incrémental (paliers personnalisables via "paliers" dans la config)
+        self.score = ModeleScore(self.objectifs, self.donnees.get("paliers"))
+        # Détection des lignes / motifs complétés (motifs perso via "motifs" dans la config)
+        self.taille = taille_grille(self.donnees)
+        self.victoire = DetecteurVictoire(self.taille, self.objectifs, self.donnees.get("motifs"))
+        # Rythme, séries, projections : agrégats mis à jour à chaque bascule
+        self.analyse = AnalyseProgression(self.objectifs, self.historique, self.donnees.get("paliers"))
+
+        if self.asynchrone:
+            self.persistance = ServicePersistance(self.stockage, self.donnees)
+        else:
+            self.persistance = PersistanceSynchrone(self.stockage, self.donnees)
+
+    @property
+    def existe(self):
+        return self.donnees is not None
+
+    @property
+    def objectifs(self):
+        return self.donnees['objectifs']
+
+    @property
+    def recompenses(self):
+        return self.donnees['recompenses']
+
+    # --- Abonnements ---
+    def abonner(self, callback):
+        self.abonnes.append(callback)
+
+    def desabonner(self, callback):
+        if callback in self.abonnes:
+            self.abonnes.remove(callback)
+
+    def notifier(self, evenement, index=None):
+        for callback in list(self.abonnes):
+            callback(evenement, index)
+
+    # --- Modifications ---
+    def basculer(self, index):
+        """Inverse l'état d'un objectif, l'historise, le persiste en fond et notifie les vues."""
+        obj = self.objectifs[index]
+        valide = not obj['valide']
+        ts = int(time.time())
+        evenement = {
+            "seq": self.donnees.get("seq", 0) + 1,
+            "ts": ts,
+            "index": index,
+            "valide": valide,
+            "date_validation": epoch_vers_date(ts) if valide else None,
+        }
+        self.stockage.appliquer(self.donnees, evenement)
+        self.historique.ajouter(ts, index, valide)
+        rangs = self.score.basculer(obj['poids'], valide)
+        self.victoire.basculer(index, valide)
+        self.analyse.enregistrer(ts, obj['poids'], valide, rangs=rangs)
+
+        self.persistance.soumettre(evenement)
+        self.notifier("bascule", index)
+        return valide
+
+    def fusionner(self, evenements):
+        """
+        Intègre des bascules (ts, index, valide) venues d'un autre appareil,
+        dans l'ordre où elles ont été faites (voir synchro.py).
+
+        L'historique devient l'union des deux (doublons ignorés) ; chaque case
+        prend l'état de sa bascule la plus récente. À horodatage égal, une
+        bascule distante l'emporte sur la précédente distante (ordre de
+        saisie) et, face à une bascule locale, "validé" l'emporte : les deux
+        appareils convergent vers le même état. Seul l'historique à partir du
+        plus ancien événement reçu est relu (bisection).
+        Renvoie le nombre de cases modifiées.
+        """
+        if not evenements:
+            return 0
+        lo, hi = self.historique.plage(min(ts for ts, _, _ in evenements))
+        connus = set()
+        derniers = {}  # index -> (ts, valide, distant) de la dernière bascule connue
+        for pos in range(lo, hi):
+            ts, index, valide = self.historique[pos]
+            connus.add((ts, index, valide))
+            derniers[index] = (ts, valide, False)
+
+        a_ecrire = []
+        modifiees = set()
+        for ts, index, valide in evenements:
+            valide = bool(valide)
+            if (ts, index, valide) in connus or not 0 <= index < len(self.objectifs):
+                continue
+            connus.add((ts, index, valide))
+            dernier = derniers.get(index)
+            gagne = (dernier is None or ts > dernier[0]
+                     or (ts == dernier[0] and (dernier[2] or valide)))
+            evenement = {
+                "seq": self.donnees.get("seq", 0) + 1,
+                "ts": ts,
+                "index": index,
+                "valide": valide,
+                "date_validation": epoch_vers_date(ts) if valide else None,
+            }
+            obj = self.objectifs[index]
+            transition = gagne and obj['valide'] != valide
+            rangs = None
+            if gagne:
+                derniers[index] = (ts, valide, True)
+                if transition:
+                    rangs = self.score.basculer(obj['poids'], valide)
+                    self.victoire.basculer(index, valide)
+                    modifiees.symmetric_difference_update((index,))
+            else:
+                evenement["historique_seul"] = True
+            self.analyse.enregistrer(ts, obj['poids'], valide, transition, rangs)
+            self.stockage.appliquer(self.donnees, evenement)
+            self.historique.ajouter(ts, index, valide)
+            a_ecrire.append(evenement)
+
+        if a_ecrire:
+            self.persistance.soumettre_lot(a_ecrire)
+        self.externe = True
+        try:
+            for index in sorted(modifiees):
+                self.notifier("bascule", index)
+            if a_ecrire:
+                # Entrées perdantes ou bascules annulées : rien n'a changé à
+                # l'écran mais l'historique (recap, rythme) a grandi.
+                self.notifier("historique")
+        finally:
+            self.externe = False
+        return len(modifiees)
+
+    def remplacer(self, donnees):
+        """Nouvelle configuration (Phase 1) : écrit le snapshot et recharge."""
+        if self.persistance:
+            self.persistance.arreter()
+        self.stockage.compacter(donnees, forcer=True)
+        self.charger()
+        self.notifier("recharge")
+
+    # --- Modifications externes ---
+    def a_change(self):
+        """Un autre processus a-t-il écrit le plateau depuis notre dernière lecture / écriture ?"""
+        return self.stockage.a_change()
+
+    def synchroniser(self):
+        """
+        Intègre les écritures d'un autre processus (à appeler sur le thread Tk).
+
+        Le nouvel état est comparé au modèle en mémoire : seules les cases,
+        récompenses et entrées d'historique modifiées sont mises à jour et
+        notifiées. Nos bascules refusées pour conflit de version sont ensuite
+        rejouées par-dessus (nouveau seq), rien n'est écrasé.
+        Renvoie le nombre de changements appliqués, ou None si rien n'a changé.
+        Une lecture impossible (fichier en cours d'écriture, base verrouillée)
+        lève son exception ; les bascules en conflit sont gardées pour le
+        prochain essai.
+        """
+        if not self.persistance.en_conflit() and not self.stockage.a_change():
+            # Nos propres écritures (empreinte identique) : inutile de forcer la rafale en attente
+            return None
+        self.persistance.vider()
+        if not self.persistance.en_conflit() and not self.stockage.a_change():
+            return None
+
+        with mesures.span("load.externe"):
+            nouveau = self.stockage.charger()
+            conflits = self.persistance.prendre_conflits()
+            if not self.meme_structure(nouveau):
+                # Nouvelle grille : on recharge tout, les bascules en conflit n'ont plus de sens
+                if conflits:
+                    print(f"⚠️ {len(conflits)} bascule(s) abandonnée(s) : la grille a été remplacée")
+                self.persistance.arreter()
+                self._charger(nouveau)
+                self.notifier("recharge", "externe")
+                return len(self.objectifs)
+
+            self.externe = True
+            try:
+                nb = self.appliquer_diff(nouveau)
+            finally:
+                self.externe = False
+            self.persistance.reinitialiser(self.donnees)
+
+        for evenement in conflits:
+            if self.objectifs[evenement["index"]]['valide'] != evenement["valide"]:
+                self.basculer(evenement["index"])
+                nb += 1
+        return nb
+
+    def meme_structure(self, nouveau):
+        """Même grille (nombre de cases, taille, paliers, motifs) : un diff suffit."""
+        return (len(nouveau.get("objectifs", [])) == len(self.objectifs)
+                and taille_grille(nouveau) == self.taille
+                and nouveau.get("paliers") == self.donnees.get("paliers")
+                and nouveau.get("motifs") == self.donnees.get("motifs"))
+
+    def appliquer_diff(self, nouveau):
+        """
+        Reporte dans le modèle en mémoire ce qui diffère de `nouveau`, en
+        proportion de ce qui a changé : les événements ajoutés à l'historique
+        sont rejoués un par un dans le score et l'analyse.
+        """
+        ancien, recent = self.donnees["historique"], nouveau["historique"]
+        # En pratique, seuls des événements ont été ajoutés à la fin
+        ajout = len(recent) >= len(ancien) and (not ancien or recent[len(ancien) - 1] == ancien[-1])
+
+        poids_modifies = set()
+        for index, (obj, autre) in enumerate(zip(self.objectifs, nouveau["objectifs"])):
+            if obj['poids'] != autre['poids']:
+                self.score.changer_poids(obj['poids'], autre['poids'], obj['valide'])
+                self.analyse.changer_poids(obj['poids'], autre['poids'], obj['valide'])
+                obj['poids'] = autre['poids']
+                poids_modifies.add(index)
+
+        # État des cases au fil des événements ajoutés, pour dater les paliers franchis
+        etats = {}
+        if ajout:
+            for ts, index, valide in recent[len(ancien):]:
+                self.historique.ajouter(ts, index, valide)
+                if not 0 <= index < len(self.objectifs):
+                    continue
+                poids = self.objectifs[index]['poids']
+                transition = etats.get(index, self.objectifs[index]['valide']) != valide
+                rangs = None
+                if transition:
+                    etats[index] = valide
+                    rangs = self.score.basculer(poids, valide)
+                self.analyse.enregistrer(ts, poids, valide, transition, rangs)
+        else:
+            self.historique = HistoriqueValidations(recent)
+
+        nb = 0
+        for index, (obj, autre) in enumerate(zip(self.objectifs, nouveau["objectifs"])):
+            if etats.get(index, obj['valide']) != autre['valide']:
+                # État final sans événement qui y mène (bascule "historique_seul"...) : on recale
+                self.score.basculer(obj['poids'], autre['valide'])
+                self.analyse.compter(obj['poids'], autre['valide'])
+            if obj == autre and index not in poids_modifies:
+                continue
+            nb += 1
+            texte_modifie = obj['titre'] != autre['titre'] or index in poids_modifies
+            bascule = obj['valide'] != autre['valide']
+            obj.update(autre)
+            if bascule:
+                self.victoire.basculer(index, obj['valide'])
+            if texte_modifie:
+                self.notifier("objectif", index)
+            if bascule:
+                self.notifier("bascule", index)
+
+        for cle, texte in nouveau.get("recompenses", {}).items():
+            if self.recompenses.get(cle) != texte:
+                self.recompenses[cle] = texte
+                self.notifier("recompense", cle)
+                nb += 1
+
+        for cle, valeur in nouveau.items():
+            if cle not in ("objectifs", "recompenses"):
+                self.donnees[cle] = valeur
+        if not ajout:
+            # Historique réécrit (rare) : lui seul impose un rejeu complet
+            self.analyse = AnalyseProgression(self.objectifs, self.historique, self.donnees.get("paliers"))
+        if nb or len(self.historique) != len(ancien):
+            self.notifier("historique")
+        return nb
+
+    def fermer(self):
+        """Vide la file d'écriture (à appeler à la fermeture de la fenêtre)."""
+        if self.persistance:
+            self.persistance.arreter()
@@ -0,0 +1,119 @@
+"""
+Cache persistant des CSV déjà analysés.
+
+Une feuille est reconnue par son empreinte (chemin, mtime, taille, hash du
+contenu). Tant qu'elle ne change pas, `extraire()` renvoie les objectifs et
+récompenses déjà extraits sans relire le CSV.
+
+- Même chemin, même mtime et même taille : aucun accès au CSV.
+- mtime ou taille changés : le contenu est haché ; si le hash est connu
+  (fichier simplement touché, copie de la même feuille ailleurs), pas d'analyse.
+- Sinon : analyse normale, puis mise en cache.
+
+Le cache est un fichier JSON (rechargé d'un seul json.load) limité aux
+`capacite` feuilles les plus récemment utilisées.
+"""
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from src.logic.data_manager import extraire_donnees_csv
+from src.logic.journal import ecrire_json_atomique
+from src.logic.mesures import mesures
+
+CAPACITE_CACHE = 32         # Nombre de feuilles mémorisées (LRU)
+VERSION_CACHE = 2           # À incrémenter si le format extrait change (ou son résultat)
+TAILLE_BLOC = 1 << 20
+
+
+def hacher_fichier(chemin):
+    """Hash du contenu (blake2b), lu par blocs pour les grosses feuilles."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(TAILLE_BLOC), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+class CacheCSV:
+    def __init__(self, chemin_cache, capacite=CAPACITE_CACHE):
+        self.chemin_cache = chemin_cache
+        self.capacite = capacite
+        self.entrees = OrderedDict()   # hash -> données extraites (ordre LRU)
+        self.fichiers = {}             # chemin absolu -> [mtime_ns, taille, hash]
+        self.nb_succes = 0
+        self.nb_analyses = 0
+        self.charger()
+
+    # --- Persistance du cache ---
+    def charger(self):
+        if not os.path.exists(self.chemin_cache):
+            return
+        try:
+            with open(self.chemin_cache, "r", encoding="utf-8") as f:
+                contenu = json.load(f)
+            if contenu.get("version") != VERSION_CACHE:
+                return  # Ancien format : on repart de zéro
+            self.entrees = OrderedDict(contenu.get("entrees", []))
+            self.fichiers = contenu.get("fichiers", {})
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Cache CSV illisible, ignoré : {e}")
+            self.entrees, self.fichiers = OrderedDict(), {}
+
+    def sauvegarder(self):
+        try:
+            ecrire_json_atomique(self.chemin_cache, {
+                "version": VERSION_CACHE,
+                "entrees": list(self.entrees.items()),
+                "fichiers": self.fichiers
+            })
+        except OSError as e:
+            print(f"⚠️ Impossible d'écrire le cache CSV : {e}")
+
+    # --- Consultation ---
+    def extraire(self, chemin_csv):
+        """Équivalent de extraire_donnees_csv(chemin_csv), avec cache."""
+        with mesures.span("parse"):
+            return self._extraire(chemin_csv)
+
+    def _extraire(self, chemin_csv):
+        try:
+            stat = os.stat(chemin_csv)
+        except OSError:
+            return None
+
+        cle = os.path.abspath(chemin_csv)
+        connu = self.fichiers.get(cle)
+        if connu and connu[0] == stat.st_mtime_ns and connu[1] == stat.st_size and connu[2] in self.entrees:
+            return self._succes(connu[2])
+
+        empreinte = hacher_fichier(chemin_csv)
+        self.fichiers[cle] = [stat.st_mtime_ns, stat.st_size, empreinte]
+        if empreinte in self.entrees:
+            resultat = self._succes(empreinte)
+            self.sauvegarder()  # Nouvelle empreinte de fichier à retenir
+            return resultat
+
+        donnees = extraire_donnees_csv(chemin_csv)
+        self.nb_analyses += 1
+        if donnees is None:
+            del self.fichiers[cle]  # Échec : on retentera au prochain appel
+            return None
+
+        self.entrees[empreinte] = donnees
+        self._evincer()
+        self.sauvegarder()
+        return copy.deepcopy(donnees)
+
+    def _succes(self, empreinte):
+        self.entrees.move_to_end(empreinte)
+        self.nb_succes += 1
+        # Copie : l'appelant peut modifier le résultat sans abîmer le cache
+        return copy.deepcopy(self.entrees[empreinte])
+
+    def _evincer(self):
+        while len(self.entrees) > self.capacite:
+            empreinte, _ = self.entrees.popitem(last=False)
+            self.fichiers = {c: v for c, v in self.fichiers.items() if v[2] != empreinte}
@@ -0,0 +1,67 @@
+"""
+Chronométrage du démarrage de l'application.
+
+Activé par variables d'environnement (aucun coût sinon, à part quelques
+appels à perf_counter) :
+
+    BINGOAL_CHRONO=1                 affiche les étapes sur stderr en fin de démarrage
+    BINGOAL_CHRONO_FICHIER=x.json    écrit les étapes en JSON (utilisé par benchmarks/bench_demarrage.py)
+    BINGOAL_QUITTER_APRES_RENDU=1    ferme l'application une fois la grille affichée
+
+Les étapes sont de deux sortes, comme `python -X importtime` :
+- des durées (`with chrono.etape("import customtkinter"): ...`)
+- des jalons (`chrono.jalon("premier_rendu")`), en ms depuis le lancement du script
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class ChronoDemarrage:
+    def __init__(self, debut=None):
+        self.debut = debut if debut is not None else time.perf_counter()
+        # Heure murale du lancement : permet de mesurer depuis l'extérieur du processus
+        self.debut_epoch = time.time() - (time.perf_counter() - self.debut)
+        self.etapes = []   # (nom, début en ms, durée en ms)
+        self.jalons = {}   # nom -> ms depuis le lancement
+        self.actif = bool(os.environ.get("BINGOAL_CHRONO") or os.environ.get("BINGOAL_CHRONO_FICHIER"))
+
+    def _ms(self, t):
+        return round((t - self.debut) * 1000, 2)
+
+    @contextmanager
+    def etape(self, nom):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            t1 = time.perf_counter()
+            self.etapes.append((nom, self._ms(t0), round((t1 - t0) * 1000, 2)))
+
+    def jalon(self, nom):
+        if nom not in self.jalons:
+            self.jalons[nom] = self._ms(time.perf_counter())
+
+    def rapport(self):
+        return {
+            "debut_epoch": self.debut_epoch,
+            "etapes": [{"nom": nom, "debut_ms": debut, "duree_ms": duree} for nom, debut, duree in self.etapes],
+            "jalons": self.jalons,
+        }
+
+    def publier(self):
+        """Affiche / écrit le rapport si le chronométrage est demandé."""
+        if not self.actif:
+            return
+        chemin = os.environ.get("BINGOAL_CHRONO_FICHIER")
+        if chemin:
+            with open(chemin, "w", encoding="utf-8") as f:
+                json.dump(self.rapport(), f, indent=4)
+        if os.environ.get("BINGOAL_CHRONO"):
+            print("⏱️ Démarrage :", file=sys.stderr)
+            for nom, debut, duree in self.etapes:
+                print(f"  {debut:9.1f} ms  {duree:8.1f} ms  {nom}", file=sys.stderr)
+            for nom, t in sorted(self.jalons.items(), key=lambda j: j[1]):
+                print(f"  {t:9.1f} ms  {'':>8}     ▶ {nom}", file=sys.stderr)
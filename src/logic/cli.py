@@ -0,0 +1,207 @@
+"""
+Ligne de commande du Bingo (sans interface graphique) :
+
+    python -m bingoal status
+    python -m bingoal toggle 7
+    python -m bingoal recap --jours 30
+    python -m bingoal --config data/bingoal.db --plateau equipe-a status
+    python -m bingoal --config data/bingoal.db --plateau equipe-a import-json data/bingo_config.json
+    python -m bingoal import-csv feuilles/ data/bingoal.db --rapport rapport.json
+    python -m bingoal serveur-sync --port 8765
+    python -m bingoal sync http://127.0.0.1:8765
+    python -m bingoal --config data/bingoal.db export rapports/nuit --format html --gzip
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from src.logic.board_store import BoardStore
+from src.logic.moteur import statut
+from src.logic.stockage import exporter_json, importer_json
+
+# export, import_lot (pool de processus) et synchro (urllib / http) ne sont
+# importés que par leur commande : status et toggle restent rapides.
+CONFIG_PAR_DEFAUT = "data/bingo_config.json"
+FORMATS_EXPORT = ("csv", "jsonl", "html")  # = export.FORMATS, sans importer le module
+
+
+def cmd_status(store, args):
+    etat = statut(store)
+    if args.json:
+        print(json.dumps(etat, ensure_ascii=False))
+        return 0
+    palier = (etat["palier"] or "aucun").capitalize()
+    print(f"Progression : {etat['progression']}% ({etat['poids_valide']}/{etat['poids_total']} pts)")
+    print(f"Palier      : {palier}")
+    print(f"Cases       : {etat['valides']}/{etat['objectifs']}")
+    print(f"Lignes      : {etat['lignes']}")
+    print(f"Temps       : J-{etat['jours_restants']}")
+    return 0
+
+
+def cmd_toggle(store, args):
+    index = args.case - 1
+    if not 0 <= index < len(store.objectifs):
+        print(f"⚠️ Case inconnue : {args.case} (1 à {len(store.objectifs)})", file=sys.stderr)
+        return 1
+    valide = store.basculer(index)
+    titre = store.objectifs[index]['titre']
+    print(f"{'✅' if valide else '↩'} {args.case:02d}. {titre}")
+    return 0
+
+
+def cmd_recap(store, args):
+    historique = store.historique
+    if args.mois:
+        annee, mois = (int(x) for x in args.mois.split("-"))
+        lo, hi = historique.mois(annee, mois)
+    elif args.jours:
+        lo, hi = historique.derniers_jours(args.jours)
+    else:
+        lo, hi = historique.plage()
+
+    for pos in range(hi - 1, lo - 1, -1):
+        ts, index, valide = historique[pos]
+        obj = store.objectifs[index]
+        date_str = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+        marque = "✅" if valide else "↩"
+        print(f"{date_str}  {marque} {obj['titre']} {'★' * obj['poids']}")
+    return 0
+
+
+def cmd_import_json(store, args):
+    importer_json(store.stockage, args.fichier)
+    print(f"✅ {args.fichier} importé dans {store.config_path}")
+    return 0
+
+
+def cmd_export_json(store, args):
+    exporter_json(store.stockage, args.fichier)
+    print(f"✅ Plateau exporté vers {args.fichier}")
+    return 0
+
+
+def cmd_import_csv(args):
+    from src.logic.import_lot import importer_dossier
+    rapport = importer_dossier(args.dossier, args.destination, nb_processus=args.processus)
+    for chemin, erreurs in rapport["erreurs"].items():
+        print(f"⚠️ {chemin}", file=sys.stderr)
+        for erreur in erreurs:
+            print(f"    - {erreur}", file=sys.stderr)
+    if args.rapport:
+        with open(args.rapport, "w", encoding="utf-8") as f:
+            json.dump(rapport, f, indent=4, ensure_ascii=False)
+    print(f"✅ {rapport['importes']}/{rapport['total']} feuilles importées dans {args.destination}")
+    return 1 if rapport["erreurs"] else 0
+
+
+def cmd_export(args):
+    from src.logic.export import exporter
+    chemins, compteurs = exporter(args.config, args.sortie, args.format, args.gzip)
+    for chemin in chemins:
+        print(f"✅ {chemin}")
+    print(f"   {compteurs['plateau']} plateau(x), {compteurs['validation']} validation(s), "
+          f"{compteurs['palier']} palier(s) débloqué(s)")
+    return 0
+
+
+def cmd_sync(store, args):
+    from src.logic.synchro import ClientSynchro, ErreurSynchro
+    client = ClientSynchro(store, args.serveur)
+    try:
+        rapport = client.synchroniser(publier=args.publier, adopter=args.adopter)
+    except ErreurSynchro as e:
+        print(f"⚠️ Synchronisation impossible : {e}", file=sys.stderr)
+        return 1
+    print(f"✅ {rapport['envoyes']} bascule(s) envoyée(s), {rapport['recus']} reçue(s), "
+          f"{rapport['cases_modifiees']} case(s) modifiée(s) "
+          f"({rapport['octets_envoyes']} o envoyés, {rapport['octets_recus']} o reçus)")
+    return 0
+
+
+def cmd_serveur_sync(args):
+    from src.logic.serveur_synchro import creer_serveur
+    serveur = creer_serveur(args.base, args.hote, args.port)
+    hote, port = serveur.server_address[:2]
+    print(f"🔄 Serveur de synchronisation sur http://{hote}:{port} (base : {args.base})")
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serveur.server_close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bingoal", description="Bingoal en ligne de commande")
+    parser.add_argument("--config", default=CONFIG_PAR_DEFAUT, help="bingo_config.json, ou base .db/.sqlite")
+    parser.add_argument("--plateau", help="Nom du plateau dans une base SQLite")
+    sous = parser.add_subparsers(dest="commande", required=True)
+
+    p_status = sous.add_parser("status", help="Progression, palier, lignes, compte à rebours")
+    p_status.add_argument("--json", action="store_true", help="Sortie JSON")
+    p_status.set_defaults(fonction=cmd_status)
+
+    p_toggle = sous.add_parser("toggle", help="Coche / décoche une case (numérotée à partir de 1)")
+    p_toggle.add_argument("case", type=int)
+    p_toggle.set_defaults(fonction=cmd_toggle)
+
+    p_recap = sous.add_parser("recap", help="Historique des validations, du plus récent au plus ancien")
+    p_recap.add_argument("--jours", type=int, help="Seulement les N derniers jours")
+    p_recap.add_argument("--mois", help="Seulement un mois (AAAA-MM)")
+    p_recap.set_defaults(fonction=cmd_recap)
+
+    p_import = sous.add_parser("import-json", help="Importe un bingo_config.json dans le stockage")
+    p_import.add_argument("fichier")
+    p_import.set_defaults(fonction=cmd_import_json)
+
+    p_export = sous.add_parser("export-json", help="Exporte le plateau au format bingo_config.json")
+    p_export.add_argument("fichier")
+    p_export.set_defaults(fonction=cmd_export_json)
+
+    p_import_csv = sous.add_parser("import-csv", help="Importe en masse un dossier de feuilles CSV")
+    p_import_csv.add_argument("dossier")
+    p_import_csv.add_argument("destination", help="Base .db/.sqlite, ou dossier (un bingo_config.json par plateau)")
+    p_import_csv.add_argument("--rapport", help="Écrit le rapport d'erreurs (JSON)")
+    p_import_csv.add_argument("--processus", type=int, help="Nombre de processus (défaut : tous les cœurs)")
+    p_import_csv.set_defaults(fonction=cmd_import_csv)
+
+    p_rapport = sous.add_parser("export", help="Rapports (validations, paliers, difficultés) de tous les plateaux de --config (base, dossier ou fichier)")
+    p_rapport.add_argument("sortie", help="Fichier de sortie, extension ajoutée si absente (préfixe des fichiers en CSV)")
+    p_rapport.add_argument("--format", choices=FORMATS_EXPORT, default="jsonl")
+    p_rapport.add_argument("--gzip", action="store_true", help="Compresse la sortie (.gz)")
+    p_rapport.set_defaults(fonction=cmd_export)
+
+    p_sync = sous.add_parser("sync", help="Synchronise le plateau avec un serveur (autres appareils)")
+    p_sync.add_argument("serveur", help="URL du serveur, ex : http://127.0.0.1:8765")
+    choix = p_sync.add_mutually_exclusive_group()
+    choix.add_argument("--publier", action="store_true", help="Impose notre grille au serveur (son journal repart de zéro)")
+    choix.add_argument("--adopter", action="store_true", help="Remplace notre grille par celle du serveur")
+    p_sync.set_defaults(fonction=cmd_sync)
+
+    p_serveur = sous.add_parser("serveur-sync", help="Lance le serveur de synchronisation de référence")
+    p_serveur.add_argument("--base", default="data/serveur_sync.db", help="Base SQLite du serveur")
+    p_serveur.add_argument("--hote", default="127.0.0.1")
+    p_serveur.add_argument("--port", type=int, default=8765)
+    p_serveur.set_defaults(fonction=cmd_serveur_sync)
+
+    args = parser.parse_args(argv)
+    if args.fonction in (cmd_import_csv, cmd_serveur_sync, cmd_export):
+        return args.fonction(args)  # N'utilisent pas le plateau courant (l'export lit le stockage en flux)
+
+    store = BoardStore(args.config, asynchrone=False, plateau=args.plateau)
+    if args.fonction in (cmd_import_json, cmd_sync):
+        # Pas besoin d'un plateau existant : il peut venir du fichier / du serveur
+        try:
+            return args.fonction(store, args)
+        finally:
+            store.fermer()
+    if not store.existe:
+        print(f"⚠️ Aucune configuration trouvée : {args.config}", file=sys.stderr)
+        return 1
+    try:
+        return args.fonction(store, args)
+    finally:
+        store.fermer()
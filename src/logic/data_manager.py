@@ -1,88 +1,143 @@
-import pandas as pd
+import csv
 import os
 import re
+from itertools import islice
+
+# --- GÉOMÉTRIE DU FICHIER (Format GSheet original) ---
+NB_COLONNES = 12            # Colonnes utiles (0 à 11), le reste est ignoré
+LIGNES_GRILLE = (1, 6)      # Lignes 1 à 5 : la grille 5x5
+COLONNES_GRILLE = (1, 6)    # Colonnes 1 à 5
+COLONNE_RECOMPENSE = 11     # Colonne "RECOMPENSES" du format GSheet
+PALIERS = ("bronze", "argent", "or", "platine")
+
+
+def lire_cellules(chemin_fichier, nb_colonnes=NB_COLONNES):
+    """
+    Lit le CSV ligne par ligne (sans tout charger en mémoire).
+    Chaque ligne est tronquée / complétée à `nb_colonnes` cellules nettoyées.
+    Les lignes entièrement vides sont ignorées (comme le faisait pandas).
+    """
+    with open(chemin_fichier, "r", encoding="utf-8", newline="") as f:
+        for ligne in csv.reader(f):
+            if not ligne:
+                continue
+            cellules = [c.strip() for c in islice(ligne, nb_colonnes)]
+            if len(cellules) < nb_colonnes:
+                cellules.extend([""] * (nb_colonnes - len(cellules)))
+            yield cellules
+
+
+# --- RECONNAISSANCE DES PALIERS ---
+# Un seul motif compilé : chaque palier est un groupe nommé, le groupe qui
+# matche donne directement la clé du dictionnaire des récompenses.
+# Les mots sont cherchés en entier (\b) : "IGNORE" ou "PORT" ne sont plus
+# pris pour "OR". Le "or" court doit être capitalisé ("Or", "OR") pour ne pas
+# confondre le palier avec la conjonction ("pizza or sushi").
+MOTS_PALIERS = {
+    "bronze": ("🥉", r"\bbron(?:ze|ce|zo)\b"),
+    "argent": ("🥈", r"\b(?:argent|argento|silver|silber|plata)\b"),
+    "or": ("🥇", r"\b(?:gold|oro|(?-i:O[rR]))\b"),
+    "platine": ("💎", r"\bplatin(?:e|um|o)?\b"),
+}
+
+MOTIF_PALIER = re.compile(
+    "|".join(
+        f"(?P<{palier}>{emoji}|{mots})" for palier, (emoji, mots) in MOTS_PALIERS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Décorations d'une étiquette de palier : emojis, noms de paliers,
+# "Niveau"/"Palier"/"Level", pourcentages, "(x Etoiles)", "de la grille"...
+# Elles ne sont retirées qu'en tête ("🥉 Niveau BRONZE (25%) : ") ou en fin
+# (" - Niveau Or", "(Bronze)") du texte, jamais au milieu du cadeau :
+# "Bon de 20% chez X" ou "Silver watch" restent intacts.
+EMOJIS_PALIERS = "".join(emoji for emoji, _ in MOTS_PALIERS.values())
+MOT_DECORATION = "|".join([
+    *(mots for _, mots in MOTS_PALIERS.values()),
+    r"\b(?:niveau|palier|level|tier|nivel|livello|stufe)\b",
+    r"\b\d+(?:[.,]\d+)?\s*(?:%|(?:etoiles|étoiles|stars|estrellas)\b)",
+    r"\b(?:etoiles|étoiles|stars|estrellas)\b",
+    r"\bde\s+la\s+grille\b",
+])
+ETIQUETTE = rf"(?:{MOT_DECORATION}|[\s(){EMOJIS_PALIERS}])+"
+SEPARATEUR = r"(?::|\s[-–—](?=\s))"  # "Or : ...", "Or - ..." (mais pas "Gold-plated")
+
+MOTIF_DECORATIONS = re.compile(
+    rf"^[\s{EMOJIS_PALIERS}]*(?:{ETIQUETTE}(?:{SEPARATEUR}|$))?"                # Étiquette en tête (ou seule)
+    rf"|(?:{SEPARATEUR}{ETIQUETTE}|\((?:{MOT_DECORATION}|\s)+\)|[\s{EMOJIS_PALIERS}])+$",  # ... ou en fin
+    re.IGNORECASE,
+)
+
+
+def classer_palier(texte):
+    """Renvoie le palier cité dans `texte` (bronze/argent/or/platine) ou None."""
+    m = MOTIF_PALIER.search(texte)
+    return m.lastgroup if m else None
+
+
+def nettoyer_texte_recompense(texte):
+    """Enlève les mots clés pour ne garder que le cadeau."""
+    return " ".join(MOTIF_DECORATIONS.sub(" ", texte).split())
+
+
+def extraire_recompense_ligne(cellules, recompenses):
+    """Cherche les paliers cités dans une ligne et remplit `recompenses`."""
+    for cell in cellules:
+        if not cell:
+            continue
+        palier = classer_palier(cell)
+        if palier is None:
+            continue
+
+        # STRATÉGIE 1 : Regarder la colonne 11 (Format GSheet original)
+        if cellules[COLONNE_RECOMPENSE]:
+            recompenses[palier] = cellules[COLONNE_RECOMPENSE]
+
+        # STRATÉGIE 2 : La cellule elle-même contient le cadeau (Format Test/Fun)
+        else:
+            cadeau = nettoyer_texte_recompense(cell)
+            # Si après nettoyage il reste du texte, c'est le cadeau !
+            if len(cadeau) > 2:
+                recompenses[palier] = cadeau
+
 
 def extraire_donnees_csv(chemin_fichier):
     """
     Analyse le CSV pour extraire les objectifs et les récompenses.
     Capable de gérer différents formats de fichiers (Colonnes fixes ou texte libre).
+    Le fichier est lu en flux, ligne par ligne (12 colonnes utiles). Comme
+    avec l'ancien import pandas, tout le fichier est parcouru : si un palier
+    est cité plusieurs fois, c'est la dernière ligne qui l'emporte.
     """
     if not os.path.exists(chemin_fichier):
         return None
 
     try:
-        # Lecture sans header
-        df = pd.read_csv(chemin_fichier, header=None)
-        
-        # 1. Extraction des objectifs (Grille 5x5 - Lignes 1 à 5, Cols 1 à 5)
-        # On sécurise au cas où le fichier est plus petit
-        try:
-            objectifs_raw = df.iloc[1:6, 1:6].values.flatten()
-        except:
-            # Si le fichier est mal formaté, on renvoie une liste vide
-            objectifs_raw = ["Case vide"] * 25
+        debut_grille, fin_grille = LIGNES_GRILLE
+        col_debut, col_fin = COLONNES_GRILLE
+
+        titres = []
+        recompenses = {cle: "" for cle in PALIERS}
+
+        for num_ligne, cellules in enumerate(lire_cellules(chemin_fichier)):
+            # 1. Extraction des objectifs (Grille 5x5 - Lignes 1 à 5, Cols 1 à 5)
+            if debut_grille <= num_ligne < fin_grille:
+                titres.extend(cellules[col_debut:col_fin])
+
+            # 2. Extraction des Récompenses (la dernière mention d'un palier l'emporte)
+            extraire_recompense_ligne(cellules, recompenses)
 
         liste_objectifs = []
-        for obj in objectifs_raw:
-            titre = str(obj) if pd.notna(obj) else ""
+        for titre in titres:
             titre = titre.replace("\n", " ").strip()
             # Si le titre est vide, on met un placeholder
             if not titre or titre.lower() == "nan":
                 titre = "Objectif Libre"
             liste_objectifs.append({"titre": titre, "poids": 1})
 
-        # 2. Extraction des Récompenses (Intelligence améliorée)
-        recompenses = {
-            "bronze": "", "argent": "", "or": "", "platine": ""
-        }
-
-        def nettoyer_texte_recompense(texte):
-            """Enlève les mots clés pour ne garder que le cadeau."""
-            # Liste des mots parasites à supprimer
-            parasites = [
-                "Niveau", "BRONZE", "ARGENT", "OR", "PLATINE", 
-                "🥉", "🥈", "🥇", "💎", ":", "(", ")", 
-                "%", "Etoiles", "de", "la", "grille"
-            ]
-            for p in parasites:
-                texte = texte.replace(p, "")
-                texte = texte.replace(p.lower(), "") # Majuscules et minuscules
-            return texte.strip()
-
-        # On parcourt chaque ligne du fichier
-        for index, row in df.iterrows():
-            # On convertit toute la ligne en une seule chaîne de texte majuscule pour chercher
-            ligne_str = " ".join(str(val) for val in row.values if pd.notna(val)).upper()
-            
-            # On définit les mots clés à chercher
-            map_paliers = {
-                "BRONZE": "bronze",
-                "ARGENT": "argent", 
-                "OR": "or",    # Attention à ne pas matcher "DOOR" ou "PORT"
-                "PLATINE": "platine"
-            }
-
-            for mot_cle, cle_dict in map_paliers.items():
-                # Si on trouve "PLATINE" dans la ligne
-                if mot_cle in ligne_str:
-                    # STRATÉGIE 1 : Regarder la colonne 11 (Format GSheet original)
-                    if len(row) > 11 and pd.notna(row[11]) and str(row[11]).strip() != "":
-                        recompenses[cle_dict] = str(row[11]).strip()
-                    
-                    # STRATÉGIE 2 : Chercher dans la ligne entière (Format Test/Fun)
-                    else:
-                        # On cherche la cellule exacte qui contient le mot clé
-                        for cell in row.values:
-                            cell_str = str(cell)
-                            if mot_cle in cell_str.upper():
-                                # On nettoie cette cellule
-                                cadeau = nettoyer_texte_recompense(cell_str)
-                                # Si après nettoyage il reste du texte, c'est le cadeau !
-                                if len(cadeau) > 2: 
-                                    recompenses[cle_dict] = cadeau
-
         return {"objectifs": liste_objectifs, "recompenses": recompenses}
 
     except Exception as e:
         print(f"⚠️ Erreur lors de l'analyse du CSV : {e}")
-        return None
\ No newline at end of file
+        return None
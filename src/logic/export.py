@@ -0,0 +1,525 @@
+"""
+Rapports d'export (CSV, JSON-lines, HTML statique) : validations, dates de
+déblocage des paliers et bilan par difficulté, pour un ou plusieurs plateaux.
+
+Tout est en flux : les sources lisent l'historique au fil du stockage (curseur
+SQLite, lecture incrémentale du snapshot JSON puis du journal), le rapport est
+un générateur d'enregistrements, et les écrivains les écrivent un par un.
+Aucune liste d'événements n'est construite : la mémoire dépend de la taille
+de la grille, pas du nombre de validations.
+
+    python -m bingoal --config data/bingoal.db export rapports/nuit --format csv --gzip
+"""
+import csv
+import gzip
+import heapq
+import html
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from array import array
+from collections import Counter
+
+from src.logic.historique import epoch_vers_date, historique_initial
+from src.logic.journal import JournalBingo
+from src.logic.moteur import DATE_LIMITE, POIDS_VALIDES
+from src.logic.score import ModeleScore
+from src.logic.stockage import est_sqlite
+
+FORMATS = ("csv", "jsonl", "html")
+TAILLE_BLOC = 64 * 1024
+TAILLE_TRI = 20_000  # Événements triés en mémoire à la fois ; au-delà, passes triées sur disque
+BLANCS = re.compile(r"[ \t\n\r]*")
+
+# Colonnes de chaque type d'enregistrement (un fichier par type en CSV)
+COLONNES = {
+    "plateau": ("plateau", "objectifs", "poids_total", "date_limite"),
+    "validation": ("plateau", "date", "ts", "case", "titre", "poids", "etat"),
+    "palier": ("plateau", "palier", "seuil", "date", "ts", "recompense"),
+    "difficulte": ("plateau", "poids", "objectifs", "valides", "poids_valide", "validations", "annulations"),
+}
+
+
+# --- Lecture incrémentale du snapshot JSON ---
+class FluxJSON:
+    """
+    Parcours d'un document JSON {clé: valeur} sans le charger en entier :
+    les valeurs sont décodées une par une dans un tampon de TAILLE_BLOC, et
+    les tableaux peuvent être parcourus élément par élément.
+    """
+    def __init__(self, f):
+        self.f = f
+        self.tampon = ""
+        self.pos = 0
+        self.decodeur = json.JSONDecoder()
+
+    def _remplir(self):
+        bloc = self.f.read(TAILLE_BLOC)
+        if not bloc:
+            return False
+        self.tampon = self.tampon[self.pos:] + bloc
+        self.pos = 0
+        return True
+
+    def _prochain(self):
+        """Premier caractère non blanc (sans le consommer), "" en fin de fichier."""
+        while True:
+            self.pos = BLANCS.match(self.tampon, self.pos).end()
+            if self.pos < len(self.tampon):
+                return self.tampon[self.pos]
+            if not self._remplir():
+                return ""
+
+    def _attendre(self, caractere):
+        if self._prochain() != caractere:
+            raise ValueError(f"JSON inattendu : '{caractere}' attendu à la position {self.pos}")
+        self.pos += 1
+
+    def valeur(self):
+        self._prochain()
+        while True:
+            try:
+                valeur, fin = self.decodeur.raw_decode(self.tampon, self.pos)
+                # Un nombre coupé en fin de tampon se décode aussi : on veut voir la suite
+                if fin < len(self.tampon):
+                    self.pos = fin
+                    return valeur
+            except json.JSONDecodeError:
+                fin = None
+            if not self._remplir():
+                if fin is None:
+                    raise ValueError("JSON tronqué")
+                self.pos = fin
+                return valeur
+
+    def elements(self):
+        """Parcourt un tableau élément par élément."""
+        self._attendre("[")
+        if self._prochain() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.valeur()
+            if self._prochain() == ",":
+                self.pos += 1
+            else:
+                self._attendre("]")
+                return
+
+    def cles(self):
+        """Clés de l'objet de premier niveau ; l'appelant lit chaque valeur (valeur() ou elements())."""
+        self._attendre("{")
+        if self._prochain() == "}":
+            return
+        while True:
+            cle = self.valeur()
+            self._attendre(":")
+            yield cle
+            if self._prochain() == ",":
+                self.pos += 1
+            else:
+                self._attendre("}")
+                return
+
+    def ignorer(self):
+        """Passe une valeur sans la garder (les tableaux sont parcourus, pas décodés d'un bloc)."""
+        if self._prochain() == "[":
+            for _ in self.elements():
+                pass
+        else:
+            self.valeur()
+
+
+# --- Tri chronologique en mémoire bornée ---
+def trier_par_date(evenements, taille=TAILLE_TRI):
+    """
+    (ts, index, valide) dans l'ordre chronologique ; à ts égal, dans l'ordre
+    d'arrivée (comme ORDER BY ts, id en SQLite). Une fusion d'un autre
+    appareil ajoute des bascules anciennes en fin d'historique : le flux est
+    trié par blocs de `taille` événements, les blocs pleins sont écrits sur
+    disque puis tous fusionnés (heapq.merge) : un seul événement par bloc
+    reste en mémoire.
+    """
+    bloc = []
+    passes = []
+    try:
+        for ordre, (ts, index, valide) in enumerate(evenements):
+            bloc.append((ts, ordre, index, int(valide)))
+            if len(bloc) >= taille:
+                bloc.sort()
+                passes.append(_ecrire_passe(bloc))
+                bloc = []
+        bloc.sort()
+        flux = heapq.merge(*map(_lire_passe, passes), bloc) if passes else bloc
+        for ts, _, index, valide in flux:
+            yield ts, index, bool(valide)
+    finally:
+        for f in passes:
+            f.close()
+
+
+def _ecrire_passe(bloc):
+    """Bloc trié -> fichier temporaire binaire (4 entiers 64 bits par événement)."""
+    f = tempfile.TemporaryFile()
+    valeurs = array("q")
+    for evenement in bloc:
+        valeurs.extend(evenement)
+    valeurs.tofile(f)
+    f.seek(0)
+    return f
+
+
+def _lire_passe(f):
+    while True:
+        valeurs = array("q")
+        try:
+            valeurs.fromfile(f, 4 * 1024)
+        except EOFError:
+            pass  # Dernier morceau, plus court
+        if not valeurs:
+            return
+        for i in range(0, len(valeurs), 4):
+            yield tuple(valeurs[i:i + 4])
+
+
+# --- Sources ---
+class SourceJSON:
+    """Un bingo_config.json (+ journal), lu en deux passes : en-tête puis historique."""
+    def __init__(self, chemin, nom):
+        self.chemin = chemin
+        self.nom = nom
+        self.journal = JournalBingo(chemin)
+        self.seq = 0
+        self.sans_historique = True  # Jusqu'à preuve du contraire (lire_entete)
+        self.migration = []
+
+    def lire_entete(self):
+        """Tout le document sauf l'historique ; les objectifs sont mis à jour par le journal."""
+        entete = {}
+        with open(self.chemin, "r", encoding="utf-8") as f:
+            flux = FluxJSON(f)
+            for cle in flux.cles():
+                if cle == "historique":
+                    flux.ignorer()
+                    self.sans_historique = False
+                elif cle == "objectifs":
+                    entete[cle] = list(flux.elements())
+                else:
+                    entete[cle] = flux.valeur()
+        self.seq = entete.get("seq", 0)
+        if self.sans_historique:
+            # Ancienne config : historique reconstruit depuis les dates de validation du snapshot
+            self.migration = historique_initial(entete.get("objectifs", []))
+        etat = {"seq": self.seq, "objectifs": entete.get("objectifs", [])}
+        for evenement in self.journal.lire_evenements():
+            # Sans "ts" : l'état des cases seulement, l'historique est relu par historique()
+            self.journal.appliquer(etat, {k: v for k, v in evenement.items() if k != "ts"})
+        return entete
+
+    def historique(self):
+        """(ts, index, valide) dans l'ordre chronologique, comme SourceSQLite."""
+        return trier_par_date(self._evenements())
+
+    def _evenements(self):
+        """Snapshot puis journal, dans l'ordre d'enregistrement."""
+        if self.sans_historique:
+            yield from self.migration
+        else:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                flux = FluxJSON(f)
+                for cle in flux.cles():
+                    if cle != "historique":
+                        flux.ignorer()
+                        continue
+                    for ts, index, valide in flux.elements():
+                        yield ts, index, valide
+        for evenement in self.journal.lire_evenements():
+            seq = evenement.get("seq")
+            if seq is not None and seq <= self.seq:
+                continue
+            if "ts" in evenement:
+                yield evenement["ts"], evenement["index"], evenement["valide"]
+
+
+class SourceSQLite:
+    """Un plateau d'une base SQLite ; l'historique est un curseur sur l'index (plateau_id, ts)."""
+    def __init__(self, chemin, nom):
+        self.chemin = chemin
+        self.nom = nom
+        self.plateau_id = None
+
+    def _connexion(self):
+        # Lecture seule, connexion propre à l'export (le curseur reste ouvert pendant l'écriture)
+        return sqlite3.connect(f"file:{os.path.abspath(self.chemin)}?mode=ro", uri=True)
+
+    def lire_entete(self):
+        connexion = self._connexion()
+        try:
+            self.plateau_id, document = connexion.execute(
+                "SELECT id, document FROM plateaux WHERE nom = ?", (self.nom,)).fetchone()
+            entete = json.loads(document)
+            entete["objectifs"] = [
+                {"titre": titre, "poids": poids, "valide": bool(valide)}
+                for titre, poids, valide in connexion.execute(
+                    "SELECT titre, poids, valide FROM objectifs WHERE plateau_id = ? ORDER BY position",
+                    (self.plateau_id,))
+            ]
+        finally:
+            connexion.close()
+        return entete
+
+    def historique(self):
+        connexion = self._connexion()
+        try:
+            for ts, position, valide in connexion.execute(
+                    "SELECT ts, position, valide FROM evenements WHERE plateau_id = ? ORDER BY ts, id",
+                    (self.plateau_id,)):
+                yield ts, position, bool(valide)
+        finally:
+            connexion.close()
+
+
+def lister_sources(chemin):
+    """
+    Plateaux à exporter : tous ceux d'une base SQLite, tous les
+    <dossier>/**/bingo_config.json d'un dossier, ou un seul fichier.
+    """
+    if est_sqlite(chemin):
+        connexion = sqlite3.connect(f"file:{os.path.abspath(chemin)}?mode=ro", uri=True)
+        try:
+            noms = [nom for (nom,) in connexion.execute("SELECT nom FROM plateaux ORDER BY nom")]
+        finally:
+            connexion.close()
+        for nom in noms:
+            yield SourceSQLite(chemin, nom)
+    elif os.path.isdir(chemin):
+        for racine, dossiers, fichiers in os.walk(chemin):
+            dossiers.sort()
+            if "bingo_config.json" in fichiers:
+                nom = os.path.relpath(racine, chemin).replace(os.sep, "/")
+                if nom == ".":
+                    # Config à la racine du dossier exporté : il donne son nom au plateau
+                    nom = os.path.basename(os.path.abspath(chemin))
+                yield SourceJSON(os.path.join(racine, "bingo_config.json"), nom)
+    else:
+        yield SourceJSON(chemin, os.path.splitext(os.path.basename(chemin))[0])
+
+
+# --- Rapport ---
+def generer_rapport(sources):
+    """
+    Enregistrements (type, dict) de chaque plateau, dans l'ordre :
+    "plateau", puis les "validation" au fil de l'historique (avec les
+    "palier" au moment où ils sont débloqués), puis un "difficulte" par poids.
+    """
+    for source in sources:
+        entete = source.lire_entete()
+        objectifs = entete.get("objectifs", [])
+        nb = len(objectifs)
+        nom = source.nom
+        yield "plateau", {
+            "plateau": nom,
+            "objectifs": nb,
+            "poids_total": sum(obj["poids"] for obj in objectifs),
+            "date_limite": entete.get("date_limite", DATE_LIMITE),
+        }
+
+        # Rejeu depuis une grille vierge : seules les vraies transitions comptent
+        score = ModeleScore([{"poids": obj["poids"], "valide": False} for obj in objectifs], entete.get("paliers"))
+        recompenses = entete.get("recompenses", {})
+        etats = bytearray(nb)
+        debloques = set()
+        validations = Counter()
+        annulations = Counter()
+
+        for ts, index, valide in source.historique():
+            if not 0 <= index < nb:
+                continue
+            obj = objectifs[index]
+            (validations if valide else annulations)[obj["poids"]] += 1
+            yield "validation", {
+                "plateau": nom,
+                "date": epoch_vers_date(ts),
+                "ts": ts,
+                "case": index + 1,
+                "titre": obj["titre"],
+                "poids": obj["poids"],
+                "etat": "validation" if valide else "annulation",
+            }
+            if etats[index] == valide:
+                continue
+            etats[index] = valide
+            ancien, nouveau = score.basculer(obj["poids"], valide)
+            if nouveau <= ancien:
+                continue
+            for palier in score.paliers_modifies(ancien, nouveau):
+                if palier in debloques:
+                    continue
+                debloques.add(palier)
+                yield "palier", {
+                    "plateau": nom,
+                    "palier": palier,
+                    "seuil": score.seuils[score.positions[palier]],
+                    "date": epoch_vers_date(ts),
+                    "ts": ts,
+                    "recompense": recompenses.get(palier, ""),
+                }
+
+        for poids in sorted(set(POIDS_VALIDES) | {obj["poids"] for obj in objectifs}):
+            du_poids = [obj for obj in objectifs if obj["poids"] == poids]
+            valides = sum(1 for obj in du_poids if obj["valide"])
+            yield "difficulte", {
+                "plateau": nom,
+                "poids": poids,
+                "objectifs": len(du_poids),
+                "valides": valides,
+                "poids_valide": valides * poids,
+                "validations": validations[poids],
+                "annulations": annulations[poids],
+            }
+
+
+# --- Écrivains ---
+def avec_extension(sortie, extension):
+    """`rapports/nuit` -> `rapports/nuit.html` (inchangé s'il a déjà l'extension)."""
+    return sortie if sortie.lower().endswith(extension) else sortie + extension
+
+
+def ouvrir_sortie(chemin, compresser):
+    dossier = os.path.dirname(chemin)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    if compresser:
+        return gzip.open(chemin + ".gz", "wt", encoding="utf-8", newline="")
+    return open(chemin, "w", encoding="utf-8", newline="")
+
+
+class EcrivainJSONL:
+    """Un seul fichier, une ligne JSON par enregistrement (avec son "type")."""
+    def __init__(self, sortie, compresser=False):
+        sortie = avec_extension(sortie, ".jsonl")
+        self.chemins = [sortie + (".gz" if compresser else "")]
+        self.f = ouvrir_sortie(sortie, compresser)
+
+    def ecrire(self, type_, enregistrement):
+        self.f.write(json.dumps({"type": type_, **enregistrement}, ensure_ascii=False))
+        self.f.write("\n")
+
+    def fermer(self):
+        self.f.close()
+
+
+class EcrivainCSV:
+    """Un CSV par type d'enregistrement : <sortie>-validation.csv, <sortie>-palier.csv..."""
+    def __init__(self, sortie, compresser=False):
+        self.base = os.path.splitext(sortie)[0] if sortie.endswith(".csv") else sortie
+        self.compresser = compresser
+        self.fichiers = {}
+        self.ecrivains = {}
+        self.chemins = []
+
+    def ecrire(self, type_, enregistrement):
+        ecrivain = self.ecrivains.get(type_)
+        if ecrivain is None:
+            chemin = f"{self.base}-{type_}.csv"
+            self.fichiers[type_] = ouvrir_sortie(chemin, self.compresser)
+            ecrivain = csv.DictWriter(self.fichiers[type_], fieldnames=COLONNES[type_])
+            ecrivain.writeheader()
+            self.ecrivains[type_] = ecrivain
+            self.chemins.append(chemin + (".gz" if self.compresser else ""))
+        ecrivain.writerow(enregistrement)
+
+    def fermer(self):
+        for f in self.fichiers.values():
+            f.close()
+
+
+class EcrivainHTML:
+    """
+    Une page statique, une section par plateau. Les lignes de validation sont
+    écrites au fil de l'eau ; les paliers débloqués (au plus un par palier)
+    sont retenus et affichés sous le tableau des validations.
+    """
+    def __init__(self, sortie, compresser=False):
+        if not sortie.lower().endswith(".htm"):
+            sortie = avec_extension(sortie, ".html")
+        self.chemins = [sortie + (".gz" if compresser else "")]
+        self.f = ouvrir_sortie(sortie, compresser)
+        self.table = None
+        self.paliers = []
+        self.f.write(
+            "<!DOCTYPE html>\n<html lang=\"fr\"><head><meta charset=\"utf-8\"><title>Bingoal - Rapport</title>\n"
+            "<style>body{font-family:Arial,sans-serif;margin:2em;background:#1a1a1a;color:#eee}"
+            "table{border-collapse:collapse;margin-bottom:1.5em}td,th{border:1px solid #444;padding:4px 8px}"
+            "th{background:#2b2b2b}.annulation{color:#888}</style></head><body>\n<h1>Bingoal - Rapport</h1>\n"
+        )
+
+    def _ouvrir_table(self, type_, titre):
+        self._fermer_table()
+        colonnes = COLONNES[type_][1:]  # Le plateau est le titre de la section
+        self.f.write(f"<h3>{titre}</h3>\n<table><tr>{''.join(f'<th>{c}</th>' for c in colonnes)}</tr>\n")
+        self.table = type_
+
+    def _fermer_table(self):
+        if self.table is not None:
+            self.f.write("</table>\n")
+            self.table = None
+
+    def _ligne(self, type_, enregistrement, classe=None):
+        cellules = "".join(
+            f"<td>{html.escape('' if enregistrement[c] is None else str(enregistrement[c]))}</td>"
+            for c in COLONNES[type_][1:]
+        )
+        attribut = f' class="{classe}"' if classe else ""
+        self.f.write(f"<tr{attribut}>{cellules}</tr>\n")
+
+    def _ecrire_paliers(self):
+        if self.paliers:
+            self._ouvrir_table("palier", "Paliers débloqués")
+            for palier in self.paliers:
+                self._ligne("palier", palier)
+            self.paliers = []
+        self._fermer_table()
+
+    def ecrire(self, type_, enregistrement):
+        if type_ == "plateau":
+            self._ecrire_paliers()
+            self.f.write(
+                f"<h2>{html.escape(enregistrement['plateau'])}</h2>\n"
+                f"<p>{enregistrement['objectifs']} objectifs, {enregistrement['poids_total']} points"
+                f" - date limite : {html.escape(str(enregistrement['date_limite']))}</p>\n"
+            )
+        elif type_ == "validation":
+            if self.table != "validation":
+                self._ouvrir_table("validation", "Validations")
+            self._ligne("validation", enregistrement, "annulation" if enregistrement["etat"] == "annulation" else None)
+        elif type_ == "palier":
+            self.paliers.append(enregistrement)
+        else:
+            if self.table != "difficulte":
+                self._ecrire_paliers()
+                self._ouvrir_table("difficulte", "Par difficulté")
+            self._ligne("difficulte", enregistrement)
+
+    def fermer(self):
+        self._ecrire_paliers()
+        self.f.write("</body></html>\n")
+        self.f.close()
+
+
+ECRIVAINS = {"csv": EcrivainCSV, "jsonl": EcrivainJSONL, "html": EcrivainHTML}
+
+
+def exporter(chemin_source, sortie, format_="jsonl", compresser=False):
+    """Écrit le rapport de tous les plateaux de `chemin_source`. Renvoie (fichiers écrits, nb par type)."""
+    ecrivain = ECRIVAINS[format_](sortie, compresser)
+    compteurs = Counter()
+    try:
+        for type_, enregistrement in generer_rapport(lister_sources(chemin_source)):
+            ecrivain.ecrire(type_, enregistrement)
+            compteurs[type_] += 1
+    finally:
+        ecrivain.fermer()
+    return ecrivain.chemins, compteurs
@@ -0,0 +1,99 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+FORMAT_DATE = "%Y-%m-%d %H:%M:%S"
+UN_JOUR = 86400
+
+
+def date_vers_epoch(date_validation):
+    """'2026-01-14 18:30:00' -> horodatage epoch (secondes, heure locale)."""
+    return int(datetime.strptime(date_validation, FORMAT_DATE).timestamp())
+
+
+def epoch_vers_date(ts):
+    return datetime.fromtimestamp(ts).strftime(FORMAT_DATE)
+
+
+def historique_initial(objectifs):
+    """
+    Migration des anciennes configs sans "historique" : une validation par
+    objectif actuellement coché, datée de son date_validation.
+    """
+    evenements = []
+    for i, obj in enumerate(objectifs):
+        if obj.get('valide') and obj.get('date_validation'):
+            try:
+                evenements.append([date_vers_epoch(obj['date_validation']), i, True])
+            except ValueError:
+                continue
+    evenements.sort()
+    return evenements
+
+
+class HistoriqueValidations:
+    """
+    Historique complet des validations / annulations, trié par horodatage.
+
+    Trois tableaux parallèles compacts (horodatage, index, état). Un nouvel
+    événement est inséré à sa place par bisection (en pratique un ajout en
+    fin de tableau), les requêtes par plage de dates sont deux bisections
+    puis une lecture directe des positions : aucun tri complet.
+    """
+    def __init__(self, evenements=()):
+        self.horodatages = array('q')
+        self.index = array('l')
+        self.etats = bytearray()
+        # Tri stable en une passe (les égalités gardent leur ordre, comme avec
+        # ajouter()) : insérer un à un un historique désordonné serait quadratique.
+        for ts, index, valide in sorted(evenements, key=lambda e: e[0]):
+            self.horodatages.append(ts)
+            self.index.append(index)
+            self.etats.append(valide)
+
+    def __len__(self):
+        return len(self.horodatages)
+
+    def __getitem__(self, position):
+        """Événement n° `position` (0 = le plus ancien) : (ts, index, valide)."""
+        return self.horodatages[position], self.index[position], bool(self.etats[position])
+
+    def ajouter(self, ts, index, valide):
+        pos = bisect_right(self.horodatages, ts)
+        if pos == len(self.horodatages):
+            self.horodatages.append(ts)
+            self.index.append(index)
+            self.etats.append(valide)
+        else:
+            self.horodatages.insert(pos, ts)
+            self.index.insert(pos, index)
+            self.etats.insert(pos, valide)
+        return pos
+
+    # --- Requêtes par plage ---
+    def plage(self, debut=None, fin=None):
+        """Positions [lo, hi) des événements avec debut <= ts < fin."""
+        lo = 0 if debut is None else bisect_left(self.horodatages, debut)
+        hi = len(self.horodatages) if fin is None else bisect_left(self.horodatages, fin)
+        return lo, max(lo, hi)
+
+    def entre(self, debut=None, fin=None, validations_seules=False):
+        """Itère sur les événements de la plage, du plus ancien au plus récent."""
+        lo, hi = self.plage(debut, fin)
+        for pos in range(lo, hi):
+            if validations_seules and not self.etats[pos]:
+                continue
+            yield self[pos]
+
+    def derniers_jours(self, jours, maintenant=None):
+        maintenant = int(time.time() if maintenant is None else maintenant)
+        return self.plage(maintenant - jours * UN_JOUR, None)
+
+    def mois(self, annee, mois):
+        debut = int(datetime(annee, mois, 1).timestamp())
+        suivant = datetime(annee + (mois == 12), mois % 12 + 1, 1)
+        return self.plage(debut, int(suivant.timestamp()))
+
+    def annee(self, annee):
+        return self.plage(int(datetime(annee, 1, 1).timestamp()), int(datetime(annee + 1, 1, 1).timestamp()))
@@ -0,0 +1,152 @@
+"""
+Import en masse d'un dossier de feuilles CSV (une par équipe).
+
+Les CSV sont analysés en parallèle dans un pool de processus, validés, puis
+écrits dans le stockage par lots :
+
+- destination .db/.sqlite : une transaction par lot de `taille_lot` plateaux
+- sinon : un dossier `<destination>/<nom>/bingo_config.json` par plateau
+  (la forme attendue par batch.charger_lots)
+
+Le nom d'un plateau est le chemin relatif du CSV sans extension
+("equipes/alpha.csv" -> "equipes/alpha"). Chaque feuille rejetée apparaît
+dans le rapport avec la liste de ses erreurs.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.logic.data_manager import COLONNES_GRILLE, LIGNES_GRILLE, PALIERS, extraire_donnees_csv, lire_cellules
+from src.logic.journal import JournalBingo
+from src.logic.moteur import creer_configuration
+from src.logic.stockage import StockageSQLite, est_sqlite
+
+NB_OBJECTIFS_ATTENDU = 25
+TAILLE_LOT = 500            # Plateaux écrits par transaction SQLite
+
+
+def lister_feuilles(dossier):
+    """Tous les .csv du dossier (sous-dossiers compris), dans un ordre stable."""
+    chemins = []
+    for racine, sous_dossiers, fichiers in os.walk(dossier):
+        sous_dossiers.sort()
+        chemins.extend(os.path.join(racine, f) for f in sorted(fichiers) if f.lower().endswith(".csv"))
+    return chemins
+
+
+def nom_plateau(chemin, dossier):
+    relatif = os.path.relpath(chemin, dossier)
+    return os.path.splitext(relatif)[0].replace(os.sep, "/")
+
+
+def cases_vides(chemin):
+    """Positions (ligne, colonne) des cases vides de la grille, numérotées à partir de 1."""
+    debut_grille, fin_grille = LIGNES_GRILLE
+    col_debut, col_fin = COLONNES_GRILLE
+    vides = []
+    for num_ligne, cellules in enumerate(islice(lire_cellules(chemin), fin_grille)):
+        if num_ligne < debut_grille:
+            continue
+        for num_col, cellule in enumerate(cellules[col_debut:col_fin]):
+            if not cellule or cellule.lower() == "nan":
+                vides.append((num_ligne - debut_grille + 1, num_col + 1))
+    return vides
+
+
+def analyser_feuille(chemin):
+    """
+    Exécuté dans un processus du pool : analyse et valide une feuille.
+    Renvoie {"chemin", "donnees" (None si rejetée), "erreurs"}.
+    """
+    erreurs = []
+    try:
+        extrait = extraire_donnees_csv(chemin)
+        if extrait is None:
+            return {"chemin": chemin, "donnees": None, "erreurs": ["Fichier illisible"]}
+
+        nb_objectifs = len(extrait["objectifs"])
+        if nb_objectifs != NB_OBJECTIFS_ATTENDU:
+            erreurs.append(f"{nb_objectifs} objectifs trouvés ({NB_OBJECTIFS_ATTENDU} attendus)")
+        manquants = [palier for palier in PALIERS if not extrait["recompenses"].get(palier)]
+        if manquants:
+            erreurs.append(f"Paliers manquants : {', '.join(manquants)}")
+        for ligne, colonne in cases_vides(chemin):
+            erreurs.append(f"Case vide : ligne {ligne}, colonne {colonne}")
+    except Exception as e:
+        erreurs.append(f"Erreur d'analyse : {e}")
+
+    if erreurs:
+        return {"chemin": chemin, "donnees": None, "erreurs": erreurs}
+    donnees = creer_configuration(extrait["objectifs"], extrait["recompenses"])
+    return {"chemin": chemin, "donnees": donnees, "erreurs": []}
+
+
+class EcrivainJSON:
+    """
+    Un bingo_config.json par plateau, dans son propre dossier. Un plateau
+    réimporté est remplacé en entier : l'ancien journal est supprimé avec,
+    sinon ses clics seraient rejoués sur la nouvelle grille.
+    """
+    def __init__(self, destination):
+        self.destination = destination
+
+    def ecrire(self, lot):
+        for nom, donnees in lot:
+            JournalBingo(os.path.join(self.destination, nom, "bingo_config.json")).compacter(donnees, forcer=True)
+
+    def fermer(self):
+        pass
+
+
+class EcrivainSQLite:
+    """Tous les plateaux dans la même base, un lot = une transaction."""
+    def __init__(self, destination):
+        self.stockage = StockageSQLite(destination)
+
+    def ecrire(self, lot):
+        self.stockage.remplacer_plateaux(lot)
+
+    def fermer(self):
+        self.stockage.fermer()
+
+
+def importer_dossier(dossier, destination, nb_processus=None, taille_lot=TAILLE_LOT):
+    """
+    Importe toutes les feuilles de `dossier` dans `destination`.
+    Renvoie le rapport {"total", "importes", "erreurs": {chemin: [messages]}}.
+    """
+    chemins = lister_feuilles(dossier)
+    rapport = {"total": len(chemins), "importes": 0, "erreurs": {}}
+    if not chemins:
+        return rapport
+
+    nb_processus = nb_processus or os.cpu_count() or 1
+    # Des paquets de feuilles par processus : moins d'allers-retours entre processus
+    paquet = max(1, len(chemins) // (nb_processus * 4))
+    ecrivain = EcrivainSQLite(destination) if est_sqlite(destination) else EcrivainJSON(destination)
+
+    def ecrire(lot):
+        try:
+            ecrivain.ecrire([(nom, donnees) for nom, _, donnees in lot])
+            rapport["importes"] += len(lot)
+        except Exception as e:
+            for _, chemin, _ in lot:
+                rapport["erreurs"][chemin] = [f"Erreur d'écriture : {e}"]
+
+    try:
+        lot = []
+        with ProcessPoolExecutor(max_workers=nb_processus) as pool:
+            for resultat in pool.map(analyser_feuille, chemins, chunksize=paquet):
+                chemin = resultat["chemin"]
+                if resultat["erreurs"]:
+                    rapport["erreurs"][chemin] = resultat["erreurs"]
+                    continue
+                lot.append((nom_plateau(chemin, dossier), chemin, resultat["donnees"]))
+                if len(lot) >= taille_lot:
+                    ecrire(lot)
+                    lot = []
+        if lot:
+            ecrire(lot)
+    finally:
+        ecrivain.fermer()
+    return rapport
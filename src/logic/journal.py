@@ -0,0 +1,215 @@
+import json
+import os
+
+from src.logic.historique import historique_initial
+
+SEUIL_COMPACTION = 200  # Nombre d'événements avant de replier le journal dans le snapshot
+
+
+class ConflitEcriture(Exception):
+    """Le stockage a été modifié par un autre processus depuis notre dernière lecture."""
+
+
+def empreinte_fichier(chemin):
+    """(mtime_ns, taille) du fichier, ou None s'il n'existe pas."""
+    try:
+        stat = os.stat(chemin)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def ecrire_json_atomique(chemin, donnees):
+    """
+    Écrit un document JSON sans jamais laisser de fichier à moitié écrit :
+    fichier temporaire + fsync, puis renommage atomique sur la cible.
+    """
+    dossier = os.path.dirname(chemin) or "."
+    os.makedirs(dossier, exist_ok=True)
+    tmp = chemin + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(donnees, f, indent=4, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, chemin)
+
+
+class JournalBingo:
+    """
+    Persistance "snapshot + journal" de la configuration du Bingo.
+
+    - Le snapshot est le bingo_config.json habituel.
+    - Chaque clic ajoute UNE ligne JSON au journal (bingo_config.json.journal)
+      décrivant l'état final de la case (pas une inversion), le rejeu est donc
+      idempotent.
+    - Au-delà de `seuil_compaction` lignes, le journal est replié dans le
+      snapshot puis vidé.
+
+    Versions : le snapshot porte un numéro de "revision" (incrémenté à chaque
+    compaction) et chaque événement un "seq". L'empreinte (mtime, taille) des
+    deux fichiers est retenue après chaque lecture / écriture : si elle a
+    changé entre-temps, un autre processus a écrit, et l'écriture suivante
+    lève ConflitEcriture au lieu d'écraser (ou de masquer) ses changements.
+    """
+    def __init__(self, chemin_config, seuil_compaction=SEUIL_COMPACTION):
+        self.chemin_config = chemin_config
+        self.chemin_journal = chemin_config + ".journal"
+        self.seuil_compaction = seuil_compaction
+        self.nb_evenements = 0
+        self.revision = 0
+        self.empreinte = None  # Empreinte des fichiers après notre dernière lecture / écriture
+
+    def existe(self):
+        return os.path.exists(self.chemin_config)
+
+    def fichiers(self):
+        """Fichiers à surveiller pour voir les écritures des autres processus."""
+        return [self.chemin_config, self.chemin_journal]
+
+    def empreinte_fichiers(self):
+        return empreinte_fichier(self.chemin_config), empreinte_fichier(self.chemin_journal)
+
+    def a_change(self):
+        """Vrai si un autre processus a écrit depuis notre dernière lecture / écriture."""
+        return self.empreinte is not None and self.empreinte_fichiers() != self.empreinte
+
+    def verifier_version(self):
+        if self.a_change():
+            raise ConflitEcriture(f"{self.chemin_config} modifié par un autre processus")
+
+    def charger(self):
+        """Lit le snapshot puis rejoue le journal par-dessus (et le replie au-delà du seuil)."""
+        donnees = self.lire()
+        if self.doit_compacter():
+            self.compacter(donnees)
+        return donnees
+
+    def lire(self):
+        """
+        Comme charger(), sans jamais écrire : pour les lecteurs (classements,
+        scripts) qui ne doivent pas compacter le plateau d'un autre utilisateur.
+        """
+        empreinte = self.empreinte_fichiers()
+        with open(self.chemin_config, "r", encoding="utf-8") as f:
+            donnees = json.load(f)
+        # Anciennes configs : l'historique est reconstruit depuis les dates de validation
+        if "historique" not in donnees:
+            donnees["historique"] = historique_initial(donnees.get("objectifs", []))
+
+        self.nb_evenements = 0
+        for evenement in self.lire_evenements():
+            self.appliquer(donnees, evenement)
+            self.nb_evenements += 1
+
+        self.revision = donnees.get("revision", 0)
+        self.empreinte = empreinte
+        return donnees
+
+    def lire_evenements(self):
+        """Parcourt le journal. Une dernière ligne tronquée (crash) est ignorée."""
+        if not os.path.exists(self.chemin_journal):
+            return
+        with open(self.chemin_journal, "r", encoding="utf-8") as f:
+            for ligne in f:
+                try:
+                    yield json.loads(ligne)
+                except json.JSONDecodeError:
+                    break
+
+    @staticmethod
+    def appliquer(donnees, evenement):
+        """
+        Applique un événement de bascule sur le document en mémoire.
+        Les événements numérotés ("seq") déjà contenus dans le snapshot sont
+        ignorés : rejouer le journal après un crash ne duplique pas l'historique.
+        Un événement "historique_seul" (bascule plus ancienne venue d'un autre
+        appareil, voir synchro.py) est historisé sans changer la case.
+        """
+        seq = evenement.get("seq")
+        if seq is not None:
+            if seq <= donnees.get("seq", 0):
+                return
+            donnees["seq"] = seq
+
+        objectifs = donnees.get("objectifs", [])
+        index = evenement.get("index")
+        if isinstance(index, int) and 0 <= index < len(objectifs):
+            if not evenement.get("historique_seul"):
+                objectifs[index]["valide"] = evenement["valide"]
+                objectifs[index]["date_validation"] = evenement.get("date_validation")
+            if "ts" in evenement:
+                donnees.setdefault("historique", []).append([evenement["ts"], index, evenement["valide"]])
+
+    def enregistrer_bascule(self, index, valide, date_validation, donnees=None):
+        """
+        Ajoute un événement au journal (coût constant, indépendant de la taille
+        du document). Si `donnees` est fourni, la compaction périodique est
+        déclenchée une fois le seuil atteint.
+        """
+        self.enregistrer_lot([{"index": index, "valide": valide, "date_validation": date_validation}])
+
+        if donnees is not None and self.doit_compacter():
+            self.compacter(donnees)
+
+    def enregistrer_lot(self, evenements):
+        """Ajoute plusieurs événements au journal en une seule écriture + fsync."""
+        self.verifier_version()
+        self._reparer_fin()
+        bloc = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in evenements)
+        with open(self.chemin_journal, "a", encoding="utf-8") as f:
+            f.write(bloc)
+            f.flush()
+            os.fsync(f.fileno())
+        self.nb_evenements += len(evenements)
+        self.empreinte = self.empreinte_fichiers()
+
+    def _reparer_fin(self):
+        """
+        Un crash peut laisser une dernière ligne sans "\n" : lire_evenements
+        s'arrête dessus. Ajouter derrière collerait les nouveaux événements
+        à ce morceau, et ils seraient perdus au prochain chargement. La ligne
+        est terminée si elle est lisible, coupée sinon (elle n'a jamais été
+        rejouée, son "seq" est libre).
+        """
+        try:
+            f = open(self.chemin_journal, "r+b")
+        except FileNotFoundError:
+            return
+        with f:
+            taille = f.seek(0, os.SEEK_END)
+            if taille == 0:
+                return
+            f.seek(taille - 1)
+            if f.read(1) == b"\n":
+                return
+            f.seek(0)
+            contenu = f.read()  # Cas rare (après un crash), journal borné par la compaction
+            debut = contenu.rfind(b"\n") + 1
+            try:
+                json.loads(contenu[debut:].decode("utf-8"))
+            except ValueError:
+                f.truncate(debut)
+            else:
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def doit_compacter(self):
+        return self.nb_evenements >= self.seuil_compaction
+
+    def compacter(self, donnees, forcer=False):
+        """
+        Replie l'état courant dans le snapshot (écriture atomique) puis vide le
+        journal. Un crash entre les deux étapes est sans danger : le rejeu des
+        événements restants redonne le même état.
+        `forcer` : remplacement voulu (nouvelle grille), sans contrôle de version.
+        """
+        if not forcer:
+            self.verifier_version()
+        self.revision += 1
+        donnees["revision"] = self.revision
+        ecrire_json_atomique(self.chemin_config, donnees)
+        if os.path.exists(self.chemin_journal):
+            os.remove(self.chemin_journal)
+        self.nb_evenements = 0
+        self.empreinte = self.empreinte_fichiers()
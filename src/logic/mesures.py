@@ -0,0 +1,127 @@
+"""
+Mesure de latence par action (chargement, analyse, sauvegarde, rendu,
+navigation).
+
+    from src.logic.mesures import mesures
+
+    with mesures.span("save"):
+        ...
+
+Les spans terminés vont dans un tampon circulaire (les `capacite` derniers)
+et, si BINGOAL_TRACE=trace.jsonl est défini, dans un fichier JSON-lines.
+Tant que rien n'est activé (ni trace, ni overlay), `span()` renvoie un objet
+neutre partagé : ni horloge, ni allocation.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+
+CAPACITE_TAMPON = 2000
+
+
+class _SpanInactif:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+SPAN_INACTIF = _SpanInactif()
+
+
+class _Span:
+    __slots__ = ("mesures", "nom", "debut")
+
+    def __init__(self, mesures, nom):
+        self.mesures = mesures
+        self.nom = nom
+
+    def __enter__(self):
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.mesures.enregistrer(self.nom, self.debut, time.perf_counter() - self.debut)
+        return False
+
+
+def centile(valeurs_triees, p):
+    """Centile p (0-100) par rang le plus proche, sur une liste déjà triée."""
+    if not valeurs_triees:
+        return 0.0
+    rang = max(0, min(len(valeurs_triees) - 1, round(p / 100 * len(valeurs_triees)) - 1))
+    return valeurs_triees[rang]
+
+
+class Mesures:
+    def __init__(self, capacite=CAPACITE_TAMPON):
+        self.tampon = deque(maxlen=capacite)  # (nom, epoch de début, durée en s, thread)
+        self.actif = False
+        self.demandeurs = set()               # "overlay", "trace"... : actif tant qu'il en reste un
+        self._trace = None
+        self._verrou = threading.Lock()
+        # Décalage perf_counter -> heure murale, pour des horodatages lisibles dans la trace
+        self._origine = time.time() - time.perf_counter()
+
+    # --- Activation ---
+    def activer(self, demandeur):
+        self.demandeurs.add(demandeur)
+        self.actif = True
+
+    def desactiver(self, demandeur):
+        self.demandeurs.discard(demandeur)
+        self.actif = bool(self.demandeurs)
+
+    def ouvrir_trace(self, chemin):
+        with self._verrou:
+            self._trace = open(chemin, "a", encoding="utf-8")
+        atexit.register(self.fermer_trace)
+        self.activer("trace")
+
+    def fermer_trace(self):
+        with self._verrou:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
+        self.desactiver("trace")
+
+    # --- Mesure ---
+    def span(self, nom):
+        if not self.actif:
+            return SPAN_INACTIF
+        return _Span(self, nom)
+
+    def enregistrer(self, nom, debut, duree):
+        entree = (nom, self._origine + debut, duree, threading.current_thread().name)
+        self.tampon.append(entree)  # deque.append est atomique
+        if self._trace is not None:
+            ligne = json.dumps({"nom": nom, "ts": round(entree[1], 6), "duree_ms": round(duree * 1000, 3),
+                                "thread": entree[3]}) + "\n"
+            with self._verrou:
+                if self._trace is not None:
+                    self._trace.write(ligne)
+
+    # --- Lecture ---
+    def statistiques(self):
+        """{nom: {"n", "p50_ms", "p95_ms", "max_ms"}} sur le contenu du tampon."""
+        durees = {}
+        for nom, _, duree, _ in list(self.tampon):
+            durees.setdefault(nom, []).append(duree * 1000)
+        stats = {}
+        for nom, valeurs in sorted(durees.items()):
+            valeurs.sort()
+            stats[nom] = {"n": len(valeurs), "p50_ms": centile(valeurs, 50),
+                          "p95_ms": centile(valeurs, 95), "max_ms": valeurs[-1]}
+        return stats
+
+
+# Instance partagée par toute l'application
+mesures = Mesures()
+if os.environ.get("BINGOAL_TRACE"):
+    mesures.ouvrir_trace(os.environ["BINGOAL_TRACE"])
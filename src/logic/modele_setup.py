@@ -0,0 +1,87 @@
+"""
+Modèle de l'éditeur de grille (Phase 1), indépendant des widgets.
+
+Les saisies vont ici, pas dans les champs : l'écran de setup ne crée que les
+lignes visibles et les recycle, et la configuration finale est produite en
+un seul passage sur ce modèle.
+"""
+from src.logic.moteur import POIDS_VALIDES
+
+TAILLES_GRILLE = (5, 7, 10, 15, 20, 30, 50)  # Tailles proposées (grille NxN)
+TAILLE_PAR_DEFAUT = 5
+
+
+def lire_poids(cellule):
+    """'2', '★★', '**' -> 2 ; None si la cellule n'est pas une difficulté."""
+    cellule = cellule.strip()
+    if cellule.isdigit():
+        poids = int(cellule)
+    elif cellule and set(cellule) <= {"★", "*", "☆"}:
+        poids = cellule.count("★") + cellule.count("*")
+    else:
+        return None
+    return poids if poids in POIDS_VALIDES else None
+
+
+class ModeleSetup:
+    def __init__(self, objectifs=(), taille=TAILLE_PAR_DEFAUT):
+        self.taille = taille
+        self.titres = []
+        self.poids = []
+        for obj in objectifs:
+            self.titres.append(obj.get("titre", ""))
+            poids = obj.get("poids", 1)
+            self.poids.append(poids if poids in POIDS_VALIDES else 1)
+        self.redimensionner(taille)
+
+    def __len__(self):
+        return self.taille * self.taille
+
+    def redimensionner(self, taille):
+        """Change la taille de la grille ; les saisies au-delà sont conservées (retour arrière possible)."""
+        self.taille = taille
+        manque = len(self) - len(self.titres)
+        if manque > 0:
+            self.titres.extend([""] * manque)
+            self.poids.extend([1] * manque)
+
+    def definir_titre(self, index, titre):
+        self.titres[index] = titre
+
+    def definir_poids(self, index, poids):
+        self.poids[index] = poids if poids in POIDS_VALIDES else 1
+
+    def coller(self, texte, debut=0):
+        """
+        Colle une liste d'objectifs (une ligne par objectif) à partir de la
+        case `debut`. Colonnes séparées par des tabulations (copie depuis un
+        tableur) : le titre, puis éventuellement la difficulté (2, ★★...).
+        Seule la deuxième colonne peut être une difficulté : un titre qui
+        ressemble à un nombre ("2026") reste un titre.
+        La grille grandit si besoin. Renvoie le nombre d'objectifs collés.
+        """
+        lignes = []
+        for ligne in texte.splitlines():
+            cellules = [c.strip() for c in ligne.split("\t")]
+            titre = cellules[0]
+            if not titre:
+                continue
+            poids = lire_poids(cellules[1]) if len(cellules) > 1 else None
+            lignes.append((titre, poids))
+
+        fin = debut + len(lignes)
+        if fin > len(self):
+            taille = next((t for t in TAILLES_GRILLE if t * t >= fin), TAILLES_GRILLE[-1])
+            self.redimensionner(max(taille, self.taille))
+            lignes = lignes[:len(self) - debut]
+
+        for i, (titre, poids) in enumerate(lignes, start=debut):
+            self.titres[i] = titre
+            if poids is not None:
+                self.poids[i] = poids
+        return len(lignes)
+
+    def vers_objectifs(self):
+        """Les objectifs de la grille, en une passe."""
+        nb = len(self)
+        return [{"titre": titre, "poids": poids} for titre, poids in zip(self.titres[:nb], self.poids[:nb])]
@@ -0,0 +1,71 @@
+"""
+Moteur du Bingo sans interface graphique : géométrie de la grille, date
+limite, construction de la configuration et résumé de l'état d'un plateau.
+Aucune dépendance à CustomTkinter : utilisable depuis un script, un cron ou
+la ligne de commande (python -m bingoal).
+"""
+import math
+from datetime import date, datetime
+
+DATE_LIMITE = "2026-12-31"  # Fin du Bingo par défaut (surchargeable par "date_limite")
+POIDS_VALIDES = (1, 2, 3)
+
+
+def taille_grille(donnees):
+    """Taille N de la grille NxN (config, sinon déduite du nombre d'objectifs)."""
+    return donnees.get("taille_grille") or max(1, math.ceil(math.sqrt(len(donnees.get("objectifs", [])))))
+
+
+def date_limite(donnees=None):
+    return datetime.strptime((donnees or {}).get("date_limite", DATE_LIMITE), "%Y-%m-%d")
+
+
+def jours_restants(donnees=None, maintenant=None):
+    """Compte à rebours J-XXX jusqu'à la date limite (0 = terminé)."""
+    delta = date_limite(donnees) - (maintenant or datetime.now())
+    return max(0, delta.days)
+
+
+def creer_configuration(objectifs, recompenses, date_creation=None, **options):
+    """
+    Construit le document bingo_config.json d'une nouvelle grille.
+    `objectifs` : liste de {"titre", "poids"} ; les options (taille_grille,
+    paliers, motifs, date_limite...) sont recopiées telles quelles.
+    """
+    liste = []
+    for obj in objectifs:
+        poids = obj.get("poids", 1)
+        liste.append({
+            "titre": obj.get("titre", ""),
+            "poids": poids if poids in POIDS_VALIDES else 1,
+            "valide": False,
+            "date_validation": None
+        })
+
+    donnees = {
+        "version": "1.0",
+        "objectifs": liste,
+        "recompenses": dict(recompenses),
+        "stats": {
+            "total_poids": sum(obj["poids"] for obj in liste),
+            "date_creation": (date_creation or date.today()).isoformat()
+        }
+    }
+    donnees.update(options)
+    return donnees
+
+
+def statut(store):
+    """Résumé de l'état d'un plateau chargé (dictionnaire sérialisable)."""
+    score = store.score
+    return {
+        "progression": round(score.ratio * 100, 1),
+        "poids_valide": score.poids_valide,
+        "poids_total": score.poids_total,
+        "palier": score.palier_courant(),
+        "lignes": store.victoire.lignes_completes,
+        "motifs": sorted(store.victoire.completes),
+        "valides": sum(1 for obj in store.objectifs if obj['valide']),
+        "objectifs": len(store.objectifs),
+        "jours_restants": jours_restants(store.donnees),
+    }
@@ -0,0 +1,250 @@
+import copy
+import sqlite3
+import threading
+import time
+
+from src.logic.journal import ConflitEcriture
+from src.logic.mesures import mesures
+
+DELAI_REGROUPEMENT = 0.3  # Secondes de calme avant d'écrire une rafale de clics
+DELAI_REESSAI = 1.0       # Secondes avant de réessayer une écriture en échec (base verrouillée...)
+
+
+def compacter_si_possible(stockage, donnees):
+    """Compaction après un lot déjà écrit : en cas de conflit, elle attendra la synchronisation."""
+    try:
+        stockage.compacter(donnees)
+    except ConflitEcriture:
+        pass
+
+
+class ServicePersistance:
+    """
+    Écrit les bascules du Bingo (journal JSON ou SQLite) sur un thread de fond.
+
+    L'IHM dépose les bascules avec `soumettre()` (coût constant, aucun accès
+    disque sur le thread Tk). Le thread attend `delai` secondes sans nouveau
+    clic, puis écrit toute la rafale en une seule fois. Le service garde sa
+    propre copie du document pour les compactions, l'IHM peut donc continuer
+    à modifier ses données pendant l'écriture.
+
+    Si le stockage a été modifié par un autre processus, les événements ne
+    sont pas écrits (pas d'écrasement) : ils sont mis de côté jusqu'à ce
+    que BoardStore.synchroniser() les rejoue sur la nouvelle version.
+
+    Une écriture en échec (disque plein, base SQLite verrouillée par un
+    autre processus...) est réessayée toutes les DELAI_REESSAI secondes :
+    le lot reste en tête de file, rien n'est perdu tant que l'application
+    tourne.
+    """
+    def __init__(self, stockage, donnees, delai=DELAI_REGROUPEMENT):
+        self.stockage = stockage
+        self.delai = delai
+        self._donnees = copy.deepcopy(donnees)
+
+        self._cond = threading.Condition()
+        self._en_attente = []
+        self._dernier_depot = 0.0
+        self._urgent = False
+        self._actif = True
+        self._conflits = []  # Événements refusés pour conflit de version
+        self._erreur = None  # Dernière erreur d'écriture (None une fois l'écriture rétablie)
+        self._nb_echecs = 0
+
+        # Compteurs exposés par metriques()
+        self._nb_soumis = 0
+        self._nb_ecrits = 0
+        self._nb_ecritures = 0
+        self._derniere_latence = 0.0
+
+        self._thread = threading.Thread(target=self._boucle, name="bingoal-persistance", daemon=True)
+        self._thread.start()
+
+    # --- API côté IHM ---
+    def soumettre(self, evenement):
+        """Dépose un événement de bascule ; l'écriture aura lieu plus tard."""
+        with self._cond:
+            self._en_attente.append(evenement)
+            self._nb_soumis += 1
+            self._dernier_depot = time.monotonic()
+            self._cond.notify_all()
+
+    def soumettre_lot(self, evenements):
+        """Dépose plusieurs événements d'un coup (fusion d'une synchronisation)."""
+        with self._cond:
+            self._en_attente.extend(evenements)
+            self._nb_soumis += len(evenements)
+            self._dernier_depot = time.monotonic()
+            self._cond.notify_all()
+
+    def vider(self, timeout=5.0):
+        """
+        Force l'écriture immédiate de tout ce qui est en attente et l'attend.
+        Renvoie False si elle a échoué (elle sera réessayée) ou n'a pas abouti à temps.
+        """
+        with self._cond:
+            cible = self._nb_soumis
+            if self._nb_ecrits >= cible:
+                return True
+            echecs = self._nb_echecs
+            self._urgent = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._nb_ecrits >= cible or self._nb_echecs > echecs, timeout)
+            return self._nb_ecrits >= cible
+
+    def arreter(self, timeout=5.0):
+        """Vide la file puis arrête le thread (à appeler à la fermeture)."""
+        self.vider(timeout)
+        with self._cond:
+            self._actif = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def en_conflit(self):
+        with self._cond:
+            return bool(self._conflits)
+
+    def prendre_conflits(self):
+        """Renvoie (et oublie) les événements refusés pour conflit, dans l'ordre."""
+        with self._cond:
+            conflits, self._conflits = self._conflits, []
+            return conflits
+
+    def reinitialiser(self, donnees):
+        """Nouvelle version du document après synchronisation (file vidée au préalable)."""
+        with self._cond:
+            self._donnees = copy.deepcopy(donnees)
+
+    def metriques(self):
+        with self._cond:
+            return {
+                "en_attente": len(self._en_attente),
+                "derniere_latence_ms": self._derniere_latence * 1000,
+                "nb_ecritures": self._nb_ecritures,
+                "nb_fusionnes": self._nb_ecrits - self._nb_ecritures,
+                "erreur": str(self._erreur) if self._erreur else None,
+            }
+
+    # --- Thread d'écriture ---
+    def _boucle(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._en_attente or not self._actif)
+                if not self._en_attente:
+                    return
+
+                # Regroupement : on attend que la rafale de clics se calme
+                while self._actif and not self._urgent:
+                    reste = self._dernier_depot + self.delai - time.monotonic()
+                    if reste <= 0:
+                        break
+                    self._cond.wait(reste)
+
+                lot = self._en_attente
+                self._en_attente = []
+                self._urgent = False
+
+            debut = time.perf_counter()
+            conflit = False
+            erreur = None
+            try:
+                self._ecrire(lot)
+            except ConflitEcriture as e:
+                print(f"⚠️ Conflit d'écriture, synchronisation nécessaire : {e}")
+                conflit = True
+            except (OSError, sqlite3.Error) as e:
+                erreur = e
+            duree = time.perf_counter() - debut
+
+            with self._cond:
+                if erreur is not None:
+                    self._echec(lot, erreur)
+                    continue
+                if self._erreur is not None:
+                    print("✅ Sauvegarde rétablie")
+                    self._erreur = None
+                if conflit:
+                    self._conflits.extend(lot)
+                self._nb_ecrits += len(lot)
+                self._nb_ecritures += 1
+                self._derniere_latence = duree
+                self._cond.notify_all()
+
+    def _echec(self, lot, erreur):
+        """Écriture ratée (verrou tenu) : le lot repasse en tête de file et sera réessayé."""
+        self._nb_echecs += 1
+        self._cond.notify_all()
+        if not self._actif:
+            # Fermeture : on n'insiste pas indéfiniment
+            print(f"⚠️ {len(lot)} bascule(s) non sauvegardée(s) : {erreur}")
+            self._nb_ecrits += len(lot)
+            self._cond.notify_all()
+            return
+        if self._erreur is None:
+            print(f"⚠️ Erreur de sauvegarde, nouvel essai dans {DELAI_REESSAI:g} s : {erreur}")
+        self._erreur = erreur
+        self._en_attente[:0] = lot
+        self._cond.wait_for(lambda: self._urgent or not self._actif, DELAI_REESSAI)
+
+    def _ecrire(self, lot):
+        with mesures.span("save"):
+            self.stockage.enregistrer_lot(lot)
+            for evenement in lot:
+                self.stockage.appliquer(self._donnees, evenement)
+            if self.stockage.doit_compacter():
+                compacter_si_possible(self.stockage, self._donnees)
+
+
+class PersistanceSynchrone:
+    """
+    Variante sans thread, même interface que ServicePersistance : chaque
+    événement est écrit immédiatement. Pour les scripts et la ligne de
+    commande, où il n'y a pas de boucle d'événements à protéger.
+    """
+    def __init__(self, stockage, donnees):
+        self.stockage = stockage
+        self._donnees = donnees
+        self._conflits = []
+        self._nb_ecritures = 0
+        self._derniere_latence = 0.0
+
+    def soumettre(self, evenement):
+        self.soumettre_lot([evenement])
+
+    def soumettre_lot(self, evenements):
+        """Une seule écriture pour tout le lot."""
+        debut = time.perf_counter()
+        try:
+            with mesures.span("save"):
+                self.stockage.enregistrer_lot(evenements)
+                # Le document est partagé avec l'appelant, qui y a déjà appliqué les événements
+                if self.stockage.doit_compacter():
+                    compacter_si_possible(self.stockage, self._donnees)
+        except ConflitEcriture:
+            self._conflits.extend(evenements)
+        self._nb_ecritures += 1
+        self._derniere_latence = time.perf_counter() - debut
+
+    def vider(self, timeout=None):
+        return True
+
+    def en_conflit(self):
+        return bool(self._conflits)
+
+    def prendre_conflits(self):
+        conflits, self._conflits = self._conflits, []
+        return conflits
+
+    def reinitialiser(self, donnees):
+        self._donnees = donnees
+
+    def arreter(self, timeout=None):
+        pass
+
+    def metriques(self):
+        return {
+            "en_attente": 0,
+            "derniere_latence_ms": self._derniere_latence * 1000,
+            "nb_ecritures": self._nb_ecritures,
+            "nb_fusionnes": 0,
+        }
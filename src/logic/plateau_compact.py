@@ -0,0 +1,169 @@
+"""
+Représentation compacte d'un plateau, pour les gros plateaux et les
+traitements par lots (des milliers de plateaux en mémoire).
+
+Au lieu d'un dict par objectif :
+- titres internés (sys.intern) : un titre répété n'est stocké qu'une fois
+- poids dans un array('B') (1 octet par case)
+- validations dans un entier utilisé comme bitset (1 bit par case)
+- dates de validation en epoch dans un array('q') (0 = pas de date)
+
+La conversion depuis / vers le schéma JSON actuel est sans perte : un
+objectif qui ne rentre pas dans ce format (clé inconnue, date dans un autre
+format...) est conservé tel quel dans `exceptions`.
+"""
+import sys
+from array import array
+
+from src.logic.historique import date_vers_epoch, epoch_vers_date
+
+CLES_OBJECTIF = {"titre", "poids", "valide", "date_validation"}
+
+
+class ObjectifVue:
+    """Vue légère (sans dict) sur l'objectif n° `index` d'un PlateauCompact."""
+    __slots__ = ("plateau", "index")
+
+    def __init__(self, plateau, index):
+        self.plateau = plateau
+        self.index = index
+
+    def _exception(self, cle):
+        return self.plateau.exceptions[self.index].get(cle)
+
+    @property
+    def titre(self):
+        if self.index in self.plateau.exceptions:
+            return self._exception("titre")
+        return self.plateau.titres[self.index]
+
+    @property
+    def poids(self):
+        if self.index in self.plateau.exceptions:
+            return self._exception("poids")
+        return self.plateau.poids[self.index]
+
+    @property
+    def valide(self):
+        return bool(self.plateau.bits >> self.index & 1)
+
+    @property
+    def ts(self):
+        return self.plateau.horodatages[self.index] or None
+
+    @property
+    def date_validation(self):
+        if self.index in self.plateau.exceptions:
+            return self._exception("date_validation")
+        ts = self.ts
+        return epoch_vers_date(ts) if ts else None
+
+    def vers_dict(self):
+        return self.plateau.objectif_json(self.index)
+
+    def __repr__(self):
+        return f"ObjectifVue({self.index}, {self.titre!r}, poids={self.poids}, valide={self.valide})"
+
+
+class PlateauCompact:
+    def __init__(self, nb_cases=0):
+        self.titres = [""] * nb_cases
+        self.poids = array('B', bytes(nb_cases))
+        self.bits = 0
+        self.horodatages = array('q', [0]) * nb_cases
+        self.exceptions = {}  # index -> dict JSON d'origine (objectifs hors format)
+        self.meta = {}        # Reste du document (récompenses, stats, paliers...)
+
+    def __len__(self):
+        return len(self.titres)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self.titres):
+            raise IndexError(index)
+        return ObjectifVue(self, index)
+
+    def __iter__(self):
+        return (ObjectifVue(self, i) for i in range(len(self.titres)))
+
+    # --- Modifications ---
+    def basculer(self, index, valide, ts=None):
+        if index in self.exceptions:
+            obj = self.exceptions[index]
+            obj["valide"] = valide
+            obj["date_validation"] = epoch_vers_date(ts) if valide and ts else None
+        if valide:
+            self.bits |= 1 << index
+            self.horodatages[index] = ts or 0
+        else:
+            self.bits &= ~(1 << index)
+            self.horodatages[index] = 0
+
+    def poids_valide(self):
+        bits, total, i = self.bits, 0, 0
+        while bits:
+            if bits & 1:
+                total += self.poids[i]
+            bits >>= 1
+            i += 1
+        return total
+
+    # --- Conversion JSON ---
+    @classmethod
+    def depuis_json(cls, donnees, garder_historique=True):
+        """
+        `garder_historique=False` (traitements par lots) : l'historique, qui
+        grossit à chaque clic, n'est pas conservé dans `meta`.
+        """
+        objectifs = donnees.get("objectifs", [])
+        plateau = cls(len(objectifs))
+        # On garde l'ordre des clés du document ("objectifs" sert de marque-place)
+        plateau.meta = {k: (None if k == "objectifs" else v) for k, v in donnees.items()
+                        if garder_historique or k != "historique"}
+
+        for i, obj in enumerate(objectifs):
+            if not plateau._compacter(i, obj):
+                plateau.exceptions[i] = obj
+                if obj.get("valide"):
+                    plateau.bits |= 1 << i
+        return plateau
+
+    def _compacter(self, i, obj):
+        """Range l'objectif dans les tableaux ; False s'il faut le garder tel quel."""
+        if set(obj) != CLES_OBJECTIF or not isinstance(obj["titre"], str):
+            return False
+        poids, valide, date_validation = obj["poids"], obj["valide"], obj["date_validation"]
+        if type(poids) is not int or not 0 <= poids <= 255 or type(valide) is not bool:
+            return False
+
+        ts = 0
+        if date_validation is not None:
+            try:
+                ts = date_vers_epoch(date_validation)
+            except (TypeError, ValueError):
+                return False
+            # Date non reproductible à l'identique (ex : heure d'été ambiguë)
+            if ts == 0 or epoch_vers_date(ts) != date_validation:
+                return False
+
+        self.titres[i] = sys.intern(obj["titre"])
+        self.poids[i] = poids
+        self.horodatages[i] = ts
+        if valide:
+            self.bits |= 1 << i
+        return True
+
+    def objectif_json(self, index):
+        if index in self.exceptions:
+            return self.exceptions[index]
+        ts = self.horodatages[index]
+        return {
+            "titre": self.titres[index],
+            "poids": self.poids[index],
+            "valide": bool(self.bits >> index & 1),
+            "date_validation": epoch_vers_date(ts) if ts else None
+        }
+
+    def vers_json(self):
+        donnees = dict(self.meta)
+        donnees["objectifs"] = [self.objectif_json(i) for i in range(len(self.titres))]
+        return donnees
@@ -0,0 +1,61 @@
+from bisect import bisect_right
+
+# Paliers par défaut : (clé de récompense, ratio de poids validé à atteindre)
+PALIERS_DEFAUT = {"bronze": 0.25, "argent": 0.50, "or": 0.75, "platine": 1.0}
+
+
+class ModeleScore:
+    """
+    Score pondéré tenu à jour de façon incrémentale.
+
+    Le poids validé est ajusté de ±poids à chaque bascule (O(1)) et le palier
+    courant est retrouvé par bisection sur les seuils triés (O(log paliers)),
+    sans jamais re-parcourir les objectifs.
+    """
+    def __init__(self, objectifs, paliers=None):
+        paliers = paliers or PALIERS_DEFAUT
+        ordre = sorted(paliers.items(), key=lambda p: p[1])
+        self.noms = [nom for nom, _ in ordre]
+        self.seuils = [seuil for _, seuil in ordre]
+        self.positions = {nom: i for i, nom in enumerate(self.noms)}
+
+        self.poids_total = sum(obj['poids'] for obj in objectifs)
+        self.poids_valide = sum(obj['poids'] for obj in objectifs if obj['valide'])
+
+    @property
+    def ratio(self):
+        return (self.poids_valide / self.poids_total) if self.poids_total > 0 else 0
+
+    @property
+    def rang(self):
+        """Nombre de paliers atteints (0 = aucun, len(noms) = tous)."""
+        return bisect_right(self.seuils, self.ratio)
+
+    def est_atteint(self, nom):
+        return self.positions[nom] < self.rang
+
+    def palier_courant(self):
+        """Clé du plus haut palier atteint, ou None."""
+        rang = self.rang
+        return self.noms[rang - 1] if rang else None
+
+    def basculer(self, poids, valide):
+        """
+        Applique la bascule d'un objectif de poids `poids`.
+        Renvoie (ancien_rang, nouveau_rang) pour ne rafraîchir que les
+        paliers franchis.
+        """
+        ancien = self.rang
+        self.poids_valide += poids if valide else -poids
+        return ancien, self.rang
+
+    def changer_poids(self, ancien, nouveau, valide):
+        """Un objectif change de difficulté (modification externe de la grille)."""
+        self.poids_total += nouveau - ancien
+        if valide:
+            self.poids_valide += nouveau - ancien
+
+    def paliers_modifies(self, ancien_rang, nouveau_rang):
+        """Clés des paliers dont l'état atteint/non atteint a changé."""
+        bas, haut = sorted((ancien_rang, nouveau_rang))
+        return self.noms[bas:haut]
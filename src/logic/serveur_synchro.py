@@ -0,0 +1,178 @@
+"""
+Serveur de synchronisation de référence (bibliothèque standard uniquement).
+
+Un seul plateau partagé par serveur, stocké dans une base SQLite :
+
+    grille(empreinte, document)             la grille publiée
+    evenements(curseur, appareil, ts, ...)  le journal commun des bascules
+
+Le curseur est la clé primaire : « tout ce qui suit le curseur N » est une
+lecture d'index, quel que soit le nombre de bascules déjà stockées. Une même
+bascule (ts, case, état) n'est stockée qu'une fois, même si plusieurs
+appareils l'envoient.
+
+Routes (JSON, gzip accepté et renvoyé au-delà d'une certaine taille) :
+    POST /sync    envoie un lot, reçoit les bascules des autres depuis un curseur
+    GET  /grille  grille publiée
+    PUT  /grille  publie une grille (le journal repart de zéro)
+
+Pour tester hors ligne :  python -m bingoal serveur-sync --port 8765
+"""
+import json
+import os
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.logic.synchro import TAILLE_LOT, VERSION_PROTOCOLE, decoder, empreinte_grille, encoder
+
+PORT_PAR_DEFAUT = 8765
+TAILLE_MAX_REQUETE = 16 * 1024 * 1024
+
+SCHEMA_SERVEUR = """
+CREATE TABLE IF NOT EXISTS grille (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    empreinte TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evenements (
+    curseur INTEGER PRIMARY KEY AUTOINCREMENT,
+    appareil TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    valide INTEGER NOT NULL,
+    UNIQUE (ts, position, valide)
+);
+"""
+
+
+class RefusSynchro(Exception):
+    """Requête refusée : renvoyée au client avec un statut HTTP et un code d'erreur."""
+    def __init__(self, statut, code, message):
+        super().__init__(message)
+        self.statut = statut
+        self.code = code
+
+
+class ServeurSynchro:
+    """Données du serveur ; une seule connexion SQLite protégée par un verrou."""
+    def __init__(self, chemin_base):
+        dossier = os.path.dirname(chemin_base)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        self._verrou = threading.Lock()
+        self.connexion = sqlite3.connect(chemin_base, check_same_thread=False)
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute("PRAGMA synchronous=NORMAL")
+        self.connexion.executescript(SCHEMA_SERVEUR)
+
+    def grille(self):
+        with self._verrou:
+            ligne = self.connexion.execute("SELECT empreinte, document FROM grille").fetchone()
+        if ligne is None:
+            return {"empreinte": None, "grille": None}
+        return {"empreinte": ligne[0], "grille": json.loads(ligne[1])}
+
+    def publier(self, grille):
+        empreinte = empreinte_grille(grille)
+        with self._verrou, self.connexion:
+            self.connexion.execute("DELETE FROM evenements")
+            self.connexion.execute(
+                "INSERT OR REPLACE INTO grille (id, empreinte, document) VALUES (1, ?, ?)",
+                (empreinte, json.dumps(grille, ensure_ascii=False))
+            )
+        return {"empreinte": empreinte}
+
+    def echanger(self, appareil, empreinte, curseur, evenements, limite=TAILLE_LOT):
+        """
+        Enregistre les bascules de `appareil`, puis renvoie celles des autres
+        appareils après `curseur` (au plus `limite` ; "suite" s'il en reste).
+        """
+        with self._verrou, self.connexion:
+            ligne = self.connexion.execute("SELECT empreinte FROM grille").fetchone()
+            if ligne is None:
+                raise RefusSynchro(409, "grille_absente", "Le serveur n'a pas encore de grille")
+            if ligne[0] != empreinte:
+                raise RefusSynchro(409, "grille_differente",
+                                   "La grille du serveur est différente : publier la vôtre ou adopter la sienne")
+
+            self.connexion.executemany(
+                "INSERT OR IGNORE INTO evenements (appareil, ts, position, valide) VALUES (?, ?, ?, ?)",
+                ((appareil, ts, index, int(valide)) for ts, index, valide in evenements)
+            )
+            lignes = self.connexion.execute(
+                "SELECT curseur, ts, position, valide FROM evenements "
+                "WHERE curseur > ? AND appareil != ? ORDER BY curseur LIMIT ?",
+                (curseur, appareil, limite)
+            ).fetchall()
+            suite = len(lignes) == limite
+            if suite:
+                nouveau = lignes[-1][0]
+            else:
+                # Rien d'autre pour cet appareil : on saute aussi ses propres envois
+                nouveau = self.connexion.execute("SELECT MAX(curseur) FROM evenements").fetchone()[0] or 0
+                nouveau = max(nouveau, curseur)
+        return {
+            "curseur": nouveau,
+            "evenements": [[ts, position, valide] for _, ts, position, valide in lignes],
+            "suite": suite,
+        }
+
+    def fermer(self):
+        with self._verrou:
+            self.connexion.close()
+
+
+class GestionnaireSynchro(BaseHTTPRequestHandler):
+    server_version = "BingoalSync/1"
+    donnees = None  # ServeurSynchro, fixé par creer_serveur()
+
+    def do_GET(self):
+        if self.path != "/grille":
+            return self._repondre(404, {"erreur": "route_inconnue", "message": self.path})
+        self._repondre(200, self.donnees.grille())
+
+    def do_PUT(self):
+        if self.path != "/grille":
+            return self._repondre(404, {"erreur": "route_inconnue", "message": self.path})
+        self._traiter(lambda corps: self.donnees.publier(corps["grille"]))
+
+    def do_POST(self):
+        if self.path != "/sync":
+            return self._repondre(404, {"erreur": "route_inconnue", "message": self.path})
+        self._traiter(lambda corps: self.donnees.echanger(
+            corps["appareil"], corps["grille"], int(corps["curseur"]), corps["evenements"]))
+
+    def _traiter(self, action):
+        try:
+            longueur = int(self.headers.get("Content-Length") or 0)
+            if longueur > TAILLE_MAX_REQUETE:
+                raise RefusSynchro(413, "trop_gros", "Requête trop volumineuse")
+            corps = decoder(self.rfile.read(longueur), self.headers.get("Content-Encoding"))
+            if corps.get("version") != VERSION_PROTOCOLE:
+                raise RefusSynchro(400, "version", f"Protocole {VERSION_PROTOCOLE} attendu")
+            self._repondre(200, action(corps))
+        except RefusSynchro as e:
+            self._repondre(e.statut, {"erreur": e.code, "message": str(e)})
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            self._repondre(400, {"erreur": "requete_invalide", "message": str(e)})
+
+    def _repondre(self, statut, objet):
+        corps, entetes = encoder(objet)
+        if "gzip" not in (self.headers.get("Accept-Encoding") or ""):
+            corps, entetes = json.dumps(objet, ensure_ascii=False).encode("utf-8"), {"Content-Type": "application/json"}
+        self.send_response(statut)
+        for nom, valeur in entetes.items():
+            self.send_header(nom, valeur)
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def log_message(self, format, *args):
+        pass  # Pas une ligne par requête dans la console
+
+
+def creer_serveur(chemin_base, hote="127.0.0.1", port=PORT_PAR_DEFAUT):
+    """Serveur prêt à lancer (serve_forever) ; port=0 choisit un port libre."""
+    gestionnaire = type("Gestionnaire", (GestionnaireSynchro,), {"donnees": ServeurSynchro(chemin_base)})
+    return ThreadingHTTPServer((hote, port), gestionnaire)
@@ -0,0 +1,266 @@
+"""
+Couche de stockage du Bingo.
+
+Deux implémentations, même interface (celle qu'utilisent BoardStore et les
+services de persistance) :
+
+- JournalBingo  : bingo_config.json + journal de clics (format historique)
+- StockageSQLite : base SQLite multi-plateaux / multi-années, mode WAL
+
+Interface commune :
+    existe()                  -> bool
+    charger()                 -> document au format bingo_config.json
+    enregistrer_lot(evts)     -> ajoute des événements de bascule
+    doit_compacter()          -> bool
+    compacter(donnees, forcer)-> remplace tout le plateau par `donnees`
+    appliquer(donnees, evt)   -> applique un événement en mémoire
+    fichiers()                -> fichiers à surveiller (écritures externes)
+    a_change()                -> un autre processus a-t-il écrit depuis notre dernière lecture ?
+
+Les écritures lèvent ConflitEcriture si le plateau a changé depuis la
+dernière lecture (sauf compacter(..., forcer=True)).
+"""
+import json
+import os
+import sqlite3
+import threading
+
+from src.logic.historique import historique_initial
+from src.logic.journal import ConflitEcriture, JournalBingo, ecrire_json_atomique
+
+EXTENSIONS_SQLITE = (".db", ".sqlite", ".sqlite3")
+PLATEAU_PAR_DEFAUT = "default"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plateaux (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL UNIQUE,
+    annee INTEGER,
+    seq INTEGER NOT NULL DEFAULT 0,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS objectifs (
+    plateau_id INTEGER NOT NULL REFERENCES plateaux(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    titre TEXT NOT NULL,
+    poids INTEGER NOT NULL,
+    valide INTEGER NOT NULL DEFAULT 0,
+    date_validation TEXT,
+    PRIMARY KEY (plateau_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS evenements (
+    id INTEGER PRIMARY KEY,
+    plateau_id INTEGER NOT NULL REFERENCES plateaux(id) ON DELETE CASCADE,
+    ts INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    valide INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_evenements_plateau_ts ON evenements (plateau_id, ts);
+CREATE INDEX IF NOT EXISTS idx_plateaux_annee ON plateaux (annee);
+"""
+
+# Clés du document stockées dans leurs propres tables (le reste va dans `document`)
+CLES_TABLES = ("objectifs", "historique", "seq")
+
+
+def est_sqlite(chemin):
+    return chemin.lower().endswith(EXTENSIONS_SQLITE)
+
+
+def ouvrir_stockage(chemin, plateau=None):
+    """Choisit le stockage selon l'extension : .db/.sqlite -> SQLite, sinon JSON."""
+    if est_sqlite(chemin):
+        return StockageSQLite(chemin, plateau or PLATEAU_PAR_DEFAUT)
+    return JournalBingo(chemin)
+
+
+def annee_plateau(donnees):
+    date_limite = donnees.get("date_limite") or "2026-12-31"
+    return int(date_limite[:4])
+
+
+class StockageSQLite:
+    """
+    Un plateau (`plateau`) dans une base SQLite partagée.
+
+    Une bascule = une mise à jour d'une ligne de `objectifs` + une insertion
+    dans `evenements`, dans une seule transaction. L'historique est lu via
+    l'index (plateau_id, ts). La connexion est partagée entre le thread Tk
+    et le thread de persistance, protégée par un verrou.
+
+    Version du plateau : (id, seq). Un autre processus qui bascule une case
+    incrémente seq, un import recrée la ligne (nouvel id).
+    """
+    appliquer = staticmethod(JournalBingo.appliquer)
+
+    def __init__(self, chemin, plateau=PLATEAU_PAR_DEFAUT):
+        self.chemin = chemin
+        self.plateau = plateau
+        dossier = os.path.dirname(chemin)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+
+        self._verrou = threading.Lock()
+        self.connexion = sqlite3.connect(chemin, check_same_thread=False)
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute("PRAGMA synchronous=NORMAL")
+        self.connexion.execute("PRAGMA foreign_keys=ON")
+        self.connexion.executescript(SCHEMA)
+        self.version = None  # (id, seq) lus ou écrits en dernier par nous
+
+    def _id_plateau(self):
+        ligne = self.connexion.execute("SELECT id FROM plateaux WHERE nom = ?", (self.plateau,)).fetchone()
+        return ligne[0] if ligne else None
+
+    def _version_stockee(self):
+        return self.connexion.execute("SELECT id, seq FROM plateaux WHERE nom = ?", (self.plateau,)).fetchone()
+
+    def existe(self):
+        with self._verrou:
+            return self._id_plateau() is not None
+
+    def fichiers(self):
+        return [self.chemin, self.chemin + "-wal"]
+
+    def a_change(self):
+        with self._verrou:
+            return self.version is not None and self._version_stockee() != self.version
+
+    def _verifier_version(self):
+        if self.version is not None and self._version_stockee() != self.version:
+            raise ConflitEcriture(f"Plateau {self.plateau} modifié par un autre processus ({self.chemin})")
+
+    def lister_plateaux(self, annee=None):
+        with self._verrou:
+            if annee is None:
+                lignes = self.connexion.execute("SELECT nom FROM plateaux ORDER BY nom")
+            else:
+                lignes = self.connexion.execute("SELECT nom FROM plateaux WHERE annee = ? ORDER BY nom", (annee,))
+            return [nom for (nom,) in lignes]
+
+    # --- Lecture ---
+    def charger(self):
+        with self._verrou:
+            ligne = self.connexion.execute(
+                "SELECT id, seq, document FROM plateaux WHERE nom = ?", (self.plateau,)
+            ).fetchone()
+            if ligne is None:
+                raise FileNotFoundError(f"Plateau inconnu : {self.plateau} ({self.chemin})")
+            plateau_id, seq, document = ligne
+
+            donnees = json.loads(document)
+            donnees["objectifs"] = [
+                {"titre": titre, "poids": poids, "valide": bool(valide), "date_validation": date_validation}
+                for titre, poids, valide, date_validation in self.connexion.execute(
+                    "SELECT titre, poids, valide, date_validation FROM objectifs "
+                    "WHERE plateau_id = ? ORDER BY position", (plateau_id,))
+            ]
+            donnees["historique"] = [
+                [ts, position, bool(valide)]
+                for ts, position, valide in self.connexion.execute(
+                    "SELECT ts, position, valide FROM evenements "
+                    "WHERE plateau_id = ? ORDER BY ts, id", (plateau_id,))
+            ]
+            donnees["seq"] = seq
+            self.version = (plateau_id, seq)
+            return donnees
+
+    def historique_entre(self, debut=None, fin=None):
+        """Événements (ts, index, valide) avec debut <= ts < fin, via l'index (plateau_id, ts)."""
+        with self._verrou:
+            plateau_id = self._id_plateau()
+            lignes = self.connexion.execute(
+                "SELECT ts, position, valide FROM evenements "
+                "WHERE plateau_id = ? AND ts >= ? AND ts < ? ORDER BY ts, id",
+                (plateau_id, debut if debut is not None else -2**63, fin if fin is not None else 2**63 - 1)
+            ).fetchall()
+        return [(ts, position, bool(valide)) for ts, position, valide in lignes]
+
+    # --- Écriture ---
+    def enregistrer_lot(self, evenements):
+        """Une transaction pour tout le lot ; les événements déjà appliqués (seq) sont ignorés."""
+        with self._verrou, self.connexion:
+            self._verifier_version()
+            plateau_id, seq_base = self._version_stockee()
+            seq_max = seq_base
+            for evenement in evenements:
+                seq = evenement.get("seq")
+                if seq is not None and seq <= seq_base:
+                    continue
+                if not evenement.get("historique_seul"):
+                    self.connexion.execute(
+                        "UPDATE objectifs SET valide = ?, date_validation = ? WHERE plateau_id = ? AND position = ?",
+                        (int(evenement["valide"]), evenement.get("date_validation"), plateau_id, evenement["index"])
+                    )
+                if "ts" in evenement:
+                    self.connexion.execute(
+                        "INSERT INTO evenements (plateau_id, ts, position, valide) VALUES (?, ?, ?, ?)",
+                        (plateau_id, evenement["ts"], evenement["index"], int(evenement["valide"]))
+                    )
+                if seq is not None:
+                    seq_max = max(seq_max, seq)
+            if seq_max != seq_base:
+                self.connexion.execute("UPDATE plateaux SET seq = ? WHERE id = ?", (seq_max, plateau_id))
+            self.version = (plateau_id, seq_max)
+
+    def doit_compacter(self):
+        return False  # Chaque bascule est déjà une mise à jour en place
+
+    def compacter(self, donnees, forcer=False):
+        """Remplace intégralement le plateau (nouvelle grille, import JSON)."""
+        with self._verrou, self.connexion:
+            if not forcer:
+                self._verifier_version()
+            plateau_id = self._inserer_plateau(self.plateau, donnees)
+            self.version = (plateau_id, donnees.get("seq", 0))
+
+    def remplacer_plateaux(self, documents):
+        """
+        Écrit plusieurs plateaux (nom, donnees) en une seule transaction.
+        Sert à l'import en masse : un commit (et un fsync) par lot, pas par plateau.
+        """
+        with self._verrou, self.connexion:
+            for nom, donnees in documents:
+                self._inserer_plateau(nom, donnees)
+
+    def _inserer_plateau(self, nom, donnees):
+        document = {k: v for k, v in donnees.items() if k not in CLES_TABLES}
+        objectifs = donnees.get("objectifs", [])
+        historique = donnees.get("historique")
+        if historique is None:
+            historique = historique_initial(objectifs)
+
+        # Id pris avant la suppression : SQLite redonnerait sinon le même id au
+        # dernier plateau recréé, et les autres processus ne verraient pas l'import.
+        (plateau_id,) = self.connexion.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM plateaux").fetchone()
+        self.connexion.execute("DELETE FROM plateaux WHERE nom = ?", (nom,))
+        self.connexion.execute(
+            "INSERT INTO plateaux (id, nom, annee, seq, document) VALUES (?, ?, ?, ?, ?)",
+            (plateau_id, nom, annee_plateau(donnees), donnees.get("seq", 0), json.dumps(document, ensure_ascii=False))
+        )
+        self.connexion.executemany(
+            "INSERT INTO objectifs (plateau_id, position, titre, poids, valide, date_validation) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((plateau_id, i, obj['titre'], obj['poids'], int(obj['valide']), obj.get('date_validation'))
+             for i, obj in enumerate(objectifs))
+        )
+        self.connexion.executemany(
+            "INSERT INTO evenements (plateau_id, ts, position, valide) VALUES (?, ?, ?, ?)",
+            ((plateau_id, ts, index, int(valide)) for ts, index, valide in historique)
+        )
+        return plateau_id
+
+    def fermer(self):
+        with self._verrou:
+            self.connexion.close()
+
+
+# --- Import / export au format bingo_config.json ---
+def importer_json(stockage, chemin_json):
+    """Charge un bingo_config.json (snapshot + journal) dans un stockage quelconque."""
+    stockage.compacter(JournalBingo(chemin_json).charger(), forcer=True)
+
+
+def exporter_json(stockage, chemin_json):
+    """Écrit le plateau au format bingo_config.json (écriture atomique)."""
+    ecrire_json_atomique(chemin_json, stockage.charger())
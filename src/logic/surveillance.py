@@ -0,0 +1,127 @@
+"""
+Surveillance des fichiers du plateau (écritures d'un autre processus :
+script, outil de synchronisation, seconde instance de l'application).
+
+Linux : inotify via ctypes (aucun coût tant que rien ne change).
+Ailleurs, ou si inotify est indisponible : sondage de (mtime, taille).
+
+Le rappel est appelé depuis le thread de surveillance avec le chemin
+modifié : côté IHM, il ne doit que lever un drapeau, relu par la boucle Tk.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+from src.logic.journal import empreinte_fichier
+
+INTERVALLE_SONDAGE = 1.0   # Secondes entre deux sondages (mode sans inotify)
+
+# Constantes de <sys/inotify.h>
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+MASQUE = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EN_TETE = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _charger_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class Surveillant:
+    def __init__(self, chemins, callback, intervalle=INTERVALLE_SONDAGE):
+        self.chemins = [os.path.abspath(c) for c in chemins]
+        self.callback = callback
+        self.intervalle = intervalle
+        self.mode = None
+        self._actif = False
+        self._arret = threading.Event()
+        self._thread = None
+        self._fd = None
+
+    def demarrer(self):
+        self._actif = True
+        libc = _charger_inotify()
+        if libc is not None and self._ouvrir_inotify(libc):
+            self.mode = "inotify"
+            cible = self._boucle_inotify
+        else:
+            self.mode = "sondage"
+            cible = self._boucle_sondage
+        self._thread = threading.Thread(target=cible, name="bingoal-surveillance", daemon=True)
+        self._thread.start()
+        return self
+
+    def arreter(self):
+        self._actif = False
+        self._arret.set()
+        if self._thread is not None:
+            self._thread.join(2 * self.intervalle)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    # --- inotify ---
+    def _ouvrir_inotify(self, libc):
+        """Surveille les dossiers (un fichier remplacé par renommage change d'inode)."""
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        self._dossiers = {}
+        for dossier in {os.path.dirname(c) for c in self.chemins}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(dossier), MASQUE)
+            if wd < 0:
+                os.close(fd)
+                return False
+            self._dossiers[wd] = dossier
+        self._fd = fd
+        return True
+
+    def _boucle_inotify(self):
+        surveilles = set(self.chemins)
+        while self._actif:
+            prets, _, _ = select.select([self._fd], [], [], self.intervalle)
+            if not prets or not self._actif:
+                continue
+            try:
+                donnees = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            modifies = set()
+            position = 0
+            while position + EN_TETE.size <= len(donnees):
+                wd, _, _, longueur = EN_TETE.unpack_from(donnees, position)
+                position += EN_TETE.size
+                nom = donnees[position:position + longueur].rstrip(b"\0")
+                position += longueur
+                chemin = os.path.join(self._dossiers.get(wd, ""), os.fsdecode(nom))
+                if chemin in surveilles:
+                    modifies.add(chemin)
+            for chemin in modifies:
+                self.callback(chemin)
+
+    # --- Sondage ---
+    def _boucle_sondage(self):
+        empreintes = {c: empreinte_fichier(c) for c in self.chemins}
+        while not self._arret.wait(self.intervalle):
+            for chemin in self.chemins:
+                empreinte = empreinte_fichier(chemin)
+                if empreinte != empreintes[chemin]:
+                    empreintes[chemin] = empreinte
+                    self.callback(chemin)
@@ -0,0 +1,291 @@
+"""
+Synchronisation d'un plateau entre plusieurs appareils (portable, fixe...).
+
+Un serveur (voir serveur_synchro.py) tient le journal commun des bascules,
+numérotées par un curseur croissant. Chaque appareil :
+
+- envoie ses bascules faites depuis sa dernière synchronisation (lues par
+  bisection dans l'historique : coût proportionnel aux changements), sans
+  celles qu'il a lui-même reçues du serveur ;
+- reçoit celles des autres appareils depuis son curseur ;
+- les fusionne avec BoardStore.fusionner() (union des historiques, chaque
+  case prend l'état de sa bascule la plus récente : aucun conflit).
+
+Les échanges sont des lots d'au plus TAILLE_LOT bascules ([ts, index, 0/1]),
+en JSON compressé gzip au-delà de SEUIL_COMPRESSION octets.
+
+La grille elle-même (titres, poids, récompenses) n'est envoyée qu'une fois :
+les appareils n'échangent ensuite que son empreinte. Si elle diffère de celle
+du serveur, la synchronisation s'arrête (ErreurSynchro) : il faut choisir
+explicitement de publier sa grille (le journal du serveur repart de zéro) ou
+d'adopter celle du serveur (la grille locale est remplacée).
+
+L'état de synchronisation d'un appareil (identifiant, curseur, dernière
+seconde envoyée) est dans un petit fichier à côté du plateau :
+<config>.sync.json.
+"""
+import gzip
+import hashlib
+import json
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+from src.logic.journal import ecrire_json_atomique
+from src.logic.mesures import mesures
+from src.logic.stockage import est_sqlite
+
+VERSION_PROTOCOLE = 1
+TAILLE_LOT = 500            # Bascules par requête (dans chaque sens)
+SEUIL_COMPRESSION = 512     # Octets en dessous desquels gzip ne vaut pas la peine
+DELAI_RESEAU = 10           # Secondes
+
+# Clés du document qui ne font pas partie de la grille partagée
+CLES_LOCALES = ("historique", "seq", "revision")
+
+
+class ErreurSynchro(Exception):
+    """Échec de la synchronisation (réseau, serveur, grilles différentes)."""
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code  # Code d'erreur du serveur ("grille_absente", "grille_differente"...)
+
+
+# --- Format des échanges (partagé avec le serveur) ---
+def encoder(objet):
+    """Objet -> (corps, en-têtes HTTP). Compressé seulement s'il est assez gros."""
+    corps = json.dumps(objet, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    entetes = {"Content-Type": "application/json"}
+    if len(corps) > SEUIL_COMPRESSION:
+        corps = gzip.compress(corps, compresslevel=6)
+        entetes["Content-Encoding"] = "gzip"
+    return corps, entetes
+
+
+def decoder(corps, encodage=None):
+    if encodage == "gzip":
+        corps = gzip.decompress(corps)
+    return json.loads(corps.decode("utf-8")) if corps else {}
+
+
+def grille(donnees):
+    """La partie partagée du plateau : titres, poids, récompenses, paliers... sans l'avancement."""
+    partagee = {k: v for k, v in donnees.items() if k not in CLES_LOCALES and k != "objectifs"}
+    partagee["objectifs"] = [{"titre": obj["titre"], "poids": obj["poids"]} for obj in donnees["objectifs"]]
+    return partagee
+
+
+def empreinte_grille(donnees):
+    texte = json.dumps(grille(donnees), ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(texte.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def donnees_depuis_grille(partagee):
+    """Plateau vierge (rien de validé) à partir d'une grille reçue du serveur."""
+    donnees = dict(partagee)
+    donnees["objectifs"] = [
+        {"titre": obj["titre"], "poids": obj["poids"], "valide": False, "date_validation": None}
+        for obj in partagee["objectifs"]
+    ]
+    donnees["historique"] = []
+    return donnees
+
+
+def chemin_etat(store):
+    if est_sqlite(store.config_path):
+        return f"{store.config_path}.{store.stockage.plateau}.sync.json"
+    return store.config_path + ".sync.json"
+
+
+class ClientSynchro:
+    """
+    Synchronise un BoardStore avec un serveur.
+
+    `synchroniser()` fait tout d'un coup (ligne de commande). L'IHM découpe :
+    preparer() sur le thread Tk, echanger() (réseau) sur un thread de fond,
+    terminer() de nouveau sur le thread Tk.
+    """
+    def __init__(self, store, serveur, chemin=None):
+        self.store = store
+        self.serveur = serveur.rstrip("/")
+        self.chemin = chemin or chemin_etat(store)
+        self.etat = self._lire_etat()
+        self.borne = None  # Première seconde non couverte par le dernier preparer()
+        self.octets_envoyes = 0
+        self.octets_recus = 0
+
+    # --- État local ---
+    def _lire_etat(self):
+        try:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                etat = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            etat = {}
+        if etat.get("serveur") != self.serveur:
+            # Nouveau serveur : on repart de zéro (mais on garde l'identifiant)
+            etat = {"appareil": etat.get("appareil"), "serveur": self.serveur}
+        etat.setdefault("appareil", None)
+        etat["appareil"] = etat["appareil"] or uuid.uuid4().hex
+        etat.setdefault("curseur", 0)    # Dernière bascule reçue du serveur
+        etat.setdefault("envoye", None)  # Dernière seconde dont nos bascules ont été envoyées
+        # Bascules reçues du serveur plus récentes que "envoye" : à ne pas lui renvoyer
+        etat.setdefault("recus", [])
+        return etat
+
+    def _sauver_etat(self):
+        ecrire_json_atomique(self.chemin, self.etat)
+
+    def reinitialiser(self, nouvel_appareil=False):
+        if nouvel_appareil:
+            self.etat["appareil"] = uuid.uuid4().hex
+        self.etat["curseur"] = 0
+        self.etat["envoye"] = None
+        self.etat["recus"] = []
+
+    # --- Étapes ---
+    def preparer(self):
+        """
+        Nos bascules depuis la dernière synchronisation, dans l'ordre de
+        l'historique. La seconde en cours attend la synchronisation suivante :
+        une seconde envoyée est complète et n'est jamais renvoyée. Les
+        bascules reçues des autres appareils ne sont pas renvoyées non plus.
+        """
+        historique = self.store.historique
+        envoye = self.etat["envoye"]
+        self.borne = int(time.time())
+        lo, hi = historique.plage(None if envoye is None else envoye + 1, self.borne)
+        recus = {(ts, index, bool(valide)) for ts, index, valide in self.etat["recus"]}
+        # Le serveur ne garde qu'une fois (ts, case, état) : pour une case basculée
+        # plusieurs fois dans la même seconde, on garde la dernière occurrence de
+        # chaque état, pour que la dernière envoyée reste l'état final.
+        vus = set()
+        evenements = []
+        for pos in range(hi - 1, lo - 1, -1):
+            ts, index, valide = historique[pos]
+            if (ts, index, valide) not in vus:
+                vus.add((ts, index, valide))
+                if (ts, index, valide) not in recus:
+                    evenements.append([ts, index, int(valide)])
+        evenements.reverse()
+        return evenements
+
+    def echanger(self, evenements, empreinte):
+        """
+        Envoie `evenements` et reçoit ceux des autres appareils, par lots.
+        Ne touche pas au plateau (appelable hors du thread Tk).
+        Renvoie (bascules reçues, nouveau curseur).
+        """
+        recus = []
+        curseur = self.etat["curseur"]
+        position = 0
+        while True:
+            lot = evenements[position:position + TAILLE_LOT]
+            position += len(lot)
+            reponse = self._requete("POST", "/sync", {
+                "version": VERSION_PROTOCOLE,
+                "appareil": self.etat["appareil"],
+                "grille": empreinte,
+                "curseur": curseur,
+                "evenements": lot,
+            })
+            curseur = reponse["curseur"]
+            recus.extend(reponse["evenements"])
+            if position >= len(evenements) and not reponse.get("suite"):
+                return recus, curseur
+
+    def terminer(self, envoyes, recus, curseur):
+        """
+        Fusionne les bascules reçues et avance le curseur. Renvoie le nombre
+        de cases modifiées. Tout ce qui précédait la borne de preparer() est
+        envoyé ou venait du serveur : "envoye" passe à la seconde d'avant.
+        """
+        with mesures.span("sync.fusion"):
+            nb = self.store.fusionner(recus)
+        envoye = self.etat["envoye"]
+        if self.borne is not None:
+            envoye = self.borne - 1
+        elif envoyes:
+            envoye = max(ts for ts, _, _ in envoyes)
+        # Reçues pendant la seconde en cours (ou d'une horloge en avance) : relues au prochain preparer()
+        a_ignorer = {(ts, index, int(valide)) for ts, index, valide in self.etat["recus"]}
+        a_ignorer.update((ts, index, int(valide)) for ts, index, valide in recus)
+        self.etat["recus"] = sorted([ts, index, valide] for ts, index, valide in a_ignorer
+                                    if envoye is None or ts > envoye)
+        self.etat["envoye"] = envoye
+        self.etat["curseur"] = curseur
+        self._sauver_etat()
+        return nb
+
+    def synchroniser(self, publier=False, adopter=False):
+        """
+        Synchronisation complète. `publier` impose notre grille au serveur,
+        `adopter` remplace la nôtre par celle du serveur. Un serveur vide
+        reçoit notre grille, un appareil sans plateau prend celle du serveur.
+        """
+        self.octets_envoyes = self.octets_recus = 0
+        with mesures.span("sync"):
+            if adopter or not self.store.existe:
+                self.adopter()
+            elif publier:
+                self.publier()
+
+            empreinte = empreinte_grille(self.store.donnees)
+            envoyes = self.preparer()
+            try:
+                recus, curseur = self.echanger(envoyes, empreinte)
+            except ErreurSynchro as e:
+                if e.code != "grille_absente":
+                    raise
+                self.publier()
+                envoyes = self.preparer()
+                recus, curseur = self.echanger(envoyes, empreinte)
+            nb = self.terminer(envoyes, recus, curseur)
+
+        return {
+            "envoyes": len(envoyes),
+            "recus": len(recus),
+            "cases_modifiees": nb,
+            "octets_envoyes": self.octets_envoyes,
+            "octets_recus": self.octets_recus,
+        }
+
+    def publier(self):
+        """Notre grille devient celle du serveur ; son journal repart de zéro."""
+        self._requete("PUT", "/grille", {
+            "version": VERSION_PROTOCOLE,
+            "appareil": self.etat["appareil"],
+            "grille": grille(self.store.donnees),
+        })
+        self.reinitialiser()
+
+    def adopter(self):
+        """Remplace notre plateau par la grille du serveur (vierge) ; les bascules suivent."""
+        reponse = self._requete("GET", "/grille")
+        if not reponse.get("grille"):
+            raise ErreurSynchro("Le serveur n'a pas encore de grille")
+        self.store.remplacer(donnees_depuis_grille(reponse["grille"]))
+        # Nouvel identifiant : nos anciens envois doivent nous revenir comme ceux des autres
+        self.reinitialiser(nouvel_appareil=True)
+
+    # --- HTTP ---
+    def _requete(self, methode, chemin, objet=None):
+        corps, entetes = encoder(objet) if objet is not None else (None, {})
+        entetes["Accept-Encoding"] = "gzip"
+        requete = urllib.request.Request(self.serveur + chemin, data=corps, headers=entetes, method=methode)
+        self.octets_envoyes += len(corps or b"")
+        try:
+            with urllib.request.urlopen(requete, timeout=DELAI_RESEAU) as reponse:
+                brut = reponse.read()
+                self.octets_recus += len(brut)
+                return decoder(brut, reponse.headers.get("Content-Encoding"))
+        except urllib.error.HTTPError as e:
+            brut = e.read()
+            try:
+                detail = decoder(brut, e.headers.get("Content-Encoding"))
+            except (ValueError, OSError):
+                detail = {}
+            message = detail.get("message") or f"Erreur HTTP {e.code} ({self.serveur}{chemin})"
+            raise ErreurSynchro(message, detail.get("erreur")) from None
+        except (urllib.error.URLError, OSError) as e:
+            raise ErreurSynchro(f"Serveur injoignable ({self.serveur}) : {e}") from None
@@ -0,0 +1,104 @@
+# Motifs prédéfinis en plus des lignes / colonnes / diagonales
+MOTIFS_SPECIAUX = ("X", "coins", "carton plein")
+
+
+def est_ligne(nom):
+    """Vrai pour les lignes, colonnes et diagonales (les "bingos" classiques)."""
+    return nom.startswith(("ligne ", "colonne ")) or nom in ("diagonale", "anti-diagonale")
+
+
+def masque(indices):
+    """Entier dont les bits `indices` sont à 1."""
+    m = 0
+    for i in indices:
+        m |= 1 << i
+    return m
+
+
+def motifs_standards(taille, nb_cases):
+    """
+    Tous les motifs d'une grille taille x taille : lignes, colonnes, deux
+    diagonales, X, coins et carton plein. Renvoie {nom: [indices]}.
+    Les cases au-delà de `nb_cases` (dernière ligne incomplète) sont ignorées.
+    """
+    def garder(indices):
+        return [i for i in indices if i < nb_cases]
+
+    motifs = {}
+    for r in range(taille):
+        motifs[f"ligne {r + 1}"] = garder(r * taille + c for c in range(taille))
+    for c in range(taille):
+        motifs[f"colonne {c + 1}"] = garder(r * taille + c for r in range(taille))
+
+    diag = garder(i * taille + i for i in range(taille))
+    anti = garder(i * taille + (taille - 1 - i) for i in range(taille))
+    motifs["diagonale"] = diag
+    motifs["anti-diagonale"] = anti
+    motifs["X"] = sorted(set(diag) | set(anti))
+    motifs["coins"] = garder({0, taille - 1, (taille - 1) * taille, taille * taille - 1})
+    motifs["carton plein"] = list(range(nb_cases))
+    return {nom: indices for nom, indices in motifs.items() if indices}
+
+
+class DetecteurVictoire:
+    """
+    Détection des lignes et motifs complétés, sur un bitset.
+
+    L'état de validation est un entier (bit i = case i validée). Chaque motif
+    est un masque précalculé, et chaque case connaît la liste des motifs qui
+    la contiennent : une bascule ne teste que ces motifs-là, le coût dépend
+    de la case et pas de la taille de la grille.
+
+    Les abonnés reçoivent (evenement, nom_motif) avec evenement = "complete"
+    ou "rompu".
+    """
+    def __init__(self, taille, objectifs, motifs_perso=None):
+        nb_cases = len(objectifs)
+        motifs = motifs_standards(taille, nb_cases)
+        for nom, indices in (motifs_perso or {}).items():
+            indices = [i for i in indices if 0 <= i < nb_cases]
+            if indices:
+                motifs[nom] = indices
+
+        self.masques = {nom: masque(indices) for nom, indices in motifs.items()}
+        self.par_case = [[] for _ in range(nb_cases)]
+        for nom, indices in motifs.items():
+            for i in indices:
+                self.par_case[i].append(nom)
+
+        self.bits = masque(i for i, obj in enumerate(objectifs) if obj['valide'])
+        self.completes = {nom for nom, m in self.masques.items() if self.bits & m == m}
+        self.lignes_completes = sum(1 for nom in self.completes if est_ligne(nom))
+        self.abonnes = []
+
+    def abonner(self, callback):
+        self.abonnes.append(callback)
+
+    def desabonner(self, callback):
+        if callback in self.abonnes:
+            self.abonnes.remove(callback)
+
+    def basculer(self, index, valide):
+        """Met à jour le bitset et renvoie les événements déclenchés."""
+        bit = 1 << index
+        evenements = []
+        if valide:
+            self.bits |= bit
+            for nom in self.par_case[index]:
+                m = self.masques[nom]
+                if self.bits & m == m:
+                    self.completes.add(nom)
+                    self.lignes_completes += est_ligne(nom)
+                    evenements.append(("complete", nom))
+        else:
+            self.bits &= ~bit
+            for nom in self.par_case[index]:
+                if nom in self.completes:
+                    self.completes.discard(nom)
+                    self.lignes_completes -= est_ligne(nom)
+                    evenements.append(("rompu", nom))
+
+        for evenement, nom in evenements:
+            for callback in self.abonnes:
+                callback(evenement, nom)
+        return evenements
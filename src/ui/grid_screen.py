@@ -1,6 +1,8 @@
 import customtkinter as ctk
-import json
-from datetime import datetime
+import math
+from src.logic.mesures import mesures
+from src.logic.moteur import date_limite, jours_restants
+from src.ui.view_state import ViewState
 
 # --- DÉFINITION DES COULEURS ET FONTS (THEME) ---
 THEME = {
@@ -21,106 +23,262 @@ FONT_HEADER = ("Roboto", 18, "bold") # Pour le header
 FONT_NORMAL = ("Roboto", 12)         # Texte standard
 FONT_TILE = ("Roboto", 11, "bold")   # Texte des tuiles
 
+# Couleurs de base des tuiles (Non validé) selon la difficulté
+TILE_COLORS = {
+    1: "#2ecc71", # Emerald
+    2: "#f1c40f", # Sunflower
+    3: "#e67e22"  # Carrot
+}
+TILE_DEFAULT_COLOR = "#3498db"
+
+# Au-delà de cette taille, la grille est dessinée sur un seul canvas
+TAILLE_MAX_WIDGETS = 7
+
 class BingoTile(ctk.CTkButton):
-    def __init__(self, master, index, data, on_click_callback):
+    def __init__(self, master, index, data, on_click_callback, view):
         self.index = index
         self.poids = data['poids']
         self.titre = data['titre']
         self.callback = on_click_callback
+        # Dernier état affiché + regroupement des configure() (voir ViewState)
+        self.view = view
+        self.is_valid = data['valide']
+        self.hovered = False
         
         # Couleurs de base (Non validé) - Un peu plus pastels/modernes
-        self.colors = {
-            1: "#2ecc71", # Emerald
-            2: "#f1c40f", # Sunflower
-            3: "#e67e22"  # Carrot
-        }
-        self.base_color = self.colors.get(self.poids, "#3498db")
+        self.colors = TILE_COLORS
+        self.base_color = self.colors.get(self.poids, TILE_DEFAULT_COLOR)
 
+        # L'état initial est passé directement au constructeur (un seul dessin)
+        initial = self.visual_state()
         super().__init__(
             master,
             font=FONT_TILE,
             border_width=2,
-            border_color=THEME["bg_container"], # Bordure discrète par défaut
             corner_radius=12, # Angles plus arrondis
             hover_color=self.base_color, # Reste sur la couleur de base au survol si non validé
-            command=self.on_click
+            command=self.on_click,
+            **initial
         )
+        self.view.seed(self, **initial)
         
         # Effet de survol personnalisé : Bordure dorée
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
-        
-        self.update_visuals(data['valide'])
+
+    def visual_state(self):
+        """Options d'affichage attendues pour l'état (validé, survolé) courant."""
+        if self.is_valid:
+            # Look Validé : Fond vert sombre, texte doré, bordure dorée
+            state = {
+                "fg_color": THEME["tile_valid_bg"],
+                "text_color": THEME["accent_gold"],
+                "border_color": THEME["accent_gold"],
+                "text": f"✅\n{self.titre}"
+            }
+        else:
+            # Look Non Validé : Couleur de difficulté, bordure discrète
+            state = {
+                "fg_color": self.base_color,
+                "text_color": THEME["text_light"],
+                "border_color": THEME["bg_container"],
+                "text": f"{self.titre}\n{'★' * self.poids}"
+            }
+        if self.hovered:
+            state["border_color"] = THEME["tile_border_hover"]
+        return state
 
     # --- Effets de survol ---
     def on_enter(self, event):
         if self._state != "disabled":
-            self.configure(border_color=THEME["tile_border_hover"])
+            self.hovered = True
+            self.view.set(self, **self.visual_state())
             
     def on_leave(self, event):
         if self._state != "disabled":
-             # Retour à la couleur selon l'état
-            color = THEME["accent_gold"] if self.cget("text").startswith("✅") else THEME["bg_container"]
-            self.configure(border_color=color)
+            # Retour à la couleur selon l'état (lu dans le modèle, pas dans le texte du widget)
+            self.hovered = False
+            self.view.set(self, **self.visual_state())
 
     def on_click(self):
         if self._state != "disabled":
             self.callback(self.index)
 
     def update_visuals(self, is_valid):
+        self.is_valid = is_valid
+        self.view.set(self, **self.visual_state())
+
+
+class BingoCanvas(ctk.CTkCanvas):
+    """
+    Rendu alternatif de la grille : toutes les tuiles sont dessinées sur un
+    seul canvas (un rectangle arrondi + un texte par case) au lieu d'un
+    CTkButton par case. Le canvas gère lui-même le clic, le survol et ne
+    redessine que la case modifiée. Mêmes états visuels que BingoTile.
+    """
+    def __init__(self, master, objectifs, taille, on_click_callback):
+        super().__init__(master, bg=THEME["bg_container"], highlightthickness=0, bd=0)
+        self.objectifs = objectifs
+        self.taille = taille
+        self.nb_lignes = max(1, math.ceil(len(objectifs) / taille))
+        self.callback = on_click_callback
+        self.disabled = False
+
+        self.items = []          # (id_fond, id_texte) par case, créés au 1er affichage
+        self.outlines = []       # Couleur de bordure affichée par case
+        self.hover_index = None
+        self.cell_w = self.cell_h = 0
+
+        self.bind("<Configure>", self.on_resize)
+        self.bind("<Motion>", self.on_motion)
+        self.bind("<Leave>", self.on_leave)
+        self.bind("<Button-1>", self.on_press)
+
+    # --- Géométrie ---
+    def index_at(self, x, y):
+        """Hit-test arithmétique : case sous le point (x, y), ou None."""
+        if self.cell_w <= 0 or self.cell_h <= 0:
+            return None
+        col, row = int(x // self.cell_w), int(y // self.cell_h)
+        if not (0 <= col < self.taille and 0 <= row < self.nb_lignes):
+            return None
+        index = row * self.taille + col
+        return index if index < len(self.objectifs) else None
+
+    def tile_points(self, index):
+        """Polygone lissé d'un rectangle arrondi pour la case `index`."""
+        row, col = divmod(index, self.taille)
+        pad = max(1, min(8, int(min(self.cell_w, self.cell_h) * 0.06)))
+        x1, y1 = col * self.cell_w + pad, row * self.cell_h + pad
+        x2, y2 = (col + 1) * self.cell_w - pad, (row + 1) * self.cell_h - pad
+        r = max(2, min(12, (x2 - x1) / 4, (y2 - y1) / 4))
+        return (x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r,
+                x2, y2 - r, x2, y2, x2 - r, y2, x1 + r, y2,
+                x1, y2, x1, y2 - r, x1, y1 + r, x1, y1)
+
+    def tile_font(self):
+        size = max(6, min(FONT_TILE[1], int(min(self.cell_w, self.cell_h) / 9)))
+        return (FONT_TILE[0], size, FONT_TILE[2])
+
+    def on_resize(self, event):
+        self.cell_w = event.width / self.taille
+        self.cell_h = event.height / self.nb_lignes
+        font = self.tile_font()
+
+        if not self.items:
+            for i in range(len(self.objectifs)):
+                fond = self.create_polygon(self.tile_points(i), smooth=True, width=2)
+                texte = self.create_text(0, 0, justify="center")
+                self.items.append((fond, texte))
+                self.outlines.append(None)
+                self.update_visuals(i, self.objectifs[i]['valide'])
+
+        for i, (fond, texte) in enumerate(self.items):
+            row, col = divmod(i, self.taille)
+            self.coords(fond, self.tile_points(i))
+            self.coords(texte, (col + 0.5) * self.cell_w, (row + 0.5) * self.cell_h)
+            self.itemconfigure(texte, font=font, width=max(1, self.cell_w - 16))
+
+    # --- États visuels (identiques à BingoTile) ---
+    def update_visuals(self, index, is_valid):
+        if not self.items:
+            return  # Pas encore affiché : l'état sera lu au premier dessin
+        fond, texte = self.items[index]
+        obj = self.objectifs[index]
         if is_valid:
-            # Look Validé : Fond vert sombre, texte doré, bordure dorée
-            self.configure(
-                fg_color=THEME["tile_valid_bg"], 
-                text_color=THEME["accent_gold"],
-                border_color=THEME["accent_gold"],
-                text=f"✅\n{self.titre}"
-            )
+            border = THEME["accent_gold"]
+            self.itemconfigure(fond, fill=THEME["tile_valid_bg"])
+            self.itemconfigure(texte, fill=THEME["accent_gold"], text=f"✅\n{obj['titre']}")
         else:
-            # Look Non Validé : Couleur de difficulté, bordure discrète
-            self.configure(
-                fg_color=self.base_color,
-                text_color=THEME["text_light"],
-                border_color=THEME["bg_container"],
-                text=f"{self.titre}\n{'★' * self.poids}"
-            )
+            border = THEME["bg_container"]
+            self.itemconfigure(fond, fill=TILE_COLORS.get(obj['poids'], TILE_DEFAULT_COLOR))
+            self.itemconfigure(texte, fill=THEME["text_light"], text=f"{obj['titre']}\n{'★' * obj['poids']}")
+        if index == self.hover_index and not self.disabled:
+            border = THEME["tile_border_hover"]
+        self.set_outline(index, border)
+
+    def set_outline(self, index, color):
+        if self.outlines[index] != color:
+            self.outlines[index] = color
+            self.itemconfigure(self.items[index][0], outline=color)
+
+    def set_border(self, index):
+        if index == self.hover_index and not self.disabled:
+            color = THEME["tile_border_hover"]
+        elif self.objectifs[index]['valide']:
+            color = THEME["accent_gold"]
+        else:
+            color = THEME["bg_container"]
+        self.set_outline(index, color)
+
+    # --- Interaction ---
+    def on_motion(self, event):
+        index = self.index_at(event.x, event.y)
+        if index == self.hover_index or not self.items:
+            return
+        previous, self.hover_index = self.hover_index, index
+        if previous is not None:
+            self.set_border(previous)
+        if index is not None:
+            self.set_border(index)
+
+    def on_leave(self, event):
+        if self.hover_index is not None and self.items:
+            previous, self.hover_index = self.hover_index, None
+            self.set_border(previous)
+
+    def on_press(self, event):
+        index = self.index_at(event.x, event.y)
+        if index is not None and not self.disabled:
+            self.callback(index)
+
+    def set_disabled(self, disabled=True):
+        self.disabled = disabled
+        self.configure(cursor="" if disabled else "hand2")
+        if self.hover_index is not None and self.items:
+            self.set_border(self.hover_index)
 
 
 class GridScreen(ctk.CTkFrame):
-    def __init__(self, master, on_recap_callback=None):
+    def __init__(self, master, store, on_recap_callback=None):
         super().__init__(master, fg_color=THEME["bg_main"])
         self.on_recap_callback = on_recap_callback
         
-        self.config_file = "data/bingo_config.json"
         self.game_over = False
+        # Rendu différentiel : seules les options modifiées sont reconfigurées, une fois par tour
+        self.view = ViewState(self)
         
-        with open(self.config_file, "r", encoding="utf-8") as f:
-            self.full_data = json.load(f)
+        # Modèle partagé (chargé une seule fois par le main.py)
+        self.store = store
+        self.full_data = store.donnees
         
         self.objectifs = self.full_data['objectifs']
         self.recompenses = self.full_data['recompenses']
-        self.total_weight = sum(obj['poids'] for obj in self.objectifs)
+        # Score, paliers, lignes et taille NxN sont tenus par le moteur (store)
+        self.score = store.score
+        self.victoire = store.victoire
+        self.taille = store.taille
+        self.total_weight = self.score.poids_total
+        self.displayed_rank = self.score.rang
 
         self.days_remaining = self.get_days_remaining()
         if self.days_remaining == 0:
             self.game_over = True
 
         self.setup_ui()
-        self.update_progress_display()
+        self.update_progress_display(changed_tiers=self.score.noms)
         
         if self.game_over:
             self.disable_grid()
 
+        # Les bascules passent par le store, qui nous prévient en retour
+        self.store.abonner(self.on_store_change)
+
     def get_days_remaining(self):
-        target_date = datetime(2026, 12, 31)
-        now = datetime.now()
-        delta = target_date - now
-        return max(0, delta.days)
+        return jours_restants(self.full_data)
 
     def setup_ui(self):
-        # Ajout de padding global autour de tout l'écran
-        self.pack(padx=20, pady=20)
-
+        # Le padding global autour de l'écran est donné par le main.py (pack)
         self.grid_columnconfigure(0, weight=3)
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=0) # Header ne prend que la place nécessaire
@@ -134,6 +292,7 @@ class GridScreen(ctk.CTkFrame):
 
         # 1. Label Progression (Plus gros)
         self.lbl_progress = ctk.CTkLabel(self.header_frame, text="Progression : 0%", font=FONT_TITLE, text_color=THEME["accent_gold"])
+        self.view.seed(self.lbl_progress, text="Progression : 0%")
         self.lbl_progress.grid(row=0, column=0, sticky="w")
 
         # 2. Label Compte à rebours (Plus gros)
@@ -155,6 +314,7 @@ class GridScreen(ctk.CTkFrame):
         # 4. Barre de progression (Dorée et plus épaisse)
         self.progress_bar = ctk.CTkProgressBar(self.header_frame, height=15, corner_radius=8)
         self.progress_bar.set(0)
+        self.displayed_ratio = 0
         self.progress_bar.configure(progress_color=THEME["accent_gold"]) # Couleur OR
         self.progress_bar.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(15, 0))
 
@@ -163,16 +323,23 @@ class GridScreen(ctk.CTkFrame):
         # Ajout de padding à droite pour séparer de la sidebar
         self.grid_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 20))
         
-        for i in range(5):
-            self.grid_frame.grid_columnconfigure(i, weight=1)
-            self.grid_frame.grid_rowconfigure(i, weight=1)
-
         self.tiles = []
-        for i, obj in enumerate(self.objectifs):
-            tile = BingoTile(self.grid_frame, i, obj, self.toggle_objective)
-            # Plus d'espace entre les tuiles (padx/pady 5 -> 8)
-            tile.grid(row=i//5, column=i%5, padx=8, pady=8, sticky="nsew")
-            self.tiles.append(tile)
+        self.board_canvas = None
+        if self.taille > TAILLE_MAX_WIDGETS or self.full_data.get("rendu") == "canvas":
+            # Grandes grilles : un seul canvas au lieu d'un bouton par case
+            self.board_canvas = BingoCanvas(self.grid_frame, self.objectifs, self.taille, self.toggle_objective)
+            self.board_canvas.configure(cursor="hand2")
+            self.board_canvas.pack(fill="both", expand=True)
+        else:
+            for i in range(self.taille):
+                self.grid_frame.grid_columnconfigure(i, weight=1)
+                self.grid_frame.grid_rowconfigure(i, weight=1)
+
+            for i, obj in enumerate(self.objectifs):
+                tile = BingoTile(self.grid_frame, i, obj, self.toggle_objective, self.view)
+                # Plus d'espace entre les tuiles (padx/pady 5 -> 8)
+                tile.grid(row=i//self.taille, column=i%self.taille, padx=8, pady=8, sticky="nsew")
+                self.tiles.append(tile)
 
         # --- SIDEBAR (Nouveau look "Carte flottante") ---
         self.sidebar = ctk.CTkFrame(self, fg_color=THEME["bg_container"], corner_radius=20, border_width=1, border_color="#333333")
@@ -185,7 +352,8 @@ class GridScreen(ctk.CTkFrame):
         ctk.CTkLabel(header_sidebar, text="PALIERS & CADEAUX", font=FONT_HEADER, text_color=THEME["accent_gold"]).pack()
         
         self.reward_widgets = {}
-        paliers_order = ["bronze", "argent", "or", "platine"]
+        self.eta_labels = {}
+        paliers_order = self.score.noms
         emojis = {"bronze": "🥉", "argent": "🥈", "or": "🥇", "platine": "💎"}
         
         for key in paliers_order:
@@ -193,13 +361,47 @@ class GridScreen(ctk.CTkFrame):
             container = ctk.CTkFrame(self.sidebar, fg_color="transparent")
             container.pack(fill="x", padx=15, pady=12) # Plus d'espace vertical
             
-            lbl_title = ctk.CTkLabel(container, text=f"{emojis[key]} {key.capitalize()}", font=FONT_HEADER, text_color=THEME["text_gray"])
+            lbl_title = ctk.CTkLabel(container, text=f"{emojis.get(key, '🏅')} {key.capitalize()}", font=FONT_HEADER, text_color=THEME["text_gray"])
             lbl_title.pack(anchor="w")
             
             lbl_reward = ctk.CTkLabel(container, text=self.recompenses.get(key, "???"), font=FONT_NORMAL, text_color=THEME["text_gray"], wraplength=180, justify="left")
             lbl_reward.pack(anchor="w", padx=(25,0), pady=(5,0)) # Décalage du texte
+
+            # Date de déblocage, ou date prévue au rythme actuel
+            lbl_eta = ctk.CTkLabel(container, text="", font=FONT_NORMAL, text_color=THEME["text_gray"])
+            lbl_eta.pack(anchor="w", padx=(25,0))
             
             self.reward_widgets[key] = (lbl_title, lbl_reward)
+            self.eta_labels[key] = lbl_eta
+            self.view.seed(lbl_title, text_color=THEME["text_gray"])
+            self.view.seed(lbl_reward, text_color=THEME["text_gray"])
+            self.view.seed(lbl_eta, text="", text_color=THEME["text_gray"])
+
+        # --- Lignes & motifs complétés ---
+        lines_container = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        lines_container.pack(fill="x", padx=15, pady=12)
+        self.lbl_lines = ctk.CTkLabel(lines_container, text="", font=FONT_HEADER, text_color=THEME["text_gray"])
+        self.lbl_lines.pack(anchor="w")
+        self.lbl_last_pattern = ctk.CTkLabel(lines_container, text="", font=FONT_NORMAL, text_color=THEME["text_gray"], wraplength=180, justify="left")
+        self.lbl_last_pattern.pack(anchor="w", padx=(25,0), pady=(5,0))
+        self.view.seed(self.lbl_lines, text="", text_color=THEME["text_gray"])
+        self.view.seed(self.lbl_last_pattern, text="", text_color=THEME["text_gray"])
+        self.update_lines_display()
+        self.victoire.abonner(self.on_pattern_event)
+
+        # --- Rythme, série, taux par difficulté ---
+        stats_container = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        stats_container.pack(fill="x", padx=15, pady=12)
+        ctk.CTkLabel(stats_container, text="📈 RYTHME", font=FONT_HEADER, text_color=THEME["text_gray"]).pack(anchor="w")
+        self.lbl_pace = ctk.CTkLabel(stats_container, text="", font=FONT_NORMAL, text_color=THEME["text_gray"])
+        self.lbl_pace.pack(anchor="w", padx=(25,0), pady=(5,0))
+        self.lbl_streak = ctk.CTkLabel(stats_container, text="", font=FONT_NORMAL, text_color=THEME["text_gray"])
+        self.lbl_streak.pack(anchor="w", padx=(25,0))
+        self.lbl_rates = ctk.CTkLabel(stats_container, text="", font=FONT_NORMAL, text_color=THEME["text_gray"], wraplength=180, justify="left")
+        self.lbl_rates.pack(anchor="w", padx=(25,0))
+        for label in (self.lbl_pace, self.lbl_streak, self.lbl_rates):
+            self.view.seed(label, text="", text_color=THEME["text_gray"])
+        self.update_analytics_display()
 
     def open_recap(self):
         if self.on_recap_callback:
@@ -207,44 +409,122 @@ class GridScreen(ctk.CTkFrame):
 
     def toggle_objective(self, index):
         if self.game_over: return
-
-        current_state = self.objectifs[index]['valide']
-        new_state = not current_state
-        self.objectifs[index]['valide'] = new_state
+        # Le store modifie l'objectif, le persiste en fond et notifie les vues
+        with mesures.span("click"):
+            self.store.basculer(index)
+
+    def on_store_change(self, event, index):
+        if event == "bascule":
+            with mesures.span("render"):
+                self.render_toggle(index)
+        elif event == "objectif":
+            # Titre ou difficulté modifiés par un autre processus
+            self.refresh_goal(index)
+        elif event == "recompense":
+            self.view.set(self.reward_widgets[index][1], text=self.recompenses.get(index, "???"))
+        elif event == "historique":
+            # Entrées fusionnées sans bascule : jours actifs, rythme...
+            self.update_analytics_display()
+
+    def refresh_goal(self, index):
+        obj = self.objectifs[index]
+        if self.board_canvas is None:
+            tile = self.tiles[index]
+            tile.titre, tile.poids = obj['titre'], obj['poids']
+            tile.base_color = tile.colors.get(tile.poids, TILE_DEFAULT_COLOR)
+            self.view.set(tile, hover_color=tile.base_color)
+        self.refresh_tile(index, obj['valide'])
+        # Le poids total a pu changer : paliers à revoir
+        new_rank = self.score.rang
+        changed = self.score.paliers_modifies(self.displayed_rank, new_rank)
+        self.displayed_rank = new_rank
+        self.update_progress_display(changed_tiers=changed)
+        self.update_analytics_display()
+
+    def render_toggle(self, index):
+        new_state = self.objectifs[index]['valide']
+        self.refresh_tile(index, new_state)
+
+        # Score déjà mis à jour (±poids) par le store : on ne retouche que les paliers franchis
+        new_rank = self.score.rang
+        changed = self.score.paliers_modifies(self.displayed_rank, new_rank)
+        self.displayed_rank = new_rank
+        self.update_progress_display(changed_tiers=changed)
+        self.update_analytics_display()
         
-        if new_state:
-            self.objectifs[index]['date_validation'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            self.objectifs[index]['date_validation'] = None
+        # Bascule faite sur un autre appareil : la victoire y a déjà été célébrée
+        if new_state and not self.store.externe: self.check_victory()
 
-        self.tiles[index].update_visuals(new_state)
-        self.save_data()
-        self.update_progress_display()
-        
-        if new_state: self.check_victory()
+    def refresh_tile(self, index, is_valid):
+        if self.board_canvas is not None:
+            self.board_canvas.update_visuals(index, is_valid)
+        else:
+            self.tiles[index].update_visuals(is_valid)
 
-    def update_progress_display(self):
-        current_weight = sum(obj['poids'] for obj in self.objectifs if obj['valide'])
-        ratio = (current_weight / self.total_weight) if self.total_weight > 0 else 0
+    def update_progress_display(self, changed_tiers=()):
+        ratio = self.score.ratio
         percent = int(ratio * 100)
         
-        self.progress_bar.set(ratio)
-        self.lbl_progress.configure(text=f"Progression : {percent}%") # Simplifié
+        if ratio != self.displayed_ratio:
+            self.displayed_ratio = ratio
+            self.progress_bar.set(ratio)
+        self.view.set(self.lbl_progress, text=f"Progression : {percent}%") # Simplifié
 
-        thresholds = {"bronze": 0.25, "argent": 0.50, "or": 0.75, "platine": 1.0}
-        for key, limit in thresholds.items():
+        # Seuls les paliers dont l'état a changé sont reconfigurés
+        for key in changed_tiers:
             title_lbl, reward_lbl = self.reward_widgets[key]
-            if ratio >= limit:
+            if self.score.est_atteint(key):
                 # Palier atteint : Or brillant
-                title_lbl.configure(text_color=THEME["accent_gold"])
-                reward_lbl.configure(text_color=THEME["text_light"])
+                self.view.set(title_lbl, text_color=THEME["accent_gold"])
+                self.view.set(reward_lbl, text_color=THEME["text_light"])
             else:
                 # Non atteint : Gris discret
-                title_lbl.configure(text_color=THEME["text_gray"])
-                reward_lbl.configure(text_color=THEME["text_gray"])
+                self.view.set(title_lbl, text_color=THEME["text_gray"])
+                self.view.set(reward_lbl, text_color=THEME["text_gray"])
         return ratio
 
+    def update_lines_display(self):
+        nb = self.victoire.lignes_completes
+        color = THEME["accent_gold"] if nb else THEME["text_gray"]
+        self.view.set(self.lbl_lines, text=f"🎯 Lignes : {nb}", text_color=color)
+
+    def update_analytics_display(self):
+        """Rythme, série et projections, lus dans les agrégats du store (rien n'est recalculé)."""
+        analyse = self.store.analyse  # Remplacée par le store en cas de modification externe
+        rythme = analyse.rythme()
+        self.view.set(self.lbl_pace, text=f"⚡ {rythme:.1f} pts / semaine",
+                      text_color=THEME["text_light"] if rythme > 0 else THEME["text_gray"])
+        serie = analyse.serie()
+        self.view.set(self.lbl_streak, text=f"🔥 Série : {serie} j (record {analyse.record} j)",
+                      text_color=THEME["accent_gold"] if serie else THEME["text_gray"])
+        taux = "   ".join(f"{'★' * poids} {valides}/{total}"
+                           for poids, (valides, total) in analyse.taux_par_difficulte().items())
+        self.view.set(self.lbl_rates, text=taux)
+
+        for key, statut, quand in analyse.projections(self.score, date_limite(self.full_data)):
+            if statut == "atteint":
+                texte = f"✅ {quand:%d/%m/%Y}" if quand else "✅ Débloqué"
+                couleur = THEME["accent_green"]
+            elif statut == "prevu":
+                texte, couleur = f"📅 Prévu ~{quand:%d/%m/%Y}", THEME["text_light"]
+            elif statut == "hors_delai":
+                texte = f"⚠️ Hors délai (~{quand:%d/%m/%Y})" if quand else "⚠️ Hors délai"
+                couleur = THEME["accent_red"]
+            else:
+                texte, couleur = "⏸ À l'arrêt", THEME["text_gray"]
+            self.view.set(self.eta_labels[key], text=texte, text_color=couleur)
+
+    def on_pattern_event(self, event, pattern):
+        """Événement du détecteur : motif "complete" ou "rompu"."""
+        if event == "complete":
+            self.view.set(self.lbl_last_pattern, text=f"BINGO ! {pattern.capitalize()} ✨", text_color=THEME["accent_green"])
+        elif self.view.get(self.lbl_last_pattern, "text", "").startswith(f"BINGO ! {pattern.capitalize()}"):
+            self.view.set(self.lbl_last_pattern, text="")
+        self.update_lines_display()
+
     def disable_grid(self):
+        if self.board_canvas is not None:
+            self.board_canvas.set_disabled()
         for tile in self.tiles:
             tile.configure(state="disabled")
         
@@ -253,8 +533,7 @@ class GridScreen(ctk.CTkFrame):
         victory_label.place(relx=0.5, rely=0.5, anchor="center")
 
     def check_victory(self):
-        ratio = self.update_progress_display()
-        if ratio >= 1.0:
+        if self.score.ratio >= 1.0:
             self.show_victory_popup()
 
     def show_victory_popup(self):
@@ -278,5 +557,12 @@ class GridScreen(ctk.CTkFrame):
                       text_color=THEME["bg_container"], font=FONT_HEADER, height=40, corner_radius=20).pack(pady=10)
 
     def save_data(self):
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self.full_data, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+        """Force l'écriture des clics en attente (bloquant)."""
+        with mesures.span("save.vider"):
+            self.store.persistance.vider()
+
+    def destroy(self):
+        self.view.cancel()
+        self.store.desabonner(self.on_store_change)
+        self.victoire.desabonner(self.on_pattern_event)
+        super().destroy()
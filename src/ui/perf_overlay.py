@@ -0,0 +1,54 @@
+import customtkinter as ctk
+
+from src.logic.mesures import mesures
+
+REFRESH_MS = 500  # Rafraîchissement des statistiques quand l'overlay est visible
+
+
+class PerfOverlay(ctk.CTkFrame):
+    """
+    Panneau de debug (coin haut-droit) : p50 / p95 / max de chaque type
+    d'action mesurée. Les mesures ne sont collectées que tant qu'il est
+    affiché (ou qu'une trace BINGOAL_TRACE est ouverte).
+    """
+    def __init__(self, master):
+        super().__init__(master, fg_color="#111111", corner_radius=10, border_width=1, border_color="#F5C518")
+        self.visible = False
+        self.job = None
+
+        ctk.CTkLabel(self, text="⏱️ Latences (ms)   p50 / p95 / max", font=("Consolas", 12, "bold"),
+                     text_color="#F5C518").pack(anchor="w", padx=10, pady=(8, 2))
+        self.lbl_stats = ctk.CTkLabel(self, text="", font=("Consolas", 11), text_color="white", justify="left")
+        self.lbl_stats.pack(anchor="w", padx=10, pady=(0, 8))
+
+    def toggle(self, event=None):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        self.visible = True
+        mesures.activer("overlay")
+        self.place(relx=1.0, x=-10, y=10, anchor="ne")
+        self.lift()
+        self.refresh()
+
+    def hide(self):
+        self.visible = False
+        mesures.desactiver("overlay")
+        if self.job is not None:
+            self.after_cancel(self.job)
+            self.job = None
+        self.place_forget()
+
+    def refresh(self):
+        stats = mesures.statistiques()
+        if stats:
+            lignes = [f"{nom:<18} {s['p50_ms']:7.1f} {s['p95_ms']:7.1f} {s['max_ms']:7.1f}  (n={s['n']})"
+                      for nom, s in stats.items()]
+        else:
+            lignes = ["Aucune mesure : cliquez, naviguez..."]
+        self.lbl_stats.configure(text="\n".join(lignes))
+        self.lift()
+        self.job = self.after(REFRESH_MS, self.refresh)
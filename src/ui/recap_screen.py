@@ -1,78 +1,155 @@
 import customtkinter as ctk
-import json
 from datetime import datetime
+from functools import lru_cache
+
+from src.ui.virtual_list import VirtualList
+
+ROW_HEIGHT = 70  # Hauteur fixe d'une ligne de la timeline (px)
+
+
+# Filtres de période de la timeline : libellé -> nombre de jours (None = tout)
+PERIODES = {"Tout": None, "7 jours": 7, "30 jours": 30, "Cette année": "annee"}
+
+
+@lru_cache(maxsize=2048)
+def formater_date(ts):
+    """Formatage paresseux de l'horodatage (ex: 1768399320 -> '14 Jan 2026', '14:02')."""
+    try:
+        date_obj = datetime.fromtimestamp(ts)
+        return date_obj.strftime("%d %b %Y"), date_obj.strftime("%H:%M")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return "??", ""
+
 
 class RecapRow(ctk.CTkFrame):
-    """Une ligne de la timeline : Date à gauche, Succès à droite"""
-    def __init__(self, master, data):
-        super().__init__(master, fg_color="transparent")
-        
-        # Formatage de la date (ex: 2026-01-14 -> 14 Jan 2026)
-        try:
-            date_obj = datetime.strptime(data['date_validation'], "%Y-%m-%d %H:%M:%S")
-            date_str = date_obj.strftime("%d %b")
-            heure_str = date_obj.strftime("%H:%M")
-        except:
-            date_str = "??"
-            heure_str = ""
+    """Une ligne de la timeline : Date à gauche, Succès à droite.
+    Les lignes sont recyclées : `afficher()` change leur contenu sans les recréer."""
+    def __init__(self, master):
+        super().__init__(master, fg_color="transparent", height=ROW_HEIGHT)
 
         # Conteneur Date (Cercle ou encadré)
         self.date_frame = ctk.CTkFrame(self, width=80, fg_color="#34495e", corner_radius=10)
         self.date_frame.pack(side="left", padx=10, pady=5)
-        
-        ctk.CTkLabel(self.date_frame, text=date_str, font=("Arial", 14, "bold"), text_color="white").pack(pady=(5,0))
-        ctk.CTkLabel(self.date_frame, text=heure_str, font=("Arial", 10), text_color="gray80").pack(pady=(0,5))
+
+        self.lbl_date = ctk.CTkLabel(self.date_frame, text="", font=("Arial", 14, "bold"), text_color="white")
+        self.lbl_date.pack(pady=(5,0))
+        self.lbl_heure = ctk.CTkLabel(self.date_frame, text="", font=("Arial", 10), text_color="gray80")
+        self.lbl_heure.pack(pady=(0,5))
 
         # Conteneur Détails
         self.info_frame = ctk.CTkFrame(self, fg_color="gray20", corner_radius=10)
         self.info_frame.pack(side="left", fill="x", expand=True, padx=5, pady=5)
 
+        self.lbl_titre = ctk.CTkLabel(self.info_frame, text="", font=("Arial", 14, "bold"), text_color="white", anchor="w")
+        self.lbl_titre.pack(fill="x", padx=10, pady=(5,0))
+        self.lbl_poids = ctk.CTkLabel(self.info_frame, text="", font=("Arial", 12), anchor="w")
+        self.lbl_poids.pack(fill="x", padx=10, pady=(0,5))
+
+    def afficher(self, data):
+        date_str, heure_str = formater_date(data['ts'])
+
         # Couleur du titre selon poids
         colors = {1: "#2ecc71", 2: "#f1c40f", 3: "#e74c3c"}
         poids_color = colors.get(data['poids'], "white")
 
-        ctk.CTkLabel(self.info_frame, text=data['titre'], font=("Arial", 14, "bold"), text_color="white", anchor="w").pack(fill="x", padx=10, pady=(5,0))
-        ctk.CTkLabel(self.info_frame, text=f"Difficulté : {'★'*data['poids']}", font=("Arial", 12), text_color=poids_color, anchor="w").pack(fill="x", padx=10, pady=(0,5))
+        self.lbl_date.configure(text=date_str)
+        self.lbl_heure.configure(text=heure_str)
+        if data['valide']:
+            self.lbl_titre.configure(text=data['titre'], text_color="white")
+        else:
+            # Annulation : on garde la trace dans l'historique
+            self.lbl_titre.configure(text=f"↩ Annulé : {data['titre']}", text_color="gray60")
+        self.lbl_poids.configure(text=f"Difficulté : {'★'*data['poids']}", text_color=poids_color)
+
+
+class VirtualTimeline(VirtualList):
+    """Timeline de l'historique : VirtualList de RecapRow."""
+    def __init__(self, master, get_entry, **kwargs):
+        super().__init__(master, get_entry, row_factory=RecapRow, row_height=ROW_HEIGHT,
+                         span_name="render.timeline", **kwargs)
 
 
 class RecapScreen(ctk.CTkFrame):
-    def __init__(self, master, on_back_callback):
+    def __init__(self, master, store, on_back_callback):
         super().__init__(master)
         self.callback = on_back_callback
-        
+        self.store = store
+
         # Header avec bouton retour
         self.header = ctk.CTkFrame(self, height=60, fg_color="transparent")
         self.header.pack(fill="x", padx=20, pady=20)
-        
+
         self.btn_back = ctk.CTkButton(self.header, text="⬅ Retour", width=100, command=self.callback, fg_color="gray30", hover_color="gray40")
         self.btn_back.pack(side="left")
-        
+
         ctk.CTkLabel(self.header, text="📜 Mon Histoire 2026", font=("Arial", 24, "bold")).pack(side="left", padx=20)
 
-        # Zone de défilement pour la timeline
-        self.scroll = ctk.CTkScrollableFrame(self, label_text="Chronologie des succès", label_font=("Arial", 16, "bold"))
-        self.scroll.pack(fill="both", expand=True, padx=20, pady=10)
+        # Filtre de période (requêtes par plage sur l'historique trié)
+        self.period_selector = ctk.CTkSegmentedButton(self.header, values=list(PERIODES), command=self.on_period_change)
+        self.period_selector.set("Tout")
+        self.period_selector.pack(side="right")
+
+        # Zone de défilement virtualisée pour la timeline
+        ctk.CTkLabel(self, text="Chronologie des succès", font=("Arial", 16, "bold")).pack(padx=20)
+        self.timeline = VirtualTimeline(self, get_entry=self.get_entry)
+        self.timeline.pack(fill="both", expand=True, padx=20, pady=10)
+
+        # Fenêtre [lo, hi) de l'historique affichée, du plus récent au plus vieux
+        self.lo, self.hi = 0, 0
+        # Historique (objet, taille) lu par le dernier chargement
+        self.historique_lu = (None, 0)
+        self.lbl_empty = ctk.CTkLabel(self.timeline.viewport, text="Aucun objectif validé pour l'instant.\nAu travail ! 💪", font=("Arial", 16))
 
         self.charger_donnees()
+        # La vue reste en cache : on suit les bascules au lieu de tout reconstruire
+        self.store.abonner(self.on_store_change)
+
+    def get_entry(self, position):
+        ts, index, valide = self.store.historique[self.hi - 1 - position]
+        obj = self.store.objectifs[index]
+        return {"ts": ts, "titre": obj['titre'], "poids": obj['poids'], "valide": valide}
 
     def charger_donnees(self):
+        """Aucun tri : l'historique est déjà indexé par date, on lit une plage."""
         try:
-            with open("data/bingo_config.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-                objectifs = data.get("objectifs", [])
-                
-                # On ne garde que ceux qui sont validés ET qui ont une date
-                succes = [obj for obj in objectifs if obj['valide'] and obj.get('date_validation')]
-                
-                # On trie par date (du plus récent au plus vieux)
-                succes.sort(key=lambda x: x['date_validation'], reverse=True)
-
-                if not succes:
-                    ctk.CTkLabel(self.scroll, text="Aucun objectif validé pour l'instant.\nAu travail ! 💪", font=("Arial", 16)).pack(pady=50)
-                
-                for obj in succes:
-                    row = RecapRow(self.scroll, obj)
-                    row.pack(fill="x", pady=5)
+            historique = self.store.historique
+            self.historique_lu = (historique, len(historique))
+            periode = PERIODES[self.period_selector.get()]
+            if periode is None:
+                self.lo, self.hi = historique.plage()
+            elif periode == "annee":
+                self.lo, self.hi = historique.annee(datetime.now().year)
+            else:
+                self.lo, self.hi = historique.derniers_jours(periode)
+            self.refresh()
 
         except Exception as e:
-            ctk.CTkLabel(self.scroll, text=f"Erreur de lecture : {e}").pack()
\ No newline at end of file
+            ctk.CTkLabel(self.timeline.viewport, text=f"Erreur de lecture : {e}").pack()
+
+    def on_period_change(self, value):
+        self.timeline.offset = 0
+        self.charger_donnees()
+
+    def on_store_change(self, event, index):
+        """
+        Nouvel événement dans l'historique : il apparaît à sa place dans la
+        timeline. Les fusions et relectures externes ajoutent aussi des
+        entrées sans basculer de case ("historique").
+        """
+        if event in ("bascule", "historique", "recharge"):
+            historique = self.store.historique
+            if self.historique_lu != (historique, len(historique)):
+                self.charger_donnees()
+        elif event == "objectif":
+            self.timeline.redraw()  # Titre ou difficulté affichés dans les lignes visibles
+
+    def refresh(self):
+        self.timeline.set_count(self.hi - self.lo)
+        if self.hi > self.lo:
+            self.lbl_empty.place_forget()
+        else:
+            self.lbl_empty.place(relx=0.5, y=50, anchor="n")
+
+    def destroy(self):
+        self.store.desabonner(self.on_store_change)
+        super().destroy()
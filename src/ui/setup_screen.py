@@ -1,23 +1,34 @@
 import customtkinter as ctk
-import json
-import os
+from src.logic.modele_setup import TAILLE_PAR_DEFAUT, TAILLES_GRILLE, ModeleSetup
+from src.logic.moteur import creer_configuration
+from src.ui.virtual_list import VirtualList
+
+GOAL_ROW_HEIGHT = 46  # Hauteur fixe d'une ligne de l'éditeur (px)
+
 
 class GoalRow(ctk.CTkFrame):
     """
     Composant IHM représentant une ligne d'objectif dans la grille.
     Chaque ligne permet de définir un titre et une difficulté (poids).
+    Les lignes sont recyclées : `afficher(index)` les rattache à une autre
+    case du modèle, les saisies sont écrites dans le modèle au fil de l'eau.
     """
-    def __init__(self, master, index, default_text="", default_weight=1):
-        super().__init__(master, fg_color="transparent")
+    def __init__(self, master, model, on_paste_callback):
+        super().__init__(master, fg_color="transparent", height=GOAL_ROW_HEIGHT)
+        self.model = model
+        self.on_paste_callback = on_paste_callback
+        self.index = None
         
-        # Index de la case (1 à 25)
-        self.label = ctk.CTkLabel(self, text=f"{index+1:02d}.", width=40, font=("Helvetica", 12, "bold"))
+        # Index de la case (1 à N)
+        self.label = ctk.CTkLabel(self, text="", width=40, font=("Helvetica", 12, "bold"))
         self.label.pack(side="left", padx=5)
 
         # Champ de saisie pour l'objectif
         self.entry = ctk.CTkEntry(self, placeholder_text="Ex: Finir mon projet Python...", height=35)
-        self.entry.insert(0, default_text)
         self.entry.pack(side="left", padx=5, fill="x", expand=True)
+        self.entry.bind("<KeyRelease>", lambda e: self.commit())
+        self.entry.bind("<FocusOut>", lambda e: self.commit())
+        self.entry.bind("<<Paste>>", self.on_paste)
 
         # Sélecteur de difficulté (Poids de 1 à 3)
         # On mappe les étoiles aux valeurs numériques
@@ -28,24 +39,49 @@ class GoalRow(ctk.CTkFrame):
             self, 
             values=["★", "★★", "★★★"],
             selected_color="#3b8ed0",
-            selected_hover_color="#36719f"
+            selected_hover_color="#36719f",
+            command=self.on_weight_change
         )
-        self.difficulty_selector.set(self.diff_map.get(default_weight, "★"))
         self.difficulty_selector.pack(side="right", padx=5)
 
-    def get_data(self):
-        """Récupère les informations saisies sur la ligne."""
-        return {
-            "titre": self.entry.get(),
-            "poids": self.reverse_map.get(self.difficulty_selector.get(), 1),
-            "valide": False,
-            "date_validation": None
-        }
+    def afficher(self, index):
+        """Rattache la ligne à la case `index` du modèle."""
+        if index == self.index:
+            return
+        self.commit()
+        self.index = index
+        self.label.configure(text=f"{index+1:02d}.")
+        self.entry.delete(0, "end")
+        self.entry.insert(0, self.model.titres[index])
+        self.difficulty_selector.set(self.diff_map.get(self.model.poids[index], "★"))
+
+    def commit(self):
+        """Écrit le texte du champ dans le modèle."""
+        if self.index is not None:
+            self.model.definir_titre(self.index, self.entry.get())
+
+    def on_weight_change(self, value):
+        if self.index is not None:
+            self.model.definir_poids(self.index, self.reverse_map.get(value, 1))
+
+    def on_paste(self, event):
+        """Collage de plusieurs lignes : remplit les cases suivantes au lieu du seul champ."""
+        try:
+            texte = self.clipboard_get()
+        except Exception:
+            return None
+        if "\n" not in texte.strip():
+            self.after_idle(self.commit)  # Collage simple : le champ gère, on relit après
+            return None
+        self.on_paste_callback(texte, self.index)
+        return "break"
+
 
 class SetupScreen(ctk.CTkFrame):
     """
     IHM de la Phase 1 : Configuration du Bingoal.
     Permet de valider les objectifs issus du CSV et de fixer les récompenses.
+    Le temps d'ouverture ne dépend pas de la taille de la grille (liste virtualisée).
     """
     def __init__(self, master, initial_data=None, on_save_callback=None):
         super().__init__(master)
@@ -63,27 +99,35 @@ class SetupScreen(ctk.CTkFrame):
         )
         self.header.pack(pady=20)
 
-        # 2. Zone défilante pour les 25 objectifs
-        self.scroll_frame = ctk.CTkScrollableFrame(
-            self, 
-            label_text="Vérifiez vos 25 objectifs et ajustez la difficulté",
-            label_font=("Helvetica", 14, "bold"),
-            fg_color="gray15"
+        # Modèle des objectifs : les widgets ne sont qu'une fenêtre sur lui
+        objectifs = initial_data['objectifs'] if initial_data else []
+        taille = initial_data.get('taille_grille', TAILLE_PAR_DEFAUT) if initial_data else TAILLE_PAR_DEFAUT
+        self.model = ModeleSetup(objectifs, taille)
+
+        # 2. Zone défilante virtualisée : seules les lignes visibles sont construites
+        self.goals_frame = ctk.CTkFrame(self, fg_color="gray15")
+        self.goals_frame.pack(fill="both", expand=True, padx=30, pady=10)
+
+        toolbar = ctk.CTkFrame(self.goals_frame, fg_color="transparent")
+        toolbar.pack(fill="x", padx=10, pady=(10, 0))
+        self.lbl_goals = ctk.CTkLabel(toolbar, text="", font=("Helvetica", 14, "bold"))
+        self.lbl_goals.pack(side="left")
+        ctk.CTkButton(toolbar, text="📋 Coller des objectifs", width=160, fg_color="gray30", hover_color="gray40",
+                      command=self.paste_from_clipboard).pack(side="right", padx=(10, 0))
+        self.size_selector = ctk.CTkOptionMenu(toolbar, values=[f"{t}x{t}" for t in TAILLES_GRILLE], width=90,
+                                               command=self.on_size_change)
+        self.size_selector.pack(side="right")
+        ctk.CTkLabel(toolbar, text="Grille :").pack(side="right", padx=5)
+
+        self.goal_list = VirtualList(
+            self.goals_frame,
+            get_entry=lambda position: position,
+            row_factory=lambda master: GoalRow(master, self.model, self.paste_goals),
+            row_height=GOAL_ROW_HEIGHT,
+            fg_color="transparent"
         )
-        self.scroll_frame.pack(fill="both", expand=True, padx=30, pady=10)
-
-        self.goal_rows = []
-        for i in range(25):
-            # On récupère les données si elles existent (via le parser CSV)
-            txt = ""
-            poids = 1
-            if initial_data and i < len(initial_data['objectifs']):
-                txt = initial_data['objectifs'][i].get('titre', "")
-                poids = initial_data['objectifs'][i].get('poids', 1)
-            
-            row = GoalRow(self.scroll_frame, i, default_text=txt, default_weight=poids)
-            row.pack(fill="x", pady=5, padx=10)
-            self.goal_rows.append(row)
+        self.goal_list.pack(fill="both", expand=True, padx=10, pady=10)
+        self.refresh_goals()
 
         # 3. Section des Récompenses (Paliers)
         self.rewards_frame = ctk.CTkFrame(self, fg_color="gray20")
@@ -125,28 +169,48 @@ class SetupScreen(ctk.CTkFrame):
         )
         self.start_button.pack(pady=20)
 
+    # --- Objectifs ---
+    def refresh_goals(self):
+        nb = len(self.model)
+        self.lbl_goals.configure(text=f"Vérifiez vos {nb} objectifs et ajustez la difficulté")
+        self.size_selector.set(f"{self.model.taille}x{self.model.taille}")
+        for row in self.goal_list.pool:
+            row.index = None  # Contenu du modèle modifié : toutes les lignes sont relues
+        self.goal_list.set_count(nb)
+
+    def commit_rows(self):
+        for row in self.goal_list.pool:
+            row.commit()
+
+    def on_size_change(self, value):
+        self.commit_rows()
+        self.model.redimensionner(int(value.split("x")[0]))
+        self.refresh_goals()
+
+    def paste_goals(self, texte, debut=0):
+        """Collage en masse (une ligne par objectif, difficulté optionnelle après une tabulation)."""
+        self.commit_rows()
+        nb = self.model.coller(texte, debut or 0)
+        self.refresh_goals()
+        print(f"📋 {nb} objectifs collés")
+
+    def paste_from_clipboard(self):
+        try:
+            texte = self.clipboard_get()
+        except Exception:
+            print("⚠️ Presse-papiers vide ou illisible")
+            return
+        self.paste_goals(texte, 0)
+
     def save_configuration(self):
-        """Récupère toutes les données et les sauvegarde dans data/bingo_config.json"""
-        final_data = {
-            "version": "1.0",
-            "objectifs": [row.get_data() for row in self.goal_rows],
-            "recompenses": {k: v.get() for k, v in self.reward_entries.items()},
-            "stats": {
-                "total_poids": sum(row.get_data()['poids'] for row in self.goal_rows),
-                "date_creation": "2026-01-14"
-            }
-        }
-
-        # Création du dossier data s'il n'existe pas
-        if not os.path.exists("data"):
-            os.makedirs("data")
-
-        # Sauvegarde JSON
-        with open("data/bingo_config.json", "w", encoding="utf-8") as f:
-            json.dump(final_data, f, indent=4, ensure_ascii=False)
-
-        print("✅ Phase 1 terminée : Configuration enregistrée dans data/bingo_config.json")
-        
-        # Appel du callback pour dire au main.py de changer de vue
+        """Récupère toutes les données et les transmet au main.py pour sauvegarde."""
+        self.commit_rows()
+        final_data = creer_configuration(
+            self.model.vers_objectifs(),
+            {k: v.get() for k, v in self.reward_entries.items()},
+            taille_grille=self.model.taille
+        )
+
+        # Le main.py enregistre la config (BoardStore) puis change de vue
         if self.on_save_callback:
-            self.on_save_callback()
\ No newline at end of file
+            self.on_save_callback(final_data)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Couche d'état de vue : évite les configure() inutiles.
+
+Chaque configure() d'un widget CustomTkinter relance son dessin complet,
+même si la valeur ne change pas. ViewState retient, pour chaque widget, les
+options telles qu'elles sont affichées, et ne transmet que celles qui
+changent. Les changements d'un même tour de boucle Tk sont regroupés et
+appliqués en une fois (un configure() par widget) dans un after_idle.
+"""
+from src.logic.mesures import mesures
+
+
+class ViewState:
+    def __init__(self, owner):
+        self.owner = owner   # Widget qui porte l'after_idle
+        self.rendered = {}   # widget -> {option: valeur affichée}
+        self.pending = {}    # widget -> {option: valeur à appliquer}
+        self.scheduled = None
+
+    def seed(self, widget, **options):
+        """Déclare l'état initial (options déjà passées au constructeur du widget)."""
+        self.rendered.setdefault(widget, {}).update(options)
+
+    def get(self, widget, option, default=None):
+        """Valeur qui sera affichée après le prochain rendu."""
+        pending = self.pending.get(widget, {})
+        if option in pending:
+            return pending[option]
+        return self.rendered.get(widget, {}).get(option, default)
+
+    def set(self, widget, **options):
+        rendered = self.rendered.get(widget, {})
+        pending = self.pending.setdefault(widget, {})
+        for option, value in options.items():
+            if option in rendered and rendered[option] == value:
+                # Retour à la valeur affichée dans le même tour : plus rien à faire
+                pending.pop(option, None)
+            else:
+                pending[option] = value
+        if not pending:
+            del self.pending[widget]
+        elif self.scheduled is None:
+            self.scheduled = self.owner.after_idle(self.flush)
+
+    def flush(self):
+        """Applique les changements en attente : un seul configure() par widget."""
+        self.scheduled = None
+        pending, self.pending = self.pending, {}
+        with mesures.span("render.flush"):
+            for widget, options in pending.items():
+                if not widget.winfo_exists():
+                    self.rendered.pop(widget, None)
+                    continue
+                widget.configure(**options)
+                self.rendered.setdefault(widget, {}).update(options)
+
+    def cancel(self):
+        if self.scheduled is not None:
+            self.owner.after_cancel(self.scheduled)
+            self.scheduled = None
+        self.pending.clear()
@@ -0,0 +1,111 @@
+import customtkinter as ctk
+
+from src.logic.mesures import mesures
+
+WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Liste défilante virtualisée : seules les lignes visibles existent en tant
+    que widgets. Au défilement, les mêmes lignes sont repositionnées et
+    remplies avec d'autres entrées. Le coût d'ouverture et de défilement ne
+    dépend que de la hauteur de la fenêtre, pas du nombre d'entrées.
+
+    `row_factory(master)` crée une ligne de hauteur fixe `row_height` ; une
+    ligne expose `afficher(entree)`, avec `entree = get_entry(position)`.
+    """
+    def __init__(self, master, get_entry, row_factory, row_height, span_name="render.list", **kwargs):
+        super().__init__(master, **kwargs)
+        self.get_entry = get_entry  # position -> données de la ligne à afficher
+        self.row_factory = row_factory
+        self.row_height = row_height
+        self.span_name = span_name
+        self.count = 0
+        self.offset = 0             # Décalage vertical en pixels
+        self.pool = []
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda e: self.redraw())
+        # Molette : une étiquette de liaison propre à cette liste, posée sur le
+        # viewport et sur chaque ligne. Jamais bind_all / unbind_all : ces
+        # séquences sont partagées avec les CTkScrollableFrame des autres écrans.
+        self.wheel_tag = f"VirtualListWheel{id(self)}"
+        for sequence in WHEEL_SEQUENCES:
+            self.bind_class(self.wheel_tag, sequence, self.on_wheel)
+        self.tag_wheel(self.viewport)
+
+    # --- Données ---
+    def set_count(self, count):
+        self.count = count
+        self.offset = min(self.offset, self.max_offset())
+        self.redraw()
+
+    def max_offset(self):
+        return max(0, self.count * self.row_height - self.viewport.winfo_height())
+
+    # --- Défilement ---
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.max_offset()))
+        if offset != self.offset:
+            self.offset = offset
+            self.redraw()
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * self.count * self.row_height)
+        elif action == "scroll":
+            step = self.row_height if unit == "units" else self.viewport.winfo_height()
+            direction = 1 if float(value) > 0 else -1
+            self.scroll_to(self.offset + direction * step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - self.row_height)
+        else:
+            self.scroll_to(self.offset + self.row_height)
+
+    def tag_wheel(self, widget):
+        """Étiquette molette sur le widget et ses descendants (parties internes des widgets CTk comprises)."""
+        tags = widget.bindtags()
+        if self.wheel_tag not in tags:
+            widget.bindtags(tags[:1] + (self.wheel_tag,) + tags[1:])
+        for child in widget.winfo_children():
+            self.tag_wheel(child)
+
+    def destroy(self):
+        for sequence in WHEEL_SEQUENCES:
+            self.unbind_class(self.wheel_tag, sequence)
+        super().destroy()
+
+    # --- Rendu ---
+    def redraw(self):
+        with mesures.span(self.span_name):
+            self._redraw()
+
+    def _redraw(self):
+        height = self.viewport.winfo_height()
+        needed = height // self.row_height + 2
+        while len(self.pool) < needed:
+            row = self.row_factory(self.viewport)
+            self.tag_wheel(row)
+            self.pool.append(row)
+
+        first = self.offset // self.row_height
+        for k, row in enumerate(self.pool):
+            position = first + k
+            if k < needed and position < self.count:
+                row.afficher(self.get_entry(position))
+                row.place(x=0, y=position * self.row_height - self.offset, relwidth=1)
+            else:
+                row.place_forget()
+
+        total = self.count * self.row_height
+        if total <= height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
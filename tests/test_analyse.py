@@ -0,0 +1,163 @@
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from src.logic.analyse import AnalyseProgression, jour
+from src.logic.board_store import BoardStore
+from src.logic.historique import epoch_vers_date
+from src.logic.journal import JournalBingo, ecrire_json_atomique
+from src.logic.moteur import creer_configuration
+from src.logic.score import ModeleScore
+
+LUNDI = int(datetime(2026, 3, 2, 12).timestamp())
+JOUR = 86_400
+
+
+def objectifs(poids=(1, 2, 3, 1, 2, 3, 1, 2, 3)):
+    return [{"titre": f"Objectif {i}", "poids": p, "valide": False, "date_validation": None}
+            for i, p in enumerate(poids)]
+
+
+def resume(analyse):
+    """Tout l'état agrégé, pour comparer une analyse incrémentale à un rejeu complet."""
+    return {
+        "par_semaine": {s: p for s, p in analyse.par_semaine.items() if p},
+        "jours": analyse.jours,
+        "intervalles": analyse.fin_de,
+        "record": analyse.record,
+        "premier_jour": analyse.premier_jour,
+        "deblocages": analyse.deblocages,
+        "taux": analyse.taux_par_difficulte(),
+    }
+
+
+class TestAnalyseProgression(unittest.TestCase):
+    def test_series_et_intervalles(self):
+        historique = [(LUNDI + j * JOUR, j % 9, True) for j in (0, 1, 2, 5, 6)]
+        analyse = AnalyseProgression(objectifs(), historique)
+        self.assertEqual(analyse.record, 3)
+        self.assertEqual(analyse.serie(date.fromtimestamp(LUNDI + 6 * JOUR)), 2)
+        self.assertEqual(analyse.serie(date.fromtimestamp(LUNDI + 7 * JOUR)), 2)  # Journée pas finie
+        self.assertEqual(analyse.serie(date.fromtimestamp(LUNDI + 8 * JOUR)), 0)
+        # Les jours manquants comblent le trou : une seule série de 7 jours
+        analyse.enregistrer(LUNDI + 4 * JOUR, 1, True)
+        analyse.enregistrer(LUNDI + 3 * JOUR, 1, True)
+        self.assertEqual(analyse.record, 7)
+        self.assertEqual(analyse.fin_de, {jour(LUNDI): jour(LUNDI + 6 * JOUR)})
+
+    def test_une_annulation_n_active_pas_le_jour(self):
+        analyse = AnalyseProgression(objectifs(), [(LUNDI, 0, True), (LUNDI + JOUR, 0, False)])
+        self.assertEqual(analyse.jours, {jour(LUNDI)})
+        self.assertEqual(sum(analyse.par_semaine.values()), 0)
+
+    def test_rythme_sur_la_fenetre(self):
+        historique = [(LUNDI, 2, True), (LUNDI + 7 * JOUR, 5, True), (LUNDI + 14 * JOUR, 8, True)]
+        analyse = AnalyseProgression(objectifs(), historique)
+        self.assertEqual(analyse.rythme(date.fromtimestamp(LUNDI)), 3)                 # 1 semaine
+        self.assertEqual(analyse.rythme(date.fromtimestamp(LUNDI + 14 * JOUR)), 3)     # 9 pts / 3 semaines
+        self.assertEqual(analyse.rythme(date.fromtimestamp(LUNDI + 42 * JOUR)), 0)     # Hors fenêtre
+        self.assertEqual(AnalyseProgression(objectifs(), []).rythme(), 0.0)
+
+    def test_taux_par_difficulte_et_changement_de_poids(self):
+        liste = objectifs()
+        liste[0]["valide"] = liste[1]["valide"] = True
+        analyse = AnalyseProgression(liste, [])
+        self.assertEqual(analyse.taux_par_difficulte(), {1: (1, 3), 2: (1, 3), 3: (0, 3)})
+        analyse.changer_poids(1, 3, True)
+        self.assertEqual(analyse.taux_par_difficulte(), {1: (0, 2), 2: (1, 3), 3: (1, 4)})
+        analyse.compter(3, False)
+        self.assertEqual(analyse.taux_par_difficulte()[3], (0, 4))
+
+    def test_projections(self):
+        liste = objectifs((1,) * 8)
+        historique = [(LUNDI + i * JOUR, i, True) for i in range(3)]
+        for _, index, _ in historique:
+            liste[index]["valide"] = True
+        score = ModeleScore(liste)
+        analyse = AnalyseProgression(liste, historique)
+        maintenant = datetime.fromtimestamp(LUNDI + 3 * JOUR)
+        limite = maintenant + timedelta(weeks=1)
+        resultats = {nom: (statut, quand) for nom, statut, quand in analyse.projections(score, limite, maintenant)}
+        # 3/8 validés : bronze atteint le 2e jour (2/8), 3 pts par semaine ensuite
+        self.assertEqual(resultats["bronze"], ("atteint", datetime.fromtimestamp(LUNDI + JOUR)))
+        self.assertEqual(resultats["argent"], ("prevu", maintenant + timedelta(weeks=1 / 3)))
+        self.assertEqual(resultats["or"], ("prevu", limite))
+        self.assertEqual(resultats["platine"], ("hors_delai", maintenant + timedelta(weeks=5 / 3)))
+
+        a_l_arret = analyse.projections(score, limite, maintenant + timedelta(weeks=10))
+        self.assertEqual([statut for _, statut, _ in a_l_arret], ["atteint", "a_l_arret", "a_l_arret", "a_l_arret"])
+
+
+class TestAnalyseIncrementale(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "bingo_config.json")
+        ecrire_json_atomique(self.chemin, creer_configuration(objectifs(), {"bronze": "a", "argent": "b"}))
+        self.store = BoardStore(self.chemin, asynchrone=False)
+
+    def tearDown(self):
+        self.store.fermer()
+        self.dossier.cleanup()
+
+    def rejeu_complet(self):
+        return AnalyseProgression(self.store.objectifs, self.store.historique, self.store.donnees.get("paliers"))
+
+    def test_bascules_identiques_au_rejeu(self):
+        aleatoire = random.Random(7)
+        ts = LUNDI
+        for _ in range(300):
+            ts += aleatoire.choice((60, 3_600, JOUR, 3 * JOUR))
+            with mock.patch("src.logic.board_store.time.time", return_value=ts):
+                self.store.basculer(aleatoire.randrange(9))
+        self.assertEqual(resume(self.store.analyse), resume(self.rejeu_complet()))
+
+    def test_relecture_externe_sans_rejeu_complet(self):
+        with mock.patch("src.logic.board_store.time.time", return_value=LUNDI):
+            self.store.basculer(0)
+        autre = JournalBingo(self.chemin)
+        seq = autre.charger()["seq"]
+        evenements = [(LUNDI + JOUR, 4, True), (LUNDI + 2 * JOUR, 8, True), (LUNDI + 9 * JOUR, 4, False),
+                      (LUNDI + 10 * JOUR, 2, True)]
+        autre.enregistrer_lot([{"seq": seq + k + 1, "ts": ts, "index": index, "valide": valide,
+                                "date_validation": epoch_vers_date(ts) if valide else None}
+                               for k, (ts, index, valide) in enumerate(evenements)])
+
+        with mock.patch("src.logic.board_store.AnalyseProgression") as reconstruction:
+            self.assertEqual(self.store.synchroniser(), 2)
+        reconstruction.assert_not_called()
+        self.assertEqual(resume(self.store.analyse), resume(self.rejeu_complet()))
+        self.assertEqual(self.store.score.poids_valide, ModeleScore(self.store.objectifs).poids_valide)
+
+    def test_evenement_historique_seul_recale_le_score(self):
+        autre = JournalBingo(self.chemin)
+        autre.charger()
+        autre.enregistrer_lot([{"seq": 1, "ts": LUNDI, "index": 6, "valide": True,
+                                "date_validation": epoch_vers_date(LUNDI), "historique_seul": True}])
+        self.assertEqual(self.store.synchroniser(), 0)
+        self.assertEqual(self.store.score.poids_valide, 0)
+        self.assertEqual(self.store.analyse.taux_par_difficulte(), self.rejeu_complet().taux_par_difficulte())
+        self.assertEqual(self.store.analyse.jours, {jour(LUNDI)})
+
+    def test_poids_modifie_par_un_autre_processus(self):
+        with mock.patch("src.logic.board_store.time.time", return_value=LUNDI):
+            self.store.basculer(0)
+        autre = JournalBingo(self.chemin)
+        donnees = autre.charger()
+        donnees["objectifs"][0]["poids"] = 3
+        autre.compacter(donnees)
+
+        vus = []
+        self.store.abonner(lambda evenement, index: vus.append((evenement, index)))
+        self.assertEqual(self.store.synchroniser(), 1)
+        self.assertIn(("objectif", 0), vus)
+        attendu = ModeleScore(self.store.objectifs)
+        self.assertEqual((self.store.score.poids_valide, self.store.score.poids_total),
+                         (attendu.poids_valide, attendu.poids_total))
+        self.assertEqual(self.store.analyse.taux_par_difficulte(), self.rejeu_complet().taux_par_difficulte())
+
+
+if __name__ == "__main__":
+    unittest.main()
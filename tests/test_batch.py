@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.logic.batch import charger_lots, classement, np
+from src.logic.journal import JournalBingo, ecrire_json_atomique
+from src.logic.plateau_compact import PlateauCompact
+from src.logic.score import ModeleScore
+from src.logic.victoire import DetecteurVictoire
+
+
+def objectif(titre, poids, valide, date_validation=None, **extra):
+    return {"titre": titre, "poids": poids, "valide": valide, "date_validation": date_validation, **extra}
+
+
+def plateaux_de_test():
+    """Plateaux 3x3, dont plusieurs avec des objectifs hors format (exceptions du PlateauCompact)."""
+    simple = [objectif(f"o{i}", 1 + i % 3, i % 2 == 0) for i in range(9)]
+    lourd = [objectif(f"o{i}", 1, i < 4) for i in range(9)]
+    lourd[0] = objectif("Marathon", 300, True)                      # > 255
+    decimal = [objectif(f"o{i}", 2, i in (0, 4, 8)) for i in range(9)]
+    decimal[1] = objectif("Demi", 1.5, True)                        # Poids non entier
+    atypique = [objectif(f"o{i}", 3, i < 3) for i in range(9)]
+    atypique[0] = objectif("Date seule", 3, True, "2026-03-01")      # Date sans heure
+    atypique[1] = objectif("Note", 2, True, None, note="extra")      # Clé inconnue
+    return {"simple": simple, "lourd": lourd, "decimal": decimal, "atypique": atypique}
+
+
+@unittest.skipIf(np is None, "NumPy non installé")
+class TestChargerLots(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemins = []
+        self.objectifs = plateaux_de_test()
+        for nom, objectifs in self.objectifs.items():
+            chemin = os.path.join(self.dossier.name, nom, "bingo_config.json")
+            ecrire_json_atomique(chemin, {"taille_grille": 3, "objectifs": objectifs, "recompenses": {},
+                                          "historique": [[1_700_000_000 + i, i, True] for i in range(200)]})
+            self.chemins.append(chemin)
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_meme_score_que_modele_score(self):
+        resultats = {ligne["nom"]: ligne for ligne in classement(charger_lots(self.chemins))}
+        for chemin in self.chemins:
+            donnees = JournalBingo(chemin).charger()
+            nom = os.path.basename(os.path.dirname(chemin))
+            score = ModeleScore(donnees["objectifs"])
+            victoire = DetecteurVictoire(3, donnees["objectifs"])
+            with self.subTest(plateau=nom):
+                self.assertEqual(resultats[nom]["progression"], round(score.ratio * 100, 1))
+                self.assertEqual(resultats[nom]["palier"], score.palier_courant())
+                self.assertEqual(resultats[nom]["lignes"], victoire.lignes_completes)
+
+    def test_journal_non_compacte_rejoue(self):
+        journal = JournalBingo(self.chemins[0])
+        journal.charger()
+        journal.enregistrer_lot([{"seq": 1, "ts": 1_767_000_000, "index": 1, "valide": True},
+                                 {"seq": 2, "ts": 1_767_000_001, "index": 0, "valide": False}])
+        self.test_meme_score_que_modele_score()
+
+    def test_lecture_seule(self):
+        journal = JournalBingo(self.chemins[0])
+        journal.lire()
+        journal.enregistrer_lot([{"seq": 1, "ts": 1_767_000_000, "index": 1, "valide": True}])
+        avant = journal.empreinte_fichiers()
+        with mock.patch.object(JournalBingo, "doit_compacter", return_value=True):
+            charger_lots(self.chemins)
+        self.assertEqual(journal.empreinte_fichiers(), avant)
+        self.assertTrue(os.path.exists(journal.chemin_journal))
+
+    def test_noms_relatifs_a_la_racine(self):
+        chemins = []
+        for relatif in ("a/equipe/bingo_config.json", "b/equipe/bingo_config.json", "a/equipe/bis.json"):
+            chemin = os.path.join(self.dossier.name, "noms", relatif)
+            ecrire_json_atomique(chemin, {"taille_grille": 3, "objectifs": self.objectifs["simple"]})
+            chemins.append(chemin)
+        self.assertEqual(charger_lots(chemins)[3].noms, ["a/equipe", "b/equipe", "a/equipe/bis"])
+        racine = os.path.join(self.dossier.name, "noms", "a", "equipe")
+        self.assertEqual(charger_lots(chemins[:1], racine=racine)[3].noms, ["equipe"])
+
+    def test_paliers_propres_a_chaque_plateau(self):
+        paliers = {"petit": 0.1, "grand": 0.9}
+        chemin = os.path.join(self.dossier.name, "perso", "bingo_config.json")
+        ecrire_json_atomique(chemin, {"taille_grille": 3, "objectifs": self.objectifs["simple"], "paliers": paliers})
+        resultats = {ligne["nom"]: ligne for ligne in classement(charger_lots(self.chemins + [chemin]))}
+        for nom, objectifs, propres in [("perso", self.objectifs["simple"], paliers),
+                                        ("simple", self.objectifs["simple"], None)]:
+            with self.subTest(plateau=nom):
+                self.assertEqual(resultats[nom]["palier"], ModeleScore(objectifs, propres).palier_courant())
+        self.assertEqual(resultats["perso"]["palier"], "petit")
+        self.assertEqual(resultats["simple"]["palier"], "argent")
+
+    def test_poids_hors_octet_en_float(self):
+        lots = charger_lots(self.chemins)
+        self.assertEqual(lots[3].poids.dtype, np.float64)
+        noms = lots[3].noms
+        self.assertEqual(lots[3].poids[noms.index("lourd"), 0], 300)
+        self.assertEqual(lots[3].poids[noms.index("decimal"), 1], 1.5)
+
+    def test_poids_entiers_restent_en_octets(self):
+        lots = charger_lots([c for c in self.chemins if "simple" in c or "atypique" in c])
+        self.assertEqual(lots[3].poids.dtype, np.uint8)
+
+
+class TestPlateauCompact(unittest.TestCase):
+    def test_aller_retour_sans_perte(self):
+        for nom, objectifs in plateaux_de_test().items():
+            donnees = {"objectifs": objectifs, "recompenses": {"or": "x"}, "historique": [[1, 0, True]]}
+            with self.subTest(plateau=nom):
+                self.assertEqual(PlateauCompact.depuis_json(donnees).vers_json(), donnees)
+
+    def test_historique_non_conserve_pour_les_lots(self):
+        donnees = {"objectifs": plateaux_de_test()["simple"], "historique": [[1, 0, True]] * 1000}
+        plateau = PlateauCompact.depuis_json(donnees, garder_historique=False)
+        self.assertNotIn("historique", plateau.meta)
+
+
+if __name__ == "__main__":
+    unittest.main()
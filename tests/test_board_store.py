@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.logic.board_store import BoardStore
+from src.logic.journal import JournalBingo, ecrire_json_atomique
+from src.logic.moteur import creer_configuration
+
+
+def configuration():
+    objectifs = [{"titre": f"Objectif {i}", "poids": 1 + i % 3} for i in range(9)]
+    return creer_configuration(objectifs, {"bronze": "a", "argent": "b", "or": "c", "platine": "d"})
+
+
+class TestSynchroniserJSON(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "bingo_config.json")
+        ecrire_json_atomique(self.chemin, configuration())
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_nos_ecritures_ne_forcent_pas_la_rafale(self):
+        store = BoardStore(self.chemin)
+        store.persistance.delai = 60  # La rafale ne part pas d'elle-même
+        store.basculer(0)
+        store.persistance.vider()
+        store.basculer(1)  # En attente
+        self.assertIsNone(store.synchroniser())
+        self.assertEqual(store.persistance.metriques()["en_attente"], 1)
+        store.fermer()
+        self.assertTrue(JournalBingo(self.chemin).charger()["objectifs"][1]["valide"])
+
+    def test_ecriture_externe_et_conflit_rejoue(self):
+        store = BoardStore(self.chemin)
+        autre = JournalBingo(self.chemin)
+        donnees = autre.charger()
+        donnees["objectifs"][2].update(valide=True, date_validation="2026-01-02 10:00:00")
+        autre.enregistrer_lot([{"seq": 1, "ts": 1_767_344_400, "index": 2, "valide": True,
+                                "date_validation": "2026-01-02 10:00:00"}])
+        store.basculer(5)  # Écrite par-dessus une version périmée : conflit
+        store.persistance.vider()
+        self.assertTrue(store.persistance.en_conflit())
+
+        self.assertGreaterEqual(store.synchroniser(), 2)
+        store.fermer()
+        relu = JournalBingo(self.chemin).charger()
+        self.assertTrue(relu["objectifs"][2]["valide"])
+        self.assertTrue(relu["objectifs"][5]["valide"])
+
+    def test_relecture_sans_bascule_notifie_l_historique(self):
+        store = BoardStore(self.chemin)
+        vus = []
+        store.abonner(lambda evenement, index: vus.append(evenement))
+        autre = JournalBingo(self.chemin)
+        autre.charger()
+        autre.enregistrer_lot([{"seq": 1, "ts": 1_767_344_400, "index": 2, "valide": True,
+                                "date_validation": "2026-01-02 10:00:00", "historique_seul": True}])
+        self.assertEqual(store.synchroniser(), 0)
+        self.assertEqual(vus, ["historique"])
+        self.assertEqual(len(store.historique), 1)
+        store.fermer()
+
+    def test_lecture_impossible_garde_les_conflits(self):
+        store = BoardStore(self.chemin)
+        autre = JournalBingo(self.chemin)
+        autre.charger()
+        autre.enregistrer_lot([{"seq": 1, "ts": 1_767_344_400, "index": 2, "valide": True,
+                                "date_validation": "2026-01-02 10:00:00"}])
+        store.basculer(5)
+        store.persistance.vider()
+        self.assertTrue(store.persistance.en_conflit())
+
+        # Écriture non atomique d'un autre outil, surprise à mi-chemin
+        with open(self.chemin, "r", encoding="utf-8") as f:
+            complet = f.read()
+        with open(self.chemin, "w", encoding="utf-8") as f:
+            f.write(complet[:len(complet) // 2])
+        with self.assertRaises(json.JSONDecodeError):
+            store.synchroniser()
+        self.assertTrue(store.persistance.en_conflit())
+
+        with open(self.chemin, "w", encoding="utf-8") as f:
+            f.write(complet)
+        store.synchroniser()
+        self.assertFalse(store.persistance.en_conflit())
+        store.fermer()
+        relu = JournalBingo(self.chemin).charger()
+        self.assertTrue(relu["objectifs"][2]["valide"])
+        self.assertTrue(relu["objectifs"][5]["valide"])
+
+
+if __name__ == "__main__":
+    unittest.main()
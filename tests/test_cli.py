@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from src.logic import cli, export
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestImportsCLI(unittest.TestCase):
+    def test_commandes_courantes_sans_modules_lourds(self):
+        code = ("import sys, src.logic.cli; "
+                "print(sorted(m for m in ('src.logic.export', 'src.logic.import_lot', 'src.logic.synchro', "
+                "'concurrent.futures', 'urllib.request', 'http.client') if m in sys.modules))")
+        sortie = subprocess.run([sys.executable, "-c", code], cwd=RACINE, capture_output=True, text=True, check=True)
+        self.assertEqual(sortie.stdout.strip(), "[]")
+
+    def test_formats_identiques_a_l_export(self):
+        self.assertEqual(cli.FORMATS_EXPORT, export.FORMATS)
+
+
+if __name__ == "__main__":
+    unittest.main()
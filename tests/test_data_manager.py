@@ -0,0 +1,138 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from src.logic.data_manager import classer_palier, extraire_donnees_csv, nettoyer_texte_recompense
+
+CSV_GSHEET = """IGNORE,B,I,N,G,O,IGNORE,IGNORE,IGNORE,IGNORE,IGNORE,RECOMPENSES
+IGNORE,a1,a2,a3,a4,a5,,,,
+IGNORE,b1,b2,b3,b4,b5,,,,
+IGNORE,c1,c2,c3,c4,c5,,,,
+IGNORE,d1,d2,d3,d4,d5,,,,
+IGNORE,e1,e2,e3,e4,e5,,,,
+IGNORE,,,,,,,,,,,
+IGNORE,🥉 Niveau BRONZE : Une sucette,,,,,,,,,
+IGNORE,🥈 Niveau ARGENT : Un Kebab complet (Chef),,,,,,,,,
+IGNORE,🥇 Niveau OR : Une nouvelle Carte Graphique,,,,,,,,,
+IGNORE,💎 Niveau PLATINE : Un voyage sur Mars (Aller simple),,,,,,,,,
+"""
+
+# Paliers cités deux fois (colonne RECOMPENSES, puis texte libre) : la dernière ligne l'emporte.
+# Pas de "OR" dans les autres cellules : l'ancien parseur le cherchait en sous-chaîne.
+CSV_DOUBLONS = """X,B,I,N,G,O,,,,,,RECOMPENSES
+X,a1,a2,a3,a4,a5,,,,,,
+X,b1,b2,b3,b4,b5,,,,,,
+X,c1,c2,c3,c4,c5,,,,,,
+X,d1,d2,d3,d4,d5,,,,,,
+X,e1,e2,e3,e4,e5,,,,,,
+X,,,,,,,,,,,
+X,Palier BRONZE,,,,,,,,,,Une sucette
+X,Palier ARGENT,,,,,,,,,,Un kebab
+X,Palier OR,,,,,,,,,,Un vélo
+X,Palier PLATINE,,,,,,,,,,Un voyage
+X,,,,,,,,,,,
+X,Palier BRONZE,,,,,,,,,,Deux sucettes
+X,Palier OR,,,,,,,,,,Un vélo neuf
+X,BRONZE : Trois sucettes,,,,,,,,,,
+"""
+
+
+def ecrire_csv(dossier, contenu, nom="grille.csv"):
+    chemin = os.path.join(dossier, nom)
+    with open(chemin, "w", encoding="utf-8", newline="") as f:
+        f.write(contenu)
+    return chemin
+
+
+class TestRecompenses(unittest.TestCase):
+    def test_etiquette_retiree_en_tete_et_en_fin(self):
+        cas = {
+            "🥉 Niveau BRONZE : Une sucette": "Une sucette",
+            "Palier Or (75% de la grille) : Un vélo": "Un vélo",
+            "Niveau Or (3 Etoiles) : Un Kebab": "Un Kebab",
+            "Bronze:Une sucette": "Une sucette",
+            "Une sucette (Bronze)": "Une sucette",
+            "Un vélo - Niveau Or 75%": "Un vélo",
+            "🥇 Une montre": "Une montre",
+            "💎 Niveau PLATINE : Un voyage sur Mars (Aller simple)": "Un voyage sur Mars (Aller simple)",
+        }
+        for texte, attendu in cas.items():
+            with self.subTest(texte=texte):
+                self.assertEqual(nettoyer_texte_recompense(texte), attendu)
+
+    def test_pourcentage_et_palier_dans_le_cadeau(self):
+        cas = {
+            "Bronze : Bon de 20% chez X": "Bon de 20% chez X",
+            "Bon de 20% chez X": "Bon de 20% chez X",
+            "Argent : Silver watch": "Silver watch",
+            "Silver watch": "Silver watch",
+            "Gold-plated pen": "Gold-plated pen",
+            "Or : 2026 Vacances": "2026 Vacances",
+            "Platine : Week-end à Rome, 3 étoiles de la grille des hôtels": "Week-end à Rome, 3 étoiles de la grille des hôtels",
+        }
+        for texte, attendu in cas.items():
+            with self.subTest(texte=texte):
+                self.assertEqual(nettoyer_texte_recompense(texte), attendu)
+
+    def test_etiquette_seule(self):
+        self.assertEqual(nettoyer_texte_recompense("🥉 BRONZE (25%)"), "")
+
+    def test_classement(self):
+        self.assertEqual(classer_palier("Niveau OR : x"), "or")
+        self.assertIsNone(classer_palier("pizza or sushi"))
+        self.assertIsNone(classer_palier("IGNORE"))
+        self.assertEqual(classer_palier("🥈 x"), "argent")
+
+
+class TestExtraireDonneesCSV(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_format_gsheet(self):
+        donnees = extraire_donnees_csv(ecrire_csv(self.dossier.name, CSV_GSHEET))
+        self.assertEqual([obj["titre"] for obj in donnees["objectifs"]][:6], ["a1", "a2", "a3", "a4", "a5", "b1"])
+        self.assertEqual(len(donnees["objectifs"]), 25)
+        self.assertEqual(donnees["recompenses"], {
+            "bronze": "Une sucette",
+            "argent": "Un Kebab complet (Chef)",
+            "or": "Une nouvelle Carte Graphique",
+            "platine": "Un voyage sur Mars (Aller simple)",
+        })
+
+    def test_cadeau_avec_pourcentage(self):
+        contenu = CSV_GSHEET.replace("🥉 Niveau BRONZE : Une sucette", "Bronze : Bon de 20% chez X")
+        donnees = extraire_donnees_csv(ecrire_csv(self.dossier.name, contenu))
+        self.assertEqual(donnees["recompenses"]["bronze"], "Bon de 20% chez X")
+
+    def test_derniere_mention_l_emporte(self):
+        donnees = extraire_donnees_csv(ecrire_csv(self.dossier.name, CSV_DOUBLONS))
+        self.assertEqual(donnees["recompenses"], {
+            "bronze": "Trois sucettes",
+            "argent": "Un kebab",
+            "or": "Un vélo neuf",
+            "platine": "Un voyage",
+        })
+
+    def test_identique_a_l_ancien_parseur_pandas(self):
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas non installé (référence de l'ancien import)")
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+        try:
+            from bench_import_csv import extraire_donnees_csv_pandas
+        finally:
+            sys.path.pop(0)
+        chemin = ecrire_csv(self.dossier.name, CSV_DOUBLONS)
+        self.assertEqual(extraire_donnees_csv(chemin), extraire_donnees_csv_pandas(chemin))
+
+    def test_fichier_absent(self):
+        self.assertIsNone(extraire_donnees_csv(os.path.join(self.dossier.name, "absent.csv")))
+
+
+if __name__ == "__main__":
+    unittest.main()
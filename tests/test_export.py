@@ -0,0 +1,144 @@
+import gzip
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from src.logic.board_store import BoardStore
+from src.logic.export import FluxJSON, exporter, generer_rapport, lister_sources, trier_par_date
+from src.logic.journal import ecrire_json_atomique
+from src.logic.moteur import creer_configuration
+from src.logic.stockage import StockageSQLite, importer_json
+
+
+def configuration():
+    objectifs = [{"titre": f"Objectif {i}", "poids": 1 + i % 3} for i in range(9)]
+    return creer_configuration(objectifs, {"bronze": "a", "argent": "b", "or": "c", "platine": "d"})
+
+
+class TestFluxJSON(unittest.TestCase):
+    DOCUMENT = {
+        "version": "1.0",
+        "objectifs": [{"titre": "Écrire \"vite\" ✍️", "poids": 3, "valide": True}] * 5,
+        "historique": [[1_767_000_000 + i * 123_457, i % 25, i % 3 == 0] for i in range(200)],
+        "vide": [],
+        "imbrique": [[1, [2, [3]]], {"a": [4.5e-3, None]}],
+        "nombre": 1234567890,
+    }
+
+    def lire(self, texte):
+        """Parcourt tout le document en lisant les tableaux élément par élément."""
+        flux = FluxJSON(io.StringIO(texte))
+        lu = {}
+        for cle in flux.cles():
+            if isinstance(self.DOCUMENT.get(cle), list):
+                lu[cle] = list(flux.elements())
+            else:
+                lu[cle] = flux.valeur()
+        return lu
+
+    def test_valeurs_a_cheval_sur_les_blocs(self):
+        for indent in (None, 4):
+            texte = json.dumps(self.DOCUMENT, indent=indent, ensure_ascii=False)
+            for taille in (1, 2, 3, 7, 64):
+                with self.subTest(indent=indent, taille=taille), mock.patch("src.logic.export.TAILLE_BLOC", taille):
+                    self.assertEqual(self.lire(texte), self.DOCUMENT)
+
+    def test_ignorer(self):
+        texte = json.dumps(self.DOCUMENT)
+        with mock.patch("src.logic.export.TAILLE_BLOC", 5):
+            flux = FluxJSON(io.StringIO(texte))
+            vus = {}
+            for cle in flux.cles():
+                if cle == "nombre":
+                    vus[cle] = flux.valeur()
+                else:
+                    flux.ignorer()
+        self.assertEqual(vus, {"nombre": 1234567890})
+
+    def test_objet_vide(self):
+        self.assertEqual(list(FluxJSON(io.StringIO(" { } ")).cles()), [])
+
+    def test_json_tronque(self):
+        texte = json.dumps(self.DOCUMENT)
+        for coupure in (len(texte) // 2, len(texte) - 1, 15):
+            with self.subTest(coupure=coupure), mock.patch("src.logic.export.TAILLE_BLOC", 8):
+                with self.assertRaises(ValueError):
+                    self.lire(texte[:coupure])
+
+
+class TestTriParDate(unittest.TestCase):
+    def test_passes_sur_disque(self):
+        aleatoire = random.Random(3)
+        evenements = [(aleatoire.randrange(50), aleatoire.randrange(9), aleatoire.random() < 0.5) for _ in range(1000)]
+        attendu = [e for _, e in sorted(enumerate(evenements), key=lambda p: (p[1][0], p[0]))]
+        self.assertEqual(list(trier_par_date(iter(evenements), taille=64)), attendu)
+        self.assertEqual(list(trier_par_date(iter(evenements))), attendu)
+
+    def test_vide(self):
+        self.assertEqual(list(trier_par_date(iter([]), taille=4)), [])
+
+
+class TestRapport(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "bingo_config.json")
+        ecrire_json_atomique(self.chemin, configuration())
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def plateau_fusionne(self):
+        """Bascules locales récentes, puis bascules plus anciennes reçues d'un autre appareil (fin de journal)."""
+        store = BoardStore(self.chemin, asynchrone=False)
+        for index in range(6):
+            store.basculer(index)
+        store.fusionner([[1_600_000_000 + i, 6 + i % 3, True] for i in range(3)])
+        store.fermer()
+
+    def rapport(self, chemin):
+        return [(type_, {k: v for k, v in e.items() if k != "plateau"})
+                for type_, e in generer_rapport(lister_sources(chemin))]
+
+    def test_json_et_sqlite_identiques(self):
+        self.plateau_fusionne()
+        base = os.path.join(self.dossier.name, "bingoal.db")
+        stockage = StockageSQLite(base, "plateau")
+        importer_json(stockage, self.chemin)
+        stockage.fermer()
+
+        rapport_json = self.rapport(self.chemin)
+        self.assertEqual(rapport_json, self.rapport(base))
+        validations = [e["ts"] for type_, e in rapport_json if type_ == "validation"]
+        self.assertEqual(validations, sorted(validations))
+        # Le bronze est débloqué par les bascules anciennes de l'autre appareil
+        paliers = {e["palier"]: e["ts"] for type_, e in rapport_json if type_ == "palier"}
+        self.assertLess(paliers["bronze"], 1_700_000_000)
+
+    def test_nom_du_plateau_a_la_racine(self):
+        noms = [source.nom for source in lister_sources(self.dossier.name)]
+        self.assertEqual(noms, [os.path.basename(self.dossier.name)])
+
+    def test_extension_html_compresse(self):
+        sortie = os.path.join(self.dossier.name, "rapports", "nuit")
+        chemins, _ = exporter(self.chemin, sortie, "html", compresser=True)
+        self.assertEqual(chemins, [sortie + ".html.gz"])
+        with gzip.open(chemins[0], "rt", encoding="utf-8") as f:
+            self.assertIn("<h2>", f.read())
+
+    def test_jsonl(self):
+        self.plateau_fusionne()
+        sortie = os.path.join(self.dossier.name, "nuit.jsonl")
+        chemins, compteurs = exporter(self.chemin, sortie, "jsonl")
+        self.assertEqual(chemins, [sortie])
+        with open(sortie, encoding="utf-8") as f:
+            types = [json.loads(ligne)["type"] for ligne in f]
+        self.assertEqual(types.count("validation"), compteurs["validation"])
+        self.assertEqual(types[0], "plateau")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import unittest
+from datetime import datetime
+
+from src.logic.historique import (UN_JOUR, HistoriqueValidations, date_vers_epoch, epoch_vers_date,
+                                  historique_initial)
+
+
+def ts(*date):
+    return int(datetime(*date).timestamp())
+
+
+class TestHistoriqueValidations(unittest.TestCase):
+    def setUp(self):
+        self.historique = HistoriqueValidations([(300, 3, True), (100, 1, True), (200, 2, False), (200, 4, True)])
+
+    def test_tri_stable_a_la_construction(self):
+        self.assertEqual(list(self.historique.entre()),
+                         [(100, 1, True), (200, 2, False), (200, 4, True), (300, 3, True)])
+
+    def test_ajout_a_sa_place(self):
+        self.assertEqual(self.historique.ajouter(400, 5, True), 4)   # En fin : cas courant
+        self.assertEqual(self.historique.ajouter(200, 6, True), 3)   # Après les égalités
+        self.assertEqual(self.historique.ajouter(50, 7, False), 0)
+        self.assertEqual([e[1] for e in self.historique.entre()], [7, 1, 2, 4, 6, 3, 5])
+
+    def test_bornes_de_plage(self):
+        # debut inclus, fin exclue
+        self.assertEqual(self.historique.plage(200, 300), (1, 3))
+        self.assertEqual(self.historique.plage(201, 300), (3, 3))
+        self.assertEqual(self.historique.plage(200, 301), (1, 4))
+        self.assertEqual(self.historique.plage(None, 200), (0, 1))
+        self.assertEqual(self.historique.plage(300, None), (3, 4))
+        self.assertEqual(self.historique.plage(0, 50), (0, 0))
+        self.assertEqual(self.historique.plage(500, 600), (4, 4))
+        self.assertEqual(self.historique.plage(300, 100), (3, 3))   # Plage inversée : vide
+        self.assertEqual(HistoriqueValidations().plage(0, 10), (0, 0))
+
+    def test_validations_seules(self):
+        self.assertEqual([e[1] for e in self.historique.entre(200, 301, validations_seules=True)], [4, 3])
+
+    def test_mois_et_annee(self):
+        evenements = [(ts(2025, 12, 31, 23, 59, 59), 0, True), (ts(2026, 1, 1), 1, True),
+                      (ts(2026, 1, 31, 23, 59, 59), 2, True), (ts(2026, 2, 1), 3, True),
+                      (ts(2026, 12, 31, 23, 59, 59), 4, True), (ts(2027, 1, 1), 5, True)]
+        historique = HistoriqueValidations(evenements)
+        self.assertEqual(historique.mois(2026, 1), (1, 3))
+        self.assertEqual(historique.mois(2026, 2), (3, 4))
+        self.assertEqual(historique.mois(2026, 12), (4, 5))   # Passage à l'année suivante
+        self.assertEqual(historique.mois(2026, 6), (4, 4))
+        self.assertEqual(historique.annee(2026), (1, 5))
+
+    def test_derniers_jours(self):
+        maintenant = 10 * UN_JOUR
+        historique = HistoriqueValidations([(maintenant - 7 * UN_JOUR - 1, 0, True),
+                                            (maintenant - 7 * UN_JOUR, 1, True), (maintenant, 2, True)])
+        self.assertEqual(historique.derniers_jours(7, maintenant), (1, 3))
+
+    def test_plages_identiques_a_un_filtre(self):
+        aleatoire = random.Random(9)
+        historique = HistoriqueValidations()
+        evenements = []
+        for k in range(2000):
+            e = (aleatoire.randrange(1000), k, aleatoire.random() < 0.7)
+            historique.ajouter(*e)
+            evenements.append(e)
+        for _ in range(200):
+            debut, fin = sorted(aleatoire.randrange(-10, 1010) for _ in range(2))
+            attendu = sorted((e for e in evenements if debut <= e[0] < fin), key=lambda e: e[0])
+            self.assertEqual(sorted(historique.entre(debut, fin), key=lambda e: e[0]), attendu)
+
+
+class TestConversions(unittest.TestCase):
+    def test_aller_retour_date(self):
+        self.assertEqual(epoch_vers_date(date_vers_epoch("2026-03-04 05:06:07")), "2026-03-04 05:06:07")
+
+    def test_historique_initial(self):
+        objectifs = [{"valide": True, "date_validation": "2026-02-01 10:00:00"},
+                     {"valide": False, "date_validation": "2026-01-01 10:00:00"},
+                     {"valide": True, "date_validation": "2026-01-15 10:00:00"},
+                     {"valide": True, "date_validation": None},
+                     {"valide": True, "date_validation": "hier"}]
+        self.assertEqual(historique_initial(objectifs),
+                         [[date_vers_epoch("2026-01-15 10:00:00"), 2, True],
+                          [date_vers_epoch("2026-02-01 10:00:00"), 0, True]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from src.logic.import_lot import EcrivainJSON
+from src.logic.journal import JournalBingo
+from src.logic.moteur import creer_configuration
+
+
+def configuration(prefixe):
+    objectifs = [{"titre": f"{prefixe} {i}", "poids": 1 + i % 3} for i in range(25)]
+    return creer_configuration(objectifs, {"bronze": "a", "argent": "b", "or": "c", "platine": "d"})
+
+
+class TestEcrivainJSON(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "equipes", "alpha", "bingo_config.json")
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_reimport_remplace_le_journal(self):
+        ecrivain = EcrivainJSON(self.dossier.name)
+        ecrivain.ecrire([("equipes/alpha", configuration("Ancien"))])
+        journal = JournalBingo(self.chemin)
+        journal.charger()
+        journal.enregistrer_lot([{"seq": 1, "ts": 1_767_000_000, "index": 3, "valide": True}])
+
+        ecrivain.ecrire([("equipes/alpha", configuration("Nouveau"))])
+        ecrivain.fermer()
+        self.assertFalse(os.path.exists(journal.chemin_journal))
+        donnees = JournalBingo(self.chemin).charger()
+        self.assertEqual(donnees["objectifs"][3]["titre"], "Nouveau 3")
+        self.assertFalse(any(obj["valide"] for obj in donnees["objectifs"]))
+        self.assertEqual(donnees["historique"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.logic.historique import date_vers_epoch
+from src.logic.journal import ConflitEcriture, JournalBingo, ecrire_json_atomique
+from src.logic.moteur import creer_configuration
+from src.logic.stockage import StockageSQLite, exporter_json, importer_json
+
+
+def configuration():
+    objectifs = [{"titre": f"Objectif {i}", "poids": 1 + i % 3} for i in range(9)]
+    return creer_configuration(objectifs, {"bronze": "a", "argent": "b", "or": "c", "platine": "d"})
+
+
+def evenement(seq, index, valide=True, **extra):
+    ts = 1_767_000_000 + seq
+    return dict({"seq": seq, "ts": ts, "index": index, "valide": valide,
+                 "date_validation": "2026-01-01 10:00:00" if valide else None}, **extra)
+
+
+def etats(donnees):
+    return [obj["valide"] for obj in donnees["objectifs"]]
+
+
+class TestJournalBingo(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "bingo_config.json")
+        ecrire_json_atomique(self.chemin, configuration())
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_rejeu_identique_a_la_compaction(self):
+        journal = JournalBingo(self.chemin, seuil_compaction=1000)
+        journal.charger()
+        lot = [evenement(1, 0), evenement(2, 4), evenement(3, 0, False), evenement(4, 8, historique_seul=True)]
+        journal.enregistrer_lot(lot)
+        rejoue = JournalBingo(self.chemin).charger()
+        self.assertEqual([i for i, valide in enumerate(etats(rejoue)) if valide], [4])
+        self.assertEqual(len(rejoue["historique"]), 4)
+
+        journal = JournalBingo(self.chemin, seuil_compaction=1000)
+        donnees = journal.charger()
+        self.assertEqual(donnees, rejoue)
+        journal.compacter(donnees)
+        self.assertFalse(os.path.exists(journal.chemin_journal))
+        compacte = JournalBingo(self.chemin).charger()
+        self.assertEqual(compacte["revision"], 1)
+        self.assertEqual({k: v for k, v in compacte.items() if k != "revision"},
+                         {k: v for k, v in rejoue.items() if k != "revision"})
+
+    def test_seuil_de_compaction(self):
+        journal = JournalBingo(self.chemin, seuil_compaction=3)
+        journal.charger()
+        journal.enregistrer_lot([evenement(1, 0), evenement(2, 1), evenement(3, 2)])
+        self.assertTrue(journal.doit_compacter())
+        relu = JournalBingo(self.chemin, seuil_compaction=3)
+        donnees = relu.charger()  # Replie le journal au passage
+        self.assertFalse(os.path.exists(relu.chemin_journal))
+        self.assertEqual(relu.nb_evenements, 0)
+        self.assertEqual(etats(donnees)[:3], [True] * 3)
+        self.assertEqual(len(donnees["historique"]), 3)
+
+    def test_derniere_ligne_tronquee_ignoree(self):
+        journal = JournalBingo(self.chemin)
+        journal.charger()
+        journal.enregistrer_lot([evenement(1, 0), evenement(2, 1)])
+        with open(journal.chemin_journal, "a", encoding="utf-8") as f:
+            f.write(json.dumps(evenement(3, 2))[:20])  # Crash au milieu de l'écriture
+        donnees = JournalBingo(self.chemin).charger()
+        self.assertEqual(etats(donnees)[:3], [True, True, False])
+        self.assertEqual(donnees["seq"], 2)
+
+    def test_ajout_apres_ligne_tronquee(self):
+        journal = JournalBingo(self.chemin)
+        journal.charger()
+        journal.enregistrer_lot([evenement(1, 0), evenement(2, 1)])
+        with open(journal.chemin_journal, "a", encoding="utf-8") as f:
+            f.write(json.dumps(evenement(3, 2))[:20])
+        journal = JournalBingo(self.chemin)
+        self.assertEqual(journal.charger()["seq"], 2)
+        journal.enregistrer_lot([evenement(3, 3)])
+        journal.enregistrer_lot([evenement(4, 4)])
+        donnees = JournalBingo(self.chemin).charger()
+        self.assertEqual([i for i, valide in enumerate(etats(donnees)) if valide], [0, 1, 3, 4])
+        self.assertEqual(donnees["seq"], 4)
+        self.assertEqual(len(donnees["historique"]), 4)
+
+    def test_derniere_ligne_complete_sans_retour_gardee(self):
+        journal = JournalBingo(self.chemin)
+        journal.charger()
+        with open(journal.chemin_journal, "a", encoding="utf-8") as f:
+            f.write(json.dumps(evenement(1, 0)))  # Crash juste avant le "\n"
+        journal = JournalBingo(self.chemin)
+        self.assertEqual(journal.charger()["seq"], 1)
+        journal.enregistrer_lot([evenement(2, 1)])
+        donnees = JournalBingo(self.chemin).charger()
+        self.assertEqual(etats(donnees)[:2], [True, True])
+        self.assertEqual(donnees["seq"], 2)
+
+    def test_rejeu_apres_crash_pendant_la_compaction(self):
+        journal = JournalBingo(self.chemin)
+        donnees = journal.charger()
+        lot = [evenement(1, 0), evenement(2, 1)]
+        journal.enregistrer_lot(lot)
+        for e in lot:
+            journal.appliquer(donnees, e)
+        # Snapshot écrit, journal pas encore supprimé : ses seq sont déjà dedans
+        ecrire_json_atomique(self.chemin, donnees)
+        relu = JournalBingo(self.chemin).charger()
+        self.assertEqual(len(relu["historique"]), 2)
+        self.assertEqual(relu["seq"], 2)
+
+    def test_migration_ancienne_config(self):
+        ancienne = configuration()
+        ancienne.pop("historique", None)
+        ancienne["objectifs"][3].update(valide=True, date_validation="2025-03-04 05:06:07")
+        ancienne["objectifs"][5].update(valide=True, date_validation="pas une date")
+        ecrire_json_atomique(self.chemin, ancienne)
+        donnees = JournalBingo(self.chemin).charger()
+        self.assertEqual(donnees["historique"], [[date_vers_epoch("2025-03-04 05:06:07"), 3, True]])
+
+    def test_ecriture_concurrente_detectee(self):
+        journal = JournalBingo(self.chemin)
+        journal.charger()
+        autre = JournalBingo(self.chemin)
+        autre.charger()
+        autre.enregistrer_lot([evenement(1, 0)])
+        self.assertTrue(journal.a_change())
+        with self.assertRaises(ConflitEcriture):
+            journal.enregistrer_lot([evenement(1, 1)])
+        with self.assertRaises(ConflitEcriture):
+            journal.compacter(configuration())
+        journal.charger()
+        self.assertFalse(journal.a_change())
+        journal.enregistrer_lot([evenement(2, 1)])
+
+
+class TestStockageSQLite(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.dossier.name, "bingo.db")
+        self.json = os.path.join(self.dossier.name, "bingo_config.json")
+        ecrire_json_atomique(self.json, configuration())
+        self.stockage = StockageSQLite(self.base)
+        importer_json(self.stockage, self.json)
+        self.stockage.charger()
+
+    def tearDown(self):
+        self.stockage.fermer()
+        self.dossier.cleanup()
+
+    def test_aller_retour_json(self):
+        self.stockage.enregistrer_lot([evenement(1, 0), evenement(2, 6), evenement(3, 2, historique_seul=True)])
+        sortie = os.path.join(self.dossier.name, "export.json")
+        exporter_json(self.stockage, sortie)
+        autre = StockageSQLite(self.base, plateau="copie")
+        importer_json(autre, sortie)
+        self.assertEqual(autre.charger(), self.stockage.charger())
+        autre.fermer()
+        relu = JournalBingo(sortie).charger()
+        self.assertEqual(etats(relu), etats(self.stockage.charger()))
+        self.assertEqual(len(relu["historique"]), 3)
+
+    def test_seq_deja_appliques_ignores(self):
+        self.stockage.enregistrer_lot([evenement(1, 0), evenement(2, 1)])
+        self.stockage.enregistrer_lot([evenement(2, 1), evenement(3, 2)])
+        donnees = self.stockage.charger()
+        self.assertEqual(donnees["seq"], 3)
+        self.assertEqual(len(donnees["historique"]), 3)
+
+    def test_conflit_si_un_autre_processus_bascule(self):
+        autre = StockageSQLite(self.base)
+        autre.charger()
+        autre.enregistrer_lot([evenement(1, 0)])
+        self.assertTrue(self.stockage.a_change())
+        with self.assertRaises(ConflitEcriture):
+            self.stockage.enregistrer_lot([evenement(1, 1)])
+        # Le lot refusé n'a rien écrit
+        self.assertEqual(etats(autre.charger())[:2], [True, False])
+        autre.fermer()
+        self.stockage.charger()
+        self.stockage.enregistrer_lot([evenement(2, 1)])
+        self.assertEqual(etats(self.stockage.charger())[:2], [True, True])
+
+    def test_conflit_si_un_import_recree_le_plateau(self):
+        autre = StockageSQLite(self.base)
+        importer_json(autre, self.json)  # Même seq, nouvel id
+        autre.fermer()
+        self.assertTrue(self.stockage.a_change())
+        with self.assertRaises(ConflitEcriture):
+            self.stockage.enregistrer_lot([evenement(1, 1)])
+        with self.assertRaises(ConflitEcriture):
+            self.stockage.compacter(configuration())
+        self.stockage.compacter(configuration(), forcer=True)
+        self.assertFalse(self.stockage.a_change())
+
+    def test_historique_entre(self):
+        self.stockage.enregistrer_lot([evenement(i, i % 9, i % 2 == 1) for i in range(1, 11)])
+        self.assertEqual([ts for ts, _, _ in self.stockage.historique_entre(1_767_000_003, 1_767_000_006)],
+                         [1_767_000_003, 1_767_000_004, 1_767_000_005])
+        self.assertEqual(len(self.stockage.historique_entre()), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from src.logic.modele_setup import ModeleSetup, lire_poids
+
+
+class TestLirePoids(unittest.TestCase):
+    def test_formats(self):
+        self.assertEqual(lire_poids("2"), 2)
+        self.assertEqual(lire_poids(" ★★★ "), 3)
+        self.assertEqual(lire_poids("**"), 2)
+        self.assertIsNone(lire_poids("2026"))
+        self.assertIsNone(lire_poids("Courir"))
+        self.assertIsNone(lire_poids(""))
+
+
+class TestColler(unittest.TestCase):
+    def test_titre_et_difficulte(self):
+        modele = ModeleSetup()
+        self.assertEqual(modele.coller("Courir\t3\nLire\t★★\nDormir"), 3)
+        self.assertEqual(modele.vers_objectifs()[:3], [
+            {"titre": "Courir", "poids": 3},
+            {"titre": "Lire", "poids": 2},
+            {"titre": "Dormir", "poids": 1},
+        ])
+
+    def test_titre_numerique_reste_un_titre(self):
+        modele = ModeleSetup()
+        self.assertEqual(modele.coller("2\n2026\t2\n42\t★\n★★"), 4)
+        self.assertEqual(modele.vers_objectifs()[:4], [
+            {"titre": "2", "poids": 1},
+            {"titre": "2026", "poids": 2},
+            {"titre": "42", "poids": 1},
+            {"titre": "★★", "poids": 1},
+        ])
+
+    def test_seule_la_deuxieme_colonne_est_une_difficulte(self):
+        modele = ModeleSetup()
+        modele.coller("Courir\tnote\t3")
+        self.assertEqual(modele.vers_objectifs()[0], {"titre": "Courir", "poids": 1})
+
+    def test_lignes_vides_ignorees_et_grille_agrandie(self):
+        modele = ModeleSetup()
+        texte = "\n".join(f"Objectif {i}" if i % 10 else "" for i in range(1, 41))
+        self.assertEqual(modele.coller(texte, debut=10), 36)
+        self.assertEqual(modele.taille, 7)
+        self.assertEqual(modele.titres[10], "Objectif 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
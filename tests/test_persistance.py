@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.logic import persistance
+from src.logic.moteur import creer_configuration
+from src.logic.persistance import ServicePersistance
+from src.logic.stockage import StockageSQLite
+
+
+def configuration():
+    objectifs = [{"titre": f"Objectif {i}", "poids": 1 + i % 3} for i in range(9)]
+    return creer_configuration(objectifs, {"bronze": "a", "argent": "b", "or": "c", "platine": "d"})
+
+
+class TestServicePersistanceSQLite(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "bingoal.db")
+        self.stockage = StockageSQLite(self.chemin)
+        self.stockage.compacter(configuration(), forcer=True)
+        self.donnees = self.stockage.charger()
+        # Pas d'attente de 5 s sur le verrou : l'échec doit arriver vite
+        self.stockage.connexion.execute("PRAGMA busy_timeout = 50")
+        self.ancien_delai = persistance.DELAI_REESSAI
+        persistance.DELAI_REESSAI = 0.05
+
+    def tearDown(self):
+        persistance.DELAI_REESSAI = self.ancien_delai
+        self.stockage.fermer()
+        self.dossier.cleanup()
+
+    def test_ecriture_reprise_apres_verrou(self):
+        service = ServicePersistance(self.stockage, self.donnees, delai=0)
+        autre = sqlite3.connect(self.chemin, timeout=0)
+        autre.execute("BEGIN IMMEDIATE")  # Un autre processus tient le verrou d'écriture
+        try:
+            service.soumettre({"seq": 1, "ts": 1_700_000_000, "index": 4, "valide": True,
+                               "date_validation": "2023-11-14 22:13:20"})
+            self.assertFalse(service.vider(timeout=2))
+            self.assertIsNotNone(service.metriques()["erreur"])
+            self.assertTrue(service._thread.is_alive())
+        finally:
+            autre.rollback()
+            autre.close()
+
+        self.assertTrue(service.vider(timeout=2))
+        self.assertIsNone(service.metriques()["erreur"])
+        # Un clic après l'incident est écrit normalement
+        service.soumettre({"seq": 2, "ts": 1_700_000_005, "index": 5, "valide": True,
+                           "date_validation": "2023-11-14 22:13:25"})
+        service.arreter()
+
+        lecteur = StockageSQLite(self.chemin)
+        relu = lecteur.charger()
+        lecteur.fermer()
+        self.assertTrue(relu["objectifs"][4]["valide"])
+        self.assertTrue(relu["objectifs"][5]["valide"])
+        self.assertEqual(relu["historique"][-2:], [[1_700_000_000, 4, True], [1_700_000_005, 5, True]])
+        self.assertEqual(relu["seq"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from src.logic.score import PALIERS_DEFAUT, ModeleScore
+
+
+def objectifs(poids, valides=()):
+    return [{"poids": p, "valide": i in valides} for i, p in enumerate(poids)]
+
+
+class TestModeleScore(unittest.TestCase):
+    def test_etat_initial(self):
+        score = ModeleScore(objectifs([1, 1, 2], valides={2}))
+        self.assertEqual((score.poids_valide, score.poids_total), (2, 4))
+        self.assertEqual(score.palier_courant(), "argent")
+        self.assertEqual(score.rang, 2)
+        self.assertEqual(ModeleScore([]).ratio, 0)
+        self.assertIsNone(ModeleScore([]).palier_courant())
+
+    def test_franchissements_de_paliers(self):
+        score = ModeleScore(objectifs([1] * 4))
+        attendus = [(0, 1), (1, 2), (2, 3), (3, 4)]
+        for index, rangs in enumerate(attendus):
+            self.assertEqual(score.basculer(1, True), rangs)
+            self.assertEqual(score.paliers_modifies(*rangs), [score.noms[index]])
+        self.assertEqual(score.palier_courant(), "platine")
+        # Redescente : un seuil atteint pile (1/4 = 0.25) compte comme atteint
+        self.assertEqual(score.basculer(1, False), (4, 3))
+        self.assertEqual(score.basculer(1, False), (3, 2))
+        self.assertEqual(score.basculer(1, False), (2, 1))
+        self.assertTrue(score.est_atteint("bronze"))
+        self.assertFalse(score.est_atteint("argent"))
+
+    def test_plusieurs_paliers_franchis_d_un_coup(self):
+        score = ModeleScore(objectifs([1, 3]))
+        self.assertEqual(score.basculer(3, True), (0, 3))
+        self.assertEqual(score.paliers_modifies(0, 3), ["bronze", "argent", "or"])
+        self.assertEqual(score.basculer(3, False), (3, 0))
+        self.assertEqual(score.paliers_modifies(3, 0), ["bronze", "argent", "or"])
+
+    def test_bascule_sans_franchissement(self):
+        score = ModeleScore(objectifs([1] * 10))
+        score.basculer(1, True)
+        self.assertEqual(score.basculer(1, True), (0, 0))
+        self.assertEqual(score.paliers_modifies(0, 0), [])
+
+    def test_paliers_personnalises(self):
+        paliers = {"fin": 0.9, "debut": 0.1, "milieu": 0.5}
+        score = ModeleScore(objectifs([1] * 10), paliers)
+        self.assertEqual(score.noms, ["debut", "milieu", "fin"])
+        self.assertEqual(score.basculer(1, True), (0, 1))
+        for _ in range(8):
+            score.basculer(1, True)
+        self.assertEqual(score.palier_courant(), "fin")
+        self.assertEqual(ModeleScore(objectifs([1]), {}).noms, list(PALIERS_DEFAUT))
+
+    def test_changement_de_poids(self):
+        score = ModeleScore(objectifs([1, 1, 2], valides={0}))
+        score.changer_poids(1, 3, True)
+        self.assertEqual((score.poids_valide, score.poids_total), (3, 6))
+        score.changer_poids(2, 1, False)
+        self.assertEqual((score.poids_valide, score.poids_total), (3, 5))
+
+    def test_incremental_identique_au_recalcul(self):
+        aleatoire = random.Random(5)
+        liste = objectifs([aleatoire.choice((1, 2, 3)) for _ in range(49)])
+        score = ModeleScore(liste)
+        for _ in range(500):
+            obj = aleatoire.choice(liste)
+            obj["valide"] = not obj["valide"]
+            score.basculer(obj["poids"], obj["valide"])
+            recalcul = ModeleScore(liste)
+            self.assertEqual((score.poids_valide, score.rang), (recalcul.poids_valide, recalcul.rang))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.logic.board_store import BoardStore
+from src.logic.serveur_synchro import creer_serveur
+from src.logic.synchro import ClientSynchro, ErreurSynchro, decoder, encoder
+
+
+class Horloge:
+    """time.time() contrôlé : les tests avancent les secondes au lieu d'attendre."""
+    def __init__(self, t=1_767_000_000):
+        self.t = t
+
+    def __call__(self):
+        return self.t + 0.5
+
+    def avancer(self, secondes=1):
+        self.t += secondes
+
+
+def configuration():
+    return {
+        "objectifs": [{"titre": f"Objectif {i}", "poids": 1 + i % 3, "valide": False, "date_validation": None}
+                      for i in range(9)],
+        "recompenses": {"bronze": "a", "argent": "b", "or": "c", "platine": "d"},
+        "historique": [],
+    }
+
+
+def etats(store):
+    return [obj["valide"] for obj in store.objectifs]
+
+
+class TestSynchro(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.serveur = creer_serveur(self.chemin("serveur.db"), port=0)
+        threading.Thread(target=self.serveur.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:%d" % self.serveur.server_address[1]
+
+        self.horloge = Horloge()
+        for module in ("src.logic.synchro", "src.logic.board_store"):
+            patch = mock.patch(f"{module}.time.time", self.horloge)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.a = BoardStore(self.chemin("a.json"), asynchrone=False)
+        self.a.remplacer(configuration())
+        self.b = BoardStore(self.chemin("b.db"), asynchrone=False)  # Pas encore de plateau
+
+    def tearDown(self):
+        self.a.fermer()
+        self.b.fermer()
+        self.serveur.shutdown()
+        self.serveur.server_close()
+        self.dossier.cleanup()
+
+    def chemin(self, nom):
+        return os.path.join(self.dossier.name, nom)
+
+    def synchroniser(self, store, **options):
+        self.horloge.avancer()  # La seconde en cours n'est envoyée qu'à la synchro suivante
+        return ClientSynchro(store, self.url).synchroniser(**options)
+
+    def test_convergence_json_sqlite(self):
+        for index in (1, 2, 3):
+            self.a.basculer(index)
+        self.assertEqual(self.synchroniser(self.a)["envoyes"], 3)
+        rapport = self.synchroniser(self.b)  # Adopte la grille du serveur, puis reçoit les bascules
+        self.assertEqual(rapport["recus"], 3)
+        self.assertEqual(etats(self.a), etats(self.b))
+
+        # Modifications concurrentes : la plus récente l'emporte, case par case
+        self.horloge.avancer()
+        self.a.basculer(2)
+        self.b.basculer(7)
+        self.horloge.avancer()
+        self.b.basculer(3)
+        self.synchroniser(self.a)
+        self.synchroniser(self.b)
+        self.synchroniser(self.a)
+        self.assertEqual(etats(self.a), etats(self.b))
+        self.assertEqual([i for i, v in enumerate(etats(self.a)) if v], [1, 7])
+        self.assertEqual(self.a.score.poids_valide, self.b.score.poids_valide)
+        self.assertEqual(len(self.a.historique), len(self.b.historique))
+
+        # Et sur disque
+        for chemin in (self.chemin("a.json"), self.chemin("b.db")):
+            relu = BoardStore(chemin, asynchrone=False)
+            self.assertEqual(etats(relu), etats(self.a))
+            relu.fermer()
+
+    def test_bascules_recues_non_renvoyees(self):
+        for index in (1, 2):
+            self.a.basculer(index)
+        self.synchroniser(self.a)
+        self.synchroniser(self.b)
+        self.b.basculer(5)
+        self.assertEqual(self.synchroniser(self.b)["envoyes"], 1)
+        self.assertEqual(self.synchroniser(self.a)["envoyes"], 0)
+        self.assertEqual(self.synchroniser(self.b)["envoyes"], 0)
+
+    def test_horloge_en_avance_non_renvoyee(self):
+        self.synchroniser(self.a)
+        self.synchroniser(self.b)
+        # Bascule datée dans le futur (horloge de A en avance) : reçue par B avant "sa" seconde
+        self.horloge.avancer(100)
+        self.a.basculer(4)
+        self.synchroniser(self.a)
+        self.horloge.avancer(-99)
+        self.assertEqual(self.synchroniser(self.b)["recus"], 1)
+        self.horloge.avancer(200)
+        self.assertEqual(self.synchroniser(self.b)["envoyes"], 0)
+        self.assertTrue(etats(self.b)[4])
+
+    def test_fusion_notifiee_comme_externe(self):
+        self.a.basculer(0)
+        self.synchroniser(self.a)
+        vus = []
+        self.synchroniser(self.b)
+        self.a.basculer(1)
+        self.synchroniser(self.a)
+        self.b.abonner(lambda evenement, index: vus.append((evenement, index, self.b.externe)))
+        self.synchroniser(self.b)
+        self.b.basculer(2)
+        self.assertEqual(vus, [("bascule", 1, True), ("historique", None, True), ("bascule", 2, False)])
+
+    def test_grille_differente(self):
+        self.synchroniser(self.a)
+        autre = configuration()
+        autre["objectifs"] = autre["objectifs"][:4]
+        self.b.remplacer(autre)
+        with self.assertRaises(ErreurSynchro) as erreur:
+            self.synchroniser(self.b)
+        self.assertEqual(erreur.exception.code, "grille_differente")
+        self.synchroniser(self.b, adopter=True)
+        self.assertEqual(len(self.b.objectifs), 9)
+
+
+class TestFusion(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.store = BoardStore(os.path.join(self.dossier.name, "bingo_config.json"), asynchrone=False)
+        self.store.remplacer(configuration())
+
+    def tearDown(self):
+        self.store.fermer()
+        self.dossier.cleanup()
+
+    def test_plus_recente_gagne_et_doublons_ignores(self):
+        with mock.patch("src.logic.board_store.time.time", return_value=1_767_000_100):
+            self.store.basculer(0)
+        # Plus ancienne que la bascule locale : historisée seulement
+        self.assertEqual(self.store.fusionner([[1_767_000_000, 0, 0], [1_767_000_050, 3, 1]]), 1)
+        self.assertEqual(self.store.fusionner([[1_767_000_050, 3, 1]]), 0)
+        self.assertTrue(etats(self.store)[0])
+        self.assertTrue(etats(self.store)[3])
+        self.assertEqual(len(self.store.historique), 3)
+        # Même seconde, face à une bascule locale : "validé" l'emporte
+        self.assertEqual(self.store.fusionner([[1_767_000_100, 0, 0]]), 0)
+        self.assertTrue(etats(self.store)[0])
+
+        relu = BoardStore(self.store.config_path, asynchrone=False)
+        self.assertEqual(etats(relu), etats(self.store))
+        self.assertEqual(sorted(map(tuple, relu.donnees["historique"])),
+                         sorted(map(tuple, self.store.donnees["historique"])))
+
+    def test_fusion_sans_bascule_notifie_l_historique(self):
+        with mock.patch("src.logic.board_store.time.time", return_value=1_767_000_100):
+            self.store.basculer(0)
+        vus = []
+        self.store.abonner(lambda evenement, index: vus.append((evenement, index)))
+        # Perdante face à la bascule locale : rien ne bascule mais le recap doit la voir
+        self.assertEqual(self.store.fusionner([[1_767_000_000, 0, 0]]), 0)
+        self.assertEqual(vus, [("historique", None)])
+        self.assertEqual(len(self.store.historique), 2)
+        self.assertEqual(self.store.fusionner([[1_767_000_000, 0, 0]]), 0)
+        self.assertEqual(vus, [("historique", None)])
+
+    def test_encodage_compresse_au_dela_du_seuil(self):
+        petit, entetes = encoder({"evenements": []})
+        self.assertNotIn("Content-Encoding", entetes)
+        gros = {"evenements": [[1_767_000_000 + i, i % 9, 1] for i in range(500)]}
+        corps, entetes = encoder(gros)
+        self.assertEqual(entetes["Content-Encoding"], "gzip")
+        self.assertEqual(decoder(corps, "gzip"), gros)
+        self.assertEqual(decoder(petit), {"evenements": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
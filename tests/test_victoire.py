@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from src.logic.victoire import DetecteurVictoire, est_ligne, motifs_standards
+
+
+def objectifs(nb, valides=()):
+    return [{"valide": i in valides} for i in range(nb)]
+
+
+def completes_recalcules(taille, etats, motifs_perso=None):
+    """Motifs complets d'après un détecteur reconstruit depuis l'état courant."""
+    return DetecteurVictoire(taille, [{"valide": v} for v in etats], motifs_perso).completes
+
+
+class TestMotifs(unittest.TestCase):
+    def test_motifs_standards(self):
+        motifs = motifs_standards(3, 9)
+        self.assertEqual(motifs["ligne 2"], [3, 4, 5])
+        self.assertEqual(motifs["colonne 3"], [2, 5, 8])
+        self.assertEqual(motifs["diagonale"], [0, 4, 8])
+        self.assertEqual(motifs["anti-diagonale"], [2, 4, 6])
+        self.assertEqual(motifs["X"], [0, 2, 4, 6, 8])
+        self.assertEqual(sorted(motifs["coins"]), [0, 2, 6, 8])
+        self.assertEqual(sum(est_ligne(nom) for nom in motifs), 8)
+
+    def test_derniere_ligne_incomplete(self):
+        motifs = motifs_standards(3, 7)
+        self.assertEqual(motifs["ligne 3"], [6])
+        self.assertEqual(motifs["colonne 2"], [1, 4])
+        self.assertEqual(motifs["carton plein"], list(range(7)))
+
+
+class TestDetecteurVictoire(unittest.TestCase):
+    def setUp(self):
+        self.detecteur = DetecteurVictoire(3, objectifs(9))
+        self.evenements = []
+        self.detecteur.abonner(lambda evenement, nom: self.evenements.append((evenement, nom)))
+
+    def valider(self, *indices):
+        for i in indices:
+            self.detecteur.basculer(i, True)
+
+    def test_ligne_colonne_diagonale(self):
+        self.valider(0, 1)
+        self.assertEqual(self.evenements, [])
+        self.assertEqual(self.detecteur.basculer(2, True), [("complete", "ligne 1")])
+        self.valider(3)
+        self.assertEqual(self.detecteur.basculer(6, True), [("complete", "colonne 1")])
+        self.assertEqual(self.detecteur.basculer(4, True), [("complete", "anti-diagonale")])
+        self.assertEqual(sorted(self.detecteur.basculer(8, True)),
+                         [("complete", "X"), ("complete", "coins"), ("complete", "diagonale")])
+        self.assertEqual(self.detecteur.lignes_completes, 4)
+        # Les abonnés reçoivent les mêmes événements, dans le même ordre
+        self.assertEqual([nom for _, nom in self.evenements][:3], ["ligne 1", "colonne 1", "anti-diagonale"])
+        self.assertEqual(len(self.evenements), 6)
+
+    def test_annulation_rompt_les_motifs(self):
+        self.valider(0, 1, 2, 4, 8)
+        self.assertEqual(self.detecteur.completes, {"ligne 1", "diagonale"})
+        rompus = self.detecteur.basculer(0, False)
+        self.assertEqual(sorted(rompus), [("rompu", "diagonale"), ("rompu", "ligne 1")])
+        self.assertEqual(self.detecteur.completes, set())
+        self.assertEqual(self.detecteur.lignes_completes, 0)
+        # Décocher une case déjà décochée ne rompt rien
+        self.assertEqual(self.detecteur.basculer(0, False), [])
+        self.assertEqual(self.detecteur.basculer(0, True), [("complete", "ligne 1"), ("complete", "diagonale")])
+
+    def test_x_et_carton_plein(self):
+        self.valider(0, 2, 4, 6)
+        self.assertIn(("complete", "X"), self.detecteur.basculer(8, True))
+        self.valider(1, 3, 5)
+        self.assertIn(("complete", "carton plein"), self.detecteur.basculer(7, True))
+        self.assertEqual(self.detecteur.lignes_completes, 8)
+        self.assertIn(("rompu", "carton plein"), self.detecteur.basculer(7, False))
+
+    def test_motifs_perso(self):
+        detecteur = DetecteurVictoire(3, objectifs(9, valides={1}), {"croix": [1, 3, 4, 5, 7], "hors grille": [42]})
+        self.assertNotIn("hors grille", detecteur.masques)
+        for i in (3, 4, 5):
+            detecteur.basculer(i, True)
+        self.assertEqual(detecteur.basculer(7, True), [("complete", "colonne 2"), ("complete", "croix")])
+        self.assertEqual(detecteur.lignes_completes, 2)
+
+    def test_etat_initial(self):
+        detecteur = DetecteurVictoire(3, objectifs(9, valides={2, 4, 6, 0, 1}))
+        self.assertEqual(detecteur.completes, {"ligne 1", "anti-diagonale"})
+        self.assertEqual(detecteur.lignes_completes, 2)
+
+    def test_incremental_identique_au_recalcul(self):
+        aleatoire = random.Random(11)
+        taille = 6
+        etats = [False] * 36
+        detecteur = DetecteurVictoire(taille, objectifs(36))
+        for _ in range(2000):
+            i = aleatoire.randrange(36)
+            etats[i] = not etats[i]
+            detecteur.basculer(i, etats[i])
+            self.assertEqual(detecteur.completes, completes_recalcules(taille, etats))
+        self.assertEqual(detecteur.lignes_completes, sum(est_ligne(nom) for nom in detecteur.completes))
+
+
+if __name__ == "__main__":
+    unittest.main()